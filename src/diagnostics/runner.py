@@ -278,7 +278,11 @@ class DiagnosticRunner:
         start = time.perf_counter()
 
         key_ports = [80, 23, 443, 8080, 10000, 10001, 4998]
-        port_results = self._connectivity.scan_ports(ip, key_ports)
+        port_results = self._connectivity.scan_ports(
+            ip, key_ports,
+            max_workers=self.config.port_scan_concurrency,
+            timeout=self.config.port_scan_timeout
+        )
 
         duration = (time.perf_counter() - start) * 1000
 
@@ -21,6 +21,7 @@ from ..utils import setup_logging, get_logger, Config, get_log_buffer
 from ..network import NetworkDiscovery, ConnectivityTester, DNSTester, HostnameTester, CommandTester
 from ..network.discovery import DiscoveredDevice
 from .components import LogViewer
+from .fonts import clear_font_cache, get_font
 
 logger = get_logger(__name__)
 
@@ -139,14 +140,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             logo_row,
             text="SONANCE",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=24, weight="bold"),
+            font=get_font(24, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['accent']
         ).pack(side="left")
 
         ctk.CTkLabel(
             logo_frame,
             text="MK3 Diagnostics",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack()
 
@@ -165,7 +166,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 self.sidebar,
                 text=f"  {label}",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+                font=get_font(14, family=self.FONT_FAMILY),
                 fg_color="transparent",
                 hover_color=self.COLORS['sidebar_hover'],
                 anchor="w",
@@ -189,14 +190,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self.stats_frame,
             text="Quick Stats",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12, weight="bold"),
+            font=get_font(12, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(anchor="w")
 
         self.stat_devices = ctk.CTkLabel(
             self.stats_frame,
             text="Devices found: 0",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         )
         self.stat_devices.pack(anchor="w", pady=(5, 0))
@@ -204,7 +205,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.stat_selected = ctk.CTkLabel(
             self.stats_frame,
             text="Selected: 0",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         )
         self.stat_selected.pack(anchor="w")
@@ -217,7 +218,7 @@ class MK3DiagnosticApp(ctk.CTk):
         about_btn = ctk.CTkButton(
             bottom_frame,
             text="ℹ️  About",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['sidebar_hover'],
             anchor="w",
@@ -231,7 +232,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             bottom_frame,
             text=f"v{__version__}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=11),
+            font=get_font(11, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack()
 
@@ -277,7 +278,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Network Discovery",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=28, weight="bold"),
+            font=get_font(28, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         ).pack(side="left")
 
@@ -288,7 +289,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             hostname_frame,
             text="Hostname:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(side="left", padx=(0, 8))
 
@@ -297,7 +298,7 @@ class MK3DiagnosticApp(ctk.CTk):
             placeholder_text="(auto-detected)",
             width=180,
             height=32,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color=self.COLORS['card_bg'],
             border_width=1,
             border_color=self.COLORS['sidebar_hover']
@@ -320,7 +321,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             controls,
             text="IP Range:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary'],
             anchor="e"
         ).grid(row=0, column=0, sticky="e", padx=(20, 10), pady=(20, 8))
@@ -330,14 +331,14 @@ class MK3DiagnosticApp(ctk.CTk):
             placeholder_text="Start IP",
             width=160,
             height=38,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14)
+            font=get_font(14, family=self.FONT_FAMILY)
         )
         self.ip_start_entry.grid(row=0, column=1, padx=5, pady=(20, 8))
 
         ctk.CTkLabel(
             controls,
             text="to",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).grid(row=0, column=2, padx=8, pady=(20, 8))
 
@@ -346,7 +347,7 @@ class MK3DiagnosticApp(ctk.CTk):
             placeholder_text="End IP",
             width=160,
             height=38,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14)
+            font=get_font(14, family=self.FONT_FAMILY)
         )
         self.ip_end_entry.grid(row=0, column=3, padx=5, pady=(20, 8))
 
@@ -357,7 +358,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.scan_btn = ctk.CTkButton(
             btn_frame,
             text="▶  Start Scan",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             height=38,
@@ -369,7 +370,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.auto_detect_btn = ctk.CTkButton(
             btn_frame,
             text="Auto-Detect",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['sidebar_hover'],
             border_width=1,
@@ -384,7 +385,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             controls,
             text="Add IP:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary'],
             anchor="e"
         ).grid(row=1, column=0, sticky="e", padx=(20, 10), pady=8)
@@ -397,14 +398,14 @@ class MK3DiagnosticApp(ctk.CTk):
             placeholder_text="e.g., 192.168.1.100",
             width=200,
             height=38,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14)
+            font=get_font(14, family=self.FONT_FAMILY)
         )
         self.manual_ip_entry.pack(side="left", padx=(0, 10))
 
         self.add_ip_btn = ctk.CTkButton(
             add_ip_frame,
             text="+ Add",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['success'],
             hover_color="#219a52",
             width=80,
@@ -430,7 +431,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.scan_progress = ctk.CTkLabel(
             progress_frame,
             text="Ready to scan",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary'],
             anchor="w"
         )
@@ -448,7 +449,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.action_label = ctk.CTkLabel(
             action_inner,
             text="0 devices selected",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold", self.FONT_FAMILY),
             text_color="white"
         )
         self.action_label.pack(side="left")
@@ -457,7 +458,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.run_diag_btn = ctk.CTkButton(
             action_inner,
             text="Run Full Diagnostics",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color="white",
             text_color=self.COLORS['accent'],
             hover_color="#f0f0f0",
@@ -469,7 +470,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.run_tests_menu = ctk.CTkOptionMenu(
             action_inner,
             values=["Run Individual Test...", "Ping Test", "Port Scan", "HTTP Test", "Hostname Test", "DNS Test", "Command Test"],
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color="white",
             text_color=self.COLORS['sidebar_bg'],
             button_color="#e0e0e0",
@@ -484,7 +485,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.select_all_btn = ctk.CTkButton(
             action_inner,
             text="Select All",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color="transparent",
             text_color="white",
             hover_color="#ff8080",
@@ -503,13 +504,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self.list_header_frame,
             text="Discovered Devices",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18, weight="bold")
+            font=get_font(18, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         self.device_count_label = ctk.CTkLabel(
             self.list_header_frame,
             text="0 devices",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         )
         self.device_count_label.pack(side="right")
@@ -535,14 +536,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self.empty_placeholder,
             text="No devices discovered yet",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18),
+            font=get_font(18, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack()
 
         ctk.CTkLabel(
             self.empty_placeholder,
             text="Click 'Start Scan' to find MK3 amplifiers on your network,\nor manually add an IP address above.",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(pady=(10, 0))
 
@@ -555,7 +556,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self._spinner_label = ctk.CTkLabel(
             self._scanning_placeholder,
             text="◐",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=48),
+            font=get_font(48, family=self.FONT_FAMILY),
             text_color=self.COLORS['accent']
         )
         self._spinner_label.pack()
@@ -563,14 +564,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self._scanning_placeholder,
             text="Scanning network...",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18),
+            font=get_font(18, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(pady=(15, 0))
 
         self._scanning_text_label = ctk.CTkLabel(
             self._scanning_placeholder,
             text="Looking for devices on your network",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         )
         self._scanning_text_label.pack(pady=(5, 0))
@@ -607,7 +608,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Diagnostic Results",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=28, weight="bold"),
+            font=get_font(28, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         ).pack(side="left")
 
@@ -615,7 +616,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.clear_results_btn = ctk.CTkButton(
             header,
             text="Clear All Results",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['card_bg'],
             border_width=1,
@@ -629,7 +630,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.export_btn = ctk.CTkButton(
             header,
             text="Export All",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color=self.COLORS['success'],
             hover_color="#219a52",
             height=35,
@@ -648,7 +649,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.results_placeholder = ctk.CTkLabel(
             self.results_container,
             text="No diagnostic results yet.\nSelect devices in Discovery and run diagnostics.",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16),
+            font=get_font(16, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary'],
             justify="center"
         )
@@ -667,13 +668,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Quick Tests",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=28, weight="bold")
+            font=get_font(28, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         ctk.CTkLabel(
             header,
             text="Run individual diagnostic tests on a single IP address",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(side="right")
 
@@ -687,14 +688,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             target_inner,
             text="Target IP:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold")
+            font=get_font(14, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         self.quick_test_ip_entry = ctk.CTkEntry(
             target_inner,
             width=200,
             height=38,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             placeholder_text="e.g., 10.179.3.91"
         )
         self.quick_test_ip_entry.pack(side="left", padx=(15, 20))
@@ -703,7 +704,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.quick_test_status = ctk.CTkLabel(
             target_inner,
             text="Enter an IP address to begin testing",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         )
         self.quick_test_status.pack(side="left", padx=10)
@@ -712,7 +713,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.run_all_tests_btn = ctk.CTkButton(
             target_inner,
             text="Run All Tests",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             height=38,
@@ -725,7 +726,7 @@ class MK3DiagnosticApp(ctk.CTk):
         tests_label = ctk.CTkLabel(
             view,
             text="Available Tests",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18, weight="bold")
+            font=get_font(18, "bold", self.FONT_FAMILY)
         )
         tests_label.pack(anchor="w", padx=30, pady=(10, 15))
 
@@ -768,7 +769,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 name_row,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=15, weight="bold"),
+                font=get_font(15, "bold", self.FONT_FAMILY),
                 text_color=self.COLORS['text_primary']
             ).pack(side="left")
 
@@ -776,7 +777,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 btn_inner,
                 text=desc,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary'],
                 justify="left"
             ).pack(anchor="w", pady=(8, 12))
@@ -785,7 +786,7 @@ class MK3DiagnosticApp(ctk.CTk):
             run_btn = ctk.CTkButton(
                 btn_inner,
                 text="Run Test",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12, weight="bold"),
+                font=get_font(12, "bold", self.FONT_FAMILY),
                 fg_color=color,
                 hover_color=color,
                 height=32,
@@ -798,7 +799,7 @@ class MK3DiagnosticApp(ctk.CTk):
         cmd_label = ctk.CTkLabel(
             view,
             text="Send Commands",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18, weight="bold")
+            font=get_font(18, "bold", self.FONT_FAMILY)
         )
         cmd_label.pack(anchor="w", padx=30, pady=(10, 10))
 
@@ -812,14 +813,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             cmd_inner,
             text="Port:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13)
+            font=get_font(13, family=self.FONT_FAMILY)
         ).pack(side="left")
 
         self.cmd_port_entry = ctk.CTkEntry(
             cmd_inner,
             width=80,
             height=36,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13)
+            font=get_font(13, family=self.FONT_FAMILY)
         )
         self.cmd_port_entry.pack(side="left", padx=(10, 5))
         self.cmd_port_entry.insert(0, "23")
@@ -831,7 +832,7 @@ class MK3DiagnosticApp(ctk.CTk):
             command=self._on_port_preset_select,
             width=120,
             height=36,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12)
+            font=get_font(12, family=self.FONT_FAMILY)
         )
         self.port_presets.set("Presets")
         self.port_presets.pack(side="left", padx=(5, 20))
@@ -840,14 +841,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             cmd_inner,
             text="Command:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13)
+            font=get_font(13, family=self.FONT_FAMILY)
         ).pack(side="left")
 
         self.command_entry = ctk.CTkEntry(
             cmd_inner,
             width=300,
             height=36,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             placeholder_text="Enter command to send"
         )
         self.command_entry.pack(side="left", padx=(10, 15))
@@ -857,7 +858,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.send_cmd_btn = ctk.CTkButton(
             cmd_inner,
             text="Send",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             height=36,
@@ -870,7 +871,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.burst_btn = ctk.CTkButton(
             cmd_inner,
             text="Burst (10x)",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color=self.COLORS['warning'],
             hover_color="#e67e22",
             height=36,
@@ -886,13 +887,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             results_header,
             text="Results Log",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18, weight="bold")
+            font=get_font(18, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         self.clear_quick_results_btn = ctk.CTkButton(
             results_header,
             text="Clear",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['card_bg'],
             border_width=1,
@@ -906,7 +907,7 @@ class MK3DiagnosticApp(ctk.CTk):
         # Results log
         self.quick_test_log = ctk.CTkTextbox(
             view,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=get_font(12, family="Consolas"),
             fg_color=self.COLORS['card_bg'],
             corner_radius=12
         )
@@ -940,13 +941,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="MK3 Control Panel",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=28, weight="bold")
+            font=get_font(28, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         ctk.CTkLabel(
             header,
             text="Send commands to MK3 DSP amplifiers via port 52000",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(side="right")
 
@@ -960,14 +961,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             target_inner,
             text="Target IP:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold")
+            font=get_font(14, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         self.control_ip_entry = ctk.CTkEntry(
             target_inner,
             width=180,
             height=36,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             placeholder_text="e.g., 10.179.3.91"
         )
         self.control_ip_entry.pack(side="left", padx=(10, 25))
@@ -975,7 +976,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             target_inner,
             text="Model:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold")
+            font=get_font(14, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         self.model_selector = ctk.CTkOptionMenu(
@@ -983,7 +984,7 @@ class MK3DiagnosticApp(ctk.CTk):
             values=["DSP8-130 (8 groups)", "DSP2-150 (2 groups)", "DSP2-750 (2 groups)"],
             width=180,
             height=36,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             command=self._on_model_change
         )
         self.model_selector.set("DSP8-130 (8 groups)")
@@ -993,7 +994,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.control_status = ctk.CTkLabel(
             target_inner,
             text="Not connected",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         )
         self.control_status.pack(side="right")
@@ -1008,7 +1009,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             power_header,
             text="Power Controls",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         power_btns = ctk.CTkFrame(power_frame, fg_color="transparent")
@@ -1025,7 +1026,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 power_btns,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+                font=get_font(13, "bold", self.FONT_FAMILY),
                 fg_color=color,
                 hover_color=color,
                 height=36,
@@ -1044,7 +1045,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             global_header,
             text="Global Controls (All Groups)",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         # Volume row
@@ -1054,7 +1055,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             vol_row,
             text="Volume:",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             width=70
         ).pack(side="left")
 
@@ -1069,7 +1070,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 vol_row,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 fg_color=self.COLORS['accent'],
                 hover_color=self.COLORS['accent_hover'],
                 height=32,
@@ -1079,7 +1080,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn.pack(side="left", padx=(0, 5))
 
         # Direct volume slider
-        ctk.CTkLabel(vol_row, text="Direct:", font=ctk.CTkFont(family=self.FONT_FAMILY, size=12)).pack(side="left", padx=(15, 5))
+        ctk.CTkLabel(vol_row, text="Direct:", font=get_font(12, family=self.FONT_FAMILY)).pack(side="left", padx=(15, 5))
 
         self.global_vol_slider = ctk.CTkSlider(
             vol_row,
@@ -1092,13 +1093,13 @@ class MK3DiagnosticApp(ctk.CTk):
         self.global_vol_slider.set(-30)
         self.global_vol_slider.pack(side="left", padx=(0, 5))
 
-        self.global_vol_label = ctk.CTkLabel(vol_row, text="-30 dB", font=ctk.CTkFont(family=self.FONT_FAMILY, size=12), width=50)
+        self.global_vol_label = ctk.CTkLabel(vol_row, text="-30 dB", font=get_font(12, family=self.FONT_FAMILY), width=50)
         self.global_vol_label.pack(side="left")
 
         ctk.CTkButton(
             vol_row,
             text="Set",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12, weight="bold"),
+            font=get_font(12, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['success'],
             height=32,
             width=50,
@@ -1109,7 +1110,7 @@ class MK3DiagnosticApp(ctk.CTk):
         mute_row = ctk.CTkFrame(global_frame, fg_color="transparent")
         mute_row.pack(fill="x", padx=20, pady=(0, 10))
 
-        ctk.CTkLabel(mute_row, text="Mute:", font=ctk.CTkFont(family=self.FONT_FAMILY, size=13), width=70).pack(side="left")
+        ctk.CTkLabel(mute_row, text="Mute:", font=get_font(13, family=self.FONT_FAMILY), width=70).pack(side="left")
 
         mute_btns = [
             ("Mute ON", MK3Command.MUTE_ON, self.COLORS['error']),
@@ -1121,7 +1122,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 mute_row,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 fg_color=color,
                 hover_color=color,
                 height=32,
@@ -1134,7 +1135,7 @@ class MK3DiagnosticApp(ctk.CTk):
         source_row = ctk.CTkFrame(global_frame, fg_color="transparent")
         source_row.pack(fill="x", padx=20, pady=(0, 15))
 
-        ctk.CTkLabel(source_row, text="Source:", font=ctk.CTkFont(family=self.FONT_FAMILY, size=13), width=70).pack(side="left")
+        ctk.CTkLabel(source_row, text="Source:", font=get_font(13, family=self.FONT_FAMILY), width=70).pack(side="left")
 
         source_btns = [
             ("Input 1", MK3Command.INPUT_1),
@@ -1147,7 +1148,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 source_row,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 fg_color="#9b59b6",
                 hover_color="#8e44ad",
                 height=32,
@@ -1166,17 +1167,17 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             group_header,
             text="Per-Group Controls",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
-        ctk.CTkLabel(group_header, text="Group:", font=ctk.CTkFont(family=self.FONT_FAMILY, size=13)).pack(side="left", padx=(20, 5))
+        ctk.CTkLabel(group_header, text="Group:", font=get_font(13, family=self.FONT_FAMILY)).pack(side="left", padx=(20, 5))
 
         self.group_selector = ctk.CTkOptionMenu(
             group_header,
             values=["A", "B", "C", "D", "E", "F", "G", "H"],
             width=80,
             height=32,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13)
+            font=get_font(13, family=self.FONT_FAMILY)
         )
         self.group_selector.set("A")
         self.group_selector.pack(side="left")
@@ -1197,7 +1198,7 @@ class MK3DiagnosticApp(ctk.CTk):
             btn = ctk.CTkButton(
                 group_btns,
                 text=name,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 fg_color=color,
                 hover_color=color,
                 height=32,
@@ -1210,13 +1211,13 @@ class MK3DiagnosticApp(ctk.CTk):
         query_row = ctk.CTkFrame(group_frame, fg_color="transparent")
         query_row.pack(fill="x", padx=20, pady=(0, 15))
 
-        ctk.CTkLabel(query_row, text="Set Source:", font=ctk.CTkFont(family=self.FONT_FAMILY, size=12)).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(query_row, text="Set Source:", font=get_font(12, family=self.FONT_FAMILY)).pack(side="left", padx=(0, 10))
 
         for i, cmd in enumerate([MK3GroupCommand.SOURCE_1, MK3GroupCommand.SOURCE_2, MK3GroupCommand.SOURCE_3, MK3GroupCommand.SOURCE_4]):
             btn = ctk.CTkButton(
                 query_row,
                 text=f"Src {i+1}",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=11),
+                font=get_font(11, family=self.FONT_FAMILY),
                 fg_color="#9b59b6",
                 hover_color="#8e44ad",
                 height=28,
@@ -1235,7 +1236,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             status_header,
             text="Protection & Status Queries",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         status_btns = ctk.CTkFrame(status_frame, fg_color="transparent")
@@ -1244,7 +1245,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             status_btns,
             text="Query All Channel Status",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             height=36,
@@ -1255,7 +1256,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             status_btns,
             text="Full MK3 Diagnostic",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             fg_color="#e67e22",
             hover_color="#d35400",
             height=36,
@@ -1270,13 +1271,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             log_header,
             text="Command Log",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         ctk.CTkButton(
             log_header,
             text="Clear",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['card_bg'],
             border_width=1,
@@ -1288,7 +1289,7 @@ class MK3DiagnosticApp(ctk.CTk):
 
         self.control_log = ctk.CTkTextbox(
             scroll_frame,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=get_font(12, family="Consolas"),
             fg_color=self.COLORS['card_bg'],
             corner_radius=12,
             height=200
@@ -1554,7 +1555,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Activity Logs",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=28, weight="bold")
+            font=get_font(28, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         # Log viewer
@@ -1623,14 +1624,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             dialog,
             text="Clear Existing Devices?",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=18, weight="bold"),
+            font=get_font(18, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         ).pack(pady=(25, 10))
 
         ctk.CTkLabel(
             dialog,
             text=f"You have {len(self._discovered_devices)} devices discovered.\nDo you want to clear the list and rescan?",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(pady=(0, 20))
 
@@ -1641,7 +1642,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Clear & Rescan",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+            font=get_font(14, "bold", self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             width=140,
@@ -1651,7 +1652,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             fg_color="transparent",
             hover_color=self.COLORS['sidebar_hover'],
             border_width=1,
@@ -1993,7 +1994,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ip_label = ctk.CTkLabel(
             info_frame,
             text=device.ip_address,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold")
+            font=get_font(16, "bold", self.FONT_FAMILY)
         )
         ip_label.pack(anchor="w")
 
@@ -2002,7 +2003,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             info_frame,
             text=hostname_text,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=hostname_color
         ).pack(anchor="w")
 
@@ -2015,7 +2016,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             details_frame,
             text=f"MAC: {mac_text}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(anchor="w")
 
@@ -2024,7 +2025,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 details_frame,
                 text=f"Latency: {device.response_time_ms:.1f}ms",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary']
             ).pack(anchor="w")
 
@@ -2036,7 +2037,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 details_frame,
                 text=ports_text,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary']
             ).pack(anchor="w")
 
@@ -2054,7 +2055,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkButton(
                 actions,
                 text=status_text,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12, weight="bold"),
+                font=get_font(12, "bold", self.FONT_FAMILY),
                 fg_color=status_color,
                 hover_color=status_color,
                 width=90,
@@ -2065,7 +2066,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             actions,
             text="Run Diagnostic",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             width=110,
@@ -2166,7 +2167,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self._diag_spinner_label = ctk.CTkLabel(
             self._diag_loading_frame,
             text="◐",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=48),
+            font=get_font(48, family=self.FONT_FAMILY),
             text_color=self.COLORS['accent']
         )
         self._diag_spinner_label.pack()
@@ -2174,14 +2175,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self._diag_loading_frame,
             text="Running Diagnostics...",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=20, weight="bold"),
+            font=get_font(20, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         ).pack(pady=(20, 10))
 
         self._diag_status_label = ctk.CTkLabel(
             self._diag_loading_frame,
             text=f"Testing {len(ips)} device{'s' if len(ips) > 1 else ''}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         )
         self._diag_status_label.pack()
@@ -2193,7 +2194,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             self._diag_loading_frame,
             text=ip_text,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(pady=(5, 0))
 
@@ -2244,7 +2245,10 @@ class MK3DiagnosticApp(ctk.CTk):
         results['summary']['passed' if ping.is_reachable else 'failed'] += 1
 
         # 2. Ports
-        ports = self._connectivity.scan_ports(ip, [80, 23, 8080, 10000, 4998])
+        ports = self._connectivity.scan_ports(
+            ip, [80, 23, 8080, 10000, 4998],
+            max_workers=self.config.port_scan_concurrency
+        )
         open_ports = [p.port for p in ports if p.is_open]
         results['tests']['ports'] = {
             'name': 'Port Scan',
@@ -2351,7 +2355,10 @@ class MK3DiagnosticApp(ctk.CTk):
         logger.info(f"[{ip}] Ping: {'OK' if result.is_reachable else 'FAILED'} - avg {result.avg_ms:.1f}ms, {result.packet_loss_percent:.0f}% loss")
 
     def _run_port_test(self, ip: str) -> None:
-        ports = self._connectivity.scan_ports(ip, self.config.common_ports[:10])
+        ports = self._connectivity.scan_ports(
+            ip, self.config.common_ports[:10],
+            max_workers=self.config.port_scan_concurrency
+        )
         open_ports = [p.port for p in ports if p.is_open]
         logger.info(f"[{ip}] Open ports: {open_ports if open_ports else 'None'}")
 
@@ -2394,7 +2401,7 @@ class MK3DiagnosticApp(ctk.CTk):
             self.results_placeholder = ctk.CTkLabel(
                 self.results_container,
                 text="No diagnostic results yet.\nSelect devices in Discovery and run diagnostics.",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=16),
+                font=get_font(16, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary'],
                 justify="center"
             )
@@ -2445,13 +2452,13 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text=ip,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=22, weight="bold")
+            font=get_font(22, "bold", self.FONT_FAMILY)
         ).pack(side="left")
 
         ctk.CTkLabel(
             header,
             text=status_text,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=16, weight="bold"),
+            font=get_font(16, "bold", self.FONT_FAMILY),
             text_color=border_color
         ).pack(side="right")
 
@@ -2462,21 +2469,21 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             stats,
             text=f"Passed: {passed}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['success']
         ).pack(side="left", padx=(0, 30))
 
         ctk.CTkLabel(
             stats,
             text=f"Failed: {failed}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['error']
         ).pack(side="left")
 
         ctk.CTkLabel(
             stats,
             text=f"Tested: {results.get('timestamp', '')[:19]}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(side="right")
 
@@ -2492,7 +2499,7 @@ class MK3DiagnosticApp(ctk.CTk):
             test_label = ctk.CTkLabel(
                 tests_frame,
                 text=f"{icon} {test_data.get('name', test_id)}",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+                font=get_font(13, family=self.FONT_FAMILY),
                 text_color=color
             )
             test_label.pack(side="left", padx=(0, 25))
@@ -2505,7 +2512,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 issues_frame,
                 text="Issues Found:",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=14, weight="bold"),
+                font=get_font(14, "bold", self.FONT_FAMILY),
                 text_color=self.COLORS['error']
             ).pack(anchor="w", padx=15, pady=(12, 8))
 
@@ -2549,14 +2556,14 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             item,
             text=f"• {title}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['warning']
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             item,
             text=description,
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary'],
             wraplength=700,
             justify="left"
@@ -2565,7 +2572,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             item,
             text=f"→ {recommendation}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+            font=get_font(12, family=self.FONT_FAMILY),
             text_color=self.COLORS['success'],
             wraplength=700,
             justify="left"
@@ -2743,7 +2750,10 @@ class MK3DiagnosticApp(ctk.CTk):
 
         def run():
             ports_to_scan = [80, 23, 8080, 443, 10000, 4998, 52000, 22]
-            results = self._connectivity.scan_ports(ip, ports_to_scan)
+            results = self._connectivity.scan_ports(
+                ip, ports_to_scan,
+                max_workers=self.config.port_scan_concurrency
+            )
             open_ports = [p.port for p in results if p.is_open]
             passed = len(open_ports) > 0
 
@@ -2911,7 +2921,10 @@ class MK3DiagnosticApp(ctk.CTk):
 
             # Port scan
             self.after(0, lambda: self.quick_test_status.configure(text="[2/6] Scanning ports..."))
-            ports = self._connectivity.scan_ports(ip, [80, 23, 8080, 10000, 4998, 52000])
+            ports = self._connectivity.scan_ports(
+                ip, [80, 23, 8080, 10000, 4998, 52000],
+                max_workers=self.config.port_scan_concurrency
+            )
             open_ports = [p.port for p in ports if p.is_open]
             self.after(0, lambda: self._log_test_result("PORTS", ip, len(open_ports) > 0,
                 f"Open: {', '.join(map(str, open_ports))}" if open_ports else "None found"))
@@ -3012,7 +3025,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             content,
             text="MK3 Network Diagnostic Tool",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=22, weight="bold"),
+            font=get_font(22, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['accent']
         ).pack(pady=(0, 5))
 
@@ -3020,7 +3033,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             content,
             text=f"Version {__version__}",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=14),
+            font=get_font(14, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(pady=(0, 20))
 
@@ -3049,7 +3062,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 row,
                 text=f"{label}:",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12, weight="bold"),
+                font=get_font(12, "bold", self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary'],
                 width=80,
                 anchor="w"
@@ -3058,7 +3071,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 row,
                 text=value,
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_primary'],
                 anchor="w",
                 wraplength=280
@@ -3071,7 +3084,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             content,
             text="Supported Models",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold", self.FONT_FAMILY),
             text_color=self.COLORS['text_primary']
         ).pack(anchor="w", pady=(5, 8))
 
@@ -3083,7 +3096,7 @@ class MK3DiagnosticApp(ctk.CTk):
             ctk.CTkLabel(
                 models_frame,
                 text=f"  • {model}",
-                font=ctk.CTkFont(family=self.FONT_FAMILY, size=12),
+                font=get_font(12, family=self.FONT_FAMILY),
                 text_color=self.COLORS['text_secondary']
             ).pack(anchor="w")
 
@@ -3091,7 +3104,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkLabel(
             content,
             text="© 2024-2025 Sonance. All rights reserved.",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=11),
+            font=get_font(11, family=self.FONT_FAMILY),
             text_color=self.COLORS['text_secondary']
         ).pack(side="bottom", pady=(20, 0))
 
@@ -3099,7 +3112,7 @@ class MK3DiagnosticApp(ctk.CTk):
         ctk.CTkButton(
             content,
             text="Close",
-            font=ctk.CTkFont(family=self.FONT_FAMILY, size=13),
+            font=get_font(13, family=self.FONT_FAMILY),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             width=100,
@@ -3113,6 +3126,7 @@ class MK3DiagnosticApp(ctk.CTk):
         self.config.save()
         logger.info("Application closing")
         self.destroy()
+        clear_font_cache()
 
 
 def run_app():
@@ -4,6 +4,8 @@ import customtkinter as ctk
 import re
 from typing import Optional, Callable, List
 
+from ..fonts import get_font
+
 
 class IPEntry(ctk.CTkFrame):
     """
@@ -34,7 +36,7 @@ class IPEntry(ctk.CTkFrame):
         self._label = ctk.CTkLabel(
             self,
             text=label,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         self._label.pack(side="left", padx=(0, 10))
 
@@ -46,7 +48,7 @@ class IPEntry(ctk.CTkFrame):
             self._entry_frame,
             placeholder_text=placeholder,
             width=200,
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         self._entry.pack(side="left", padx=(0, 5))
         self._entry.bind("<Return>", self._on_enter_pressed)
@@ -59,7 +61,7 @@ class IPEntry(ctk.CTkFrame):
                 values=self._recent_ips,
                 command=self._on_dropdown_select,
                 width=40,
-                font=ctk.CTkFont(size=12)
+                font=get_font(12)
             )
             self._dropdown.set("▼")
             self._dropdown.pack(side="left", padx=(0, 5))
@@ -70,7 +72,7 @@ class IPEntry(ctk.CTkFrame):
             text="Go",
             width=60,
             command=self._submit,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         self._go_button.pack(side="left", padx=(0, 10))
 
@@ -78,7 +80,7 @@ class IPEntry(ctk.CTkFrame):
         self._status_label = ctk.CTkLabel(
             self._entry_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             width=20
         )
         self._status_label.pack(side="left")
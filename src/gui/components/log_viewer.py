@@ -5,6 +5,8 @@ from typing import Optional, List, Callable
 from datetime import datetime
 import threading
 
+from ..fonts import get_font
+
 
 class LogViewer(ctk.CTkFrame):
     """
@@ -49,7 +51,7 @@ class LogViewer(ctk.CTkFrame):
 
         self._textbox = ctk.CTkTextbox(
             self._text_frame,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=get_font(11, family="Consolas"),
             wrap="none",
             state="disabled"
         )
@@ -71,7 +73,7 @@ class LogViewer(ctk.CTkFrame):
         ctk.CTkLabel(
             self._toolbar,
             text="Level:",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=(5, 2))
 
         self._level_menu = ctk.CTkOptionMenu(
@@ -79,7 +81,7 @@ class LogViewer(ctk.CTkFrame):
             values=["All", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
             command=self._on_level_filter_change,
             width=100,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self._level_menu.set("All")
         self._level_menu.pack(side="left", padx=5)
@@ -88,14 +90,14 @@ class LogViewer(ctk.CTkFrame):
         ctk.CTkLabel(
             self._toolbar,
             text="Search:",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=(15, 2))
 
         self._search_entry = ctk.CTkEntry(
             self._toolbar,
             placeholder_text="Filter logs...",
             width=200,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self._search_entry.pack(side="left", padx=5)
         self._search_entry.bind("<Return>", lambda e: self._apply_search())
@@ -107,7 +109,7 @@ class LogViewer(ctk.CTkFrame):
             text="Clear",
             width=60,
             command=self.clear,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self._clear_btn.pack(side="right", padx=5)
 
@@ -117,7 +119,7 @@ class LogViewer(ctk.CTkFrame):
             text="Export",
             width=70,
             command=self._export_logs,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self._export_btn.pack(side="right", padx=5)
 
@@ -128,7 +130,7 @@ class LogViewer(ctk.CTkFrame):
             text="Auto-scroll",
             variable=self._autoscroll_var,
             command=self._on_autoscroll_toggle,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self._autoscroll_check.pack(side="right", padx=10)
 
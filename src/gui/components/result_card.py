@@ -1,10 +1,13 @@
 """Result card component for displaying test results - Enhanced Corporate Design."""
 
+import tkinter
 import customtkinter as ctk
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+from ..fonts import get_font
+
 
 class ResultStatus(Enum):
     """Status of a test result."""
@@ -26,7 +29,7 @@ class Severity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Represents a single test result."""
     name: str
@@ -36,6 +39,105 @@ class TestResult:
     duration_ms: Optional[float] = None
 
 
+# One details textbox per card container, shared by every ResultCard in it.
+# Only one card per container shows its details at a time, so the textbox is
+# packed into whichever card is expanded instead of each card owning its own.
+_SHARED_DETAILS: Dict[str, ctk.CTkTextbox] = {}
+_SHARED_DETAILS_OWNER: Dict[str, "ResultCard"] = {}
+
+
+def _forget_shared_details(master) -> None:
+    """Drop the shared-details entries for a container once it is destroyed."""
+    key = str(master)
+
+    def on_destroy(event) -> None:
+        if event.widget is master:
+            _SHARED_DETAILS.pop(key, None)
+            _SHARED_DETAILS_OWNER.pop(key, None)
+
+    # Plain Tk bind: CTk widgets redirect bind() to their inner canvas
+    tkinter.Misc.bind(master, "<Destroy>", on_destroy, add="+")
+
+
+def _fit_text_height(textbox: ctk.CTkTextbox) -> None:
+    """Resize a text block so all of its wrapped lines are visible without scrolling."""
+    # Tk measures the laid-out text itself, so mixed fonts and tag spacing count
+    pixels = textbox._textbox.count("1.0", "end", "ypixels")
+    if isinstance(pixels, tuple):
+        pixels = pixels[0]
+    # CTk scales the height option, so convert the measured pixels back first
+    height = round((pixels or 0) / textbox._get_widget_scaling()) + 8
+    if textbox.cget("height") != height:
+        textbox.configure(height=height)
+
+
+def _make_text_block(
+    parent,
+    lines: List[Tuple[str, str]],
+    tags: Dict[str, Dict[str, Any]],
+) -> ctk.CTkTextbox:
+    """
+    Build a read-only, word-wrapped text block from (text, tag) lines.
+
+    Replaces a stack of wraplength CTkLabels with one widget, so Tk wraps the
+    whole block in a single pass when the window is resized.
+    """
+    textbox = ctk.CTkTextbox(
+        parent,
+        height=1,
+        wrap="word",
+        fg_color="transparent",
+        corner_radius=0,
+        border_width=0,
+        activate_scrollbars=False
+    )
+    # CTkTextbox.tag_config rejects fonts, so configure tags on the Tk widget
+    for tag, options in tags.items():
+        textbox._textbox.tag_configure(tag, **options)
+
+    textbox.insert("1.0", "\n".join(text for text, _ in lines))
+    for row, (_, tag) in enumerate(lines, 1):
+        textbox._textbox.tag_add(tag, f"{row}.0", f"{row}.end")
+    textbox.configure(state="disabled")
+
+    textbox.bind("<Configure>", lambda e: _fit_text_height(textbox), add="+")
+    return textbox
+
+
+def _make_badge(
+    parent,
+    bg: str,
+    text: str,
+    text_color: str = "white",
+    font: Optional[ctk.CTkFont] = None,
+    corner_radius: int = 6,
+    padx: int = 10,
+    pady: int = 3,
+    size: Optional[int] = None,
+):
+    """
+    Build a small rounded badge (colored frame + centered label).
+
+    When ``size`` is given the badge is a fixed square with the label
+    centered inside; otherwise the badge shrinks to fit its label.
+
+    Returns:
+        Tuple of (badge frame, label) so callers can update the text later.
+    """
+    if size is not None:
+        badge = ctk.CTkFrame(parent, corner_radius=corner_radius, fg_color=bg, width=size, height=size)
+        badge.pack_propagate(False)
+    else:
+        badge = ctk.CTkFrame(parent, corner_radius=corner_radius, fg_color=bg)
+
+    label = ctk.CTkLabel(badge, text=text, font=font, text_color=text_color)
+    if size is not None:
+        label.place(relx=0.5, rely=0.5, anchor="center")
+    else:
+        label.pack(padx=padx, pady=pady)
+    return badge, label
+
+
 class ResultCard(ctk.CTkFrame):
     """
     A modern card component for displaying test results with status indicator.
@@ -77,7 +179,7 @@ class ResultCard(ctk.CTkFrame):
         test_name: str,
         status: ResultStatus = ResultStatus.PENDING,
         message: str = "",
-        details: str = "",
+        details: Union[str, Callable[[], str]] = "",
         duration_ms: Optional[float] = None,
         expandable: bool = True,
         **kwargs
@@ -97,10 +199,15 @@ class ResultCard(ctk.CTkFrame):
         self._test_name = test_name
         self._status = status
         self._message = message
+        # A callable here is only called the first time the card is expanded
         self._details = details
         self._duration_ms = duration_ms
         self._expandable = expandable
         self._expanded = False
+        self._expand_btn = None
+        self._duration_visible = False
+        self._expand_btn_visible = False
+        self._last_details: Optional[str] = None
 
         self._build_ui()
         self._update_display()
@@ -115,25 +222,24 @@ class ResultCard(ctk.CTkFrame):
         self._top_row = ctk.CTkFrame(self._main_container, fg_color="transparent")
         self._top_row.pack(fill="x")
 
-        # Status icon container (circular badge)
+        # Status icon (circular badge drawn directly on a canvas)
         colors = self.STATUS_COLORS.get(self._status, self.STATUS_COLORS[ResultStatus.PENDING])
-        self._icon_container = ctk.CTkFrame(
+        self._icon_canvas = ctk.CTkCanvas(
             self._top_row,
             width=36,
             height=36,
-            corner_radius=18,
-            fg_color=colors["icon_bg"]
+            highlightthickness=0,
+            bg=colors["bg"]
         )
-        self._icon_container.pack(side="left")
-        self._icon_container.pack_propagate(False)
+        self._icon_canvas.pack(side="left")
 
-        self._status_icon = ctk.CTkLabel(
-            self._icon_container,
+        self._icon_circle = self._icon_canvas.create_oval(0, 0, 35, 35, fill=colors["icon_bg"], outline="")
+        self._icon_text = self._icon_canvas.create_text(
+            18, 18,
             text="○",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="white"
+            fill="white",
+            font=get_font(16, "bold")
         )
-        self._status_icon.place(relx=0.5, rely=0.5, anchor="center")
 
         # Text container
         self._text_container = ctk.CTkFrame(self._top_row, fg_color="transparent")
@@ -143,7 +249,7 @@ class ResultCard(ctk.CTkFrame):
         self._name_label = ctk.CTkLabel(
             self._text_container,
             text=self._test_name,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=get_font(15, "bold"),
             anchor="w",
             text_color="#f8fafc"
         )
@@ -153,7 +259,7 @@ class ResultCard(ctk.CTkFrame):
         self._message_label = ctk.CTkLabel(
             self._text_container,
             text=self._message,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             anchor="w",
             text_color="#94a3b8"
         )
@@ -164,21 +270,15 @@ class ResultCard(ctk.CTkFrame):
         self._right_container.pack(side="right")
 
         # Duration badge
-        self._duration_badge = ctk.CTkFrame(
+        self._duration_badge, self._duration_label = _make_badge(
             self._right_container,
-            corner_radius=6,
-            fg_color="#374151",
-            height=24
-        )
-        self._duration_badge.pack(side="left", padx=(0, 8))
-
-        self._duration_label = ctk.CTkLabel(
-            self._duration_badge,
+            bg="#374151",
             text="",
-            font=ctk.CTkFont(size=11),
-            text_color="#9ca3af"
+            text_color="#9ca3af",
+            font=get_font(11),
+            padx=8,
+            pady=2
         )
-        self._duration_label.pack(padx=8, pady=2)
 
         # Expand button (modern chevron)
         if self._expandable:
@@ -188,13 +288,12 @@ class ResultCard(ctk.CTkFrame):
                 width=32,
                 height=32,
                 corner_radius=8,
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 fg_color="transparent",
                 hover_color="#475569",
                 text_color="#94a3b8",
                 command=self._toggle_expand
             )
-            self._expand_btn.pack(side="right")
 
         # Details frame (hidden initially) - more polished design
         self._details_frame = ctk.CTkFrame(
@@ -205,17 +304,6 @@ class ResultCard(ctk.CTkFrame):
             border_color="#334155"
         )
 
-        self._details_text = ctk.CTkTextbox(
-            self._details_frame,
-            height=120,
-            font=ctk.CTkFont(family="Consolas", size=12),
-            wrap="word",
-            fg_color="transparent",
-            text_color="#cbd5e1",
-            border_width=0
-        )
-        self._details_text.pack(fill="both", expand=True, padx=12, pady=10)
-
         # Make main frame clickable for expansion
         if self._expandable:
             for widget in [self._top_row, self._text_container, self._name_label, self._message_label]:
@@ -223,18 +311,84 @@ class ResultCard(ctk.CTkFrame):
                 widget.bind("<Enter>", lambda e: self.configure(cursor="hand2"))
                 widget.bind("<Leave>", lambda e: self.configure(cursor=""))
 
+    def _shared_details_text(self) -> ctk.CTkTextbox:
+        """Get (or lazily create) the details textbox shared by cards in this container."""
+        key = str(self.master)
+        textbox = _SHARED_DETAILS.get(key)
+        if textbox is None or not textbox.winfo_exists():
+            if textbox is None:
+                _forget_shared_details(self.master)
+            textbox = ctk.CTkTextbox(
+                self.master,
+                height=120,
+                font=get_font(12, family="Consolas"),
+                wrap="word",
+                fg_color="#0f172a",
+                text_color="#cbd5e1",
+                border_width=0
+            )
+            _SHARED_DETAILS[key] = textbox
+        return textbox
+
+    def _resolve_details(self) -> str:
+        """Get the details text, calling a details provider on first use."""
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
+
+    def _load_details(self) -> None:
+        """Write this card's details into the shared textbox (skipped if already shown)."""
+        if self._resolve_details() == self._last_details:
+            return
+
+        textbox = self._shared_details_text()
+        textbox.configure(state="normal")
+        textbox.delete("1.0", "end")
+        textbox.insert("1.0", self._details)
+        textbox.configure(state="disabled")
+        self._last_details = self._details
+
+    def _expand(self) -> None:
+        """Show the details pane, taking the shared textbox from any other card."""
+        key = str(self.master)
+        owner = _SHARED_DETAILS_OWNER.get(key)
+        if owner is not None and owner is not self and owner.winfo_exists():
+            owner._collapse()
+
+        textbox = self._shared_details_text()
+        self._details_frame.pack(fill="x", pady=(12, 0))
+        textbox.pack(in_=self._details_frame, fill="both", expand=True, padx=12, pady=10)
+        textbox.lift(self._details_frame)
+        _SHARED_DETAILS_OWNER[key] = self
+        self._load_details()
+
+        self._expanded = True
+        self._expand_btn.configure(text="▴")
+
+    def _collapse(self) -> None:
+        """Hide the details pane and release the shared textbox."""
+        key = str(self.master)
+        if _SHARED_DETAILS_OWNER.get(key) is self:
+            del _SHARED_DETAILS_OWNER[key]
+            textbox = _SHARED_DETAILS.get(key)
+            if textbox is not None and textbox.winfo_exists():
+                textbox.pack_forget()
+        # Another card may overwrite the shared textbox once we let go of it
+        self._last_details = None
+
+        self._details_frame.pack_forget()
+        self._expanded = False
+        self._expand_btn.configure(text="▾")
+
     def _toggle_expand(self) -> None:
         """Toggle the expanded state with smooth animation."""
         if not self._details:
             return
 
-        self._expanded = not self._expanded
         if self._expanded:
-            self._details_frame.pack(fill="x", pady=(12, 0))
-            self._expand_btn.configure(text="▴")
+            self._collapse()
         else:
-            self._details_frame.pack_forget()
-            self._expand_btn.configure(text="▾")
+            self._expand()
 
     def _update_display(self) -> None:
         """Update the display based on current state."""
@@ -246,8 +400,9 @@ class ResultCard(ctk.CTkFrame):
         self.configure(fg_color=colors["bg"], border_color=colors["primary"])
 
         # Update icon
-        self._icon_container.configure(fg_color=colors["icon_bg"])
-        self._status_icon.configure(text=icon, text_color="white")
+        self._icon_canvas.configure(bg=colors["bg"])
+        self._icon_canvas.itemconfigure(self._icon_circle, fill=colors["icon_bg"])
+        self._icon_canvas.itemconfigure(self._icon_text, text=icon)
 
         # Update message
         self._message_label.configure(text=self._message)
@@ -259,28 +414,31 @@ class ResultCard(ctk.CTkFrame):
             else:
                 duration_text = f"{self._duration_ms/1000:.1f}s"
             self._duration_label.configure(text=duration_text)
-            self._duration_badge.pack(side="left", padx=(0, 8))
-        else:
+            if not self._duration_visible:
+                self._duration_badge.pack(side="left", padx=(0, 8))
+                self._duration_visible = True
+        elif self._duration_visible:
             self._duration_badge.pack_forget()
+            self._duration_visible = False
 
-        # Update details
-        if self._details:
-            self._details_text.configure(state="normal")
-            self._details_text.delete("1.0", "end")
-            self._details_text.insert("1.0", self._details)
-            self._details_text.configure(state="disabled")
+        # Update details (the shared textbox only holds them while expanded)
+        if self._details and self._expanded:
+            self._load_details()
 
-            if self._expandable and hasattr(self, '_expand_btn'):
+        # Only touch the packer when the expand button's visibility changes
+        if self._expand_btn is not None:
+            show_expand = bool(self._details)
+            if show_expand and not self._expand_btn_visible:
                 self._expand_btn.pack(side="right")
-        else:
-            if self._expandable and hasattr(self, '_expand_btn'):
+            elif not show_expand and self._expand_btn_visible:
                 self._expand_btn.pack_forget()
+            self._expand_btn_visible = show_expand
 
     def update_result(
         self,
         status: Optional[ResultStatus] = None,
         message: Optional[str] = None,
-        details: Optional[str] = None,
+        details: Union[str, Callable[[], str], None] = None,
         duration_ms: Optional[float] = None
     ) -> None:
         """Update the result card with new values."""
@@ -295,6 +453,28 @@ class ResultCard(ctk.CTkFrame):
 
         self._update_display()
 
+    def reconfigure(
+        self,
+        test_name: str,
+        status: ResultStatus,
+        message: str = "",
+        details: Union[str, Callable[[], str]] = "",
+        duration_ms: Optional[float] = None
+    ) -> None:
+        """Rebind the card to a different result, replacing every field (used when recycling cards)."""
+        if self._expanded and (test_name != self._test_name or not details):
+            self._collapse()
+        if test_name != self._test_name:
+            self._test_name = test_name
+            self._name_label.configure(text=test_name)
+
+        self._status = status
+        self._message = message
+        self._details = details
+        self._duration_ms = duration_ms
+
+        self._update_display()
+
     def set_running(self, message: str = "Running...") -> None:
         """Set the card to running state."""
         self.update_result(status=ResultStatus.RUNNING, message=message)
@@ -329,6 +509,12 @@ class ResultCard(ctk.CTkFrame):
             duration_ms=duration_ms
         )
 
+    def destroy(self) -> None:
+        """Release the shared details textbox before destroying the card."""
+        if _SHARED_DETAILS_OWNER.get(str(self.master)) is self:
+            del _SHARED_DETAILS_OWNER[str(self.master)]
+        super().destroy()
+
     @property
     def status(self) -> ResultStatus:
         """Get the current status."""
@@ -354,6 +540,8 @@ class EnhancedIssueCard(ctk.CTkFrame):
         "info": {"bg": "#1e293b", "border": "#64748b", "badge": "#64748b", "text": "INFO"},
     }
 
+    COMPLEXITY_COLORS = {"low": "#22c55e", "medium": "#f59e0b", "high": "#ef4444"}
+
     def __init__(
         self,
         master,
@@ -364,6 +552,7 @@ class EnhancedIssueCard(ctk.CTkFrame):
         corrective_actions: Optional[List[Dict[str, Any]]] = None,
         affected_functionality: Optional[List[str]] = None,
         firmware_relevant: bool = False,
+        collapsed: bool = False,
         **kwargs
     ):
         style = self.SEVERITY_STYLES.get(severity.lower(), self.SEVERITY_STYLES["medium"])
@@ -386,56 +575,40 @@ class EnhancedIssueCard(ctk.CTkFrame):
         self._firmware_relevant = firmware_relevant
         self._style = style
 
-        self._build_ui()
+        # A collapsed card builds its analysis sections on first expand
+        self._analysis_frame = None
+        self._analysis_visible = False
+        self._analysis_btn = None
+        self._analysis_parent = None
 
-    def _build_ui(self) -> None:
+        self._build_ui(collapsed)
+
+    def _build_ui(self, collapsed: bool) -> None:
         """Build the enhanced issue card UI."""
-        # Main container
+        # Main container - populated while unmanaged and packed once at the
+        # end, so the card and its parent only re-layout after all sections exist
         container = ctk.CTkFrame(self, fg_color="transparent")
-        container.pack(fill="x", padx=20, pady=16)
 
         # Header row
         header = ctk.CTkFrame(container, fg_color="transparent")
         header.pack(fill="x")
 
+        badge_font = get_font(10, "bold")
+
         # Severity badge
-        severity_badge = ctk.CTkFrame(
-            header,
-            corner_radius=6,
-            fg_color=self._style["badge"],
-            height=24
-        )
+        severity_badge, _ = _make_badge(header, bg=self._style["badge"], text=self._style["text"], font=badge_font)
         severity_badge.pack(side="left")
 
-        ctk.CTkLabel(
-            severity_badge,
-            text=self._style["text"],
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color="white"
-        ).pack(padx=10, pady=3)
-
         # Firmware badge if relevant
         if self._firmware_relevant:
-            fw_badge = ctk.CTkFrame(
-                header,
-                corner_radius=6,
-                fg_color="#7e22ce",
-                height=24
-            )
+            fw_badge, _ = _make_badge(header, bg="#7e22ce", text="FIRMWARE TEAM", font=badge_font)
             fw_badge.pack(side="left", padx=(8, 0))
 
-            ctk.CTkLabel(
-                fw_badge,
-                text="FIRMWARE TEAM",
-                font=ctk.CTkFont(size=10, weight="bold"),
-                text_color="white"
-            ).pack(padx=10, pady=3)
-
         # Title
         ctk.CTkLabel(
             container,
             text=self._title,
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color="#f8fafc",
             anchor="w"
         ).pack(anchor="w", pady=(12, 4))
@@ -444,24 +617,70 @@ class EnhancedIssueCard(ctk.CTkFrame):
         ctk.CTkLabel(
             container,
             text=self._description,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color="#cbd5e1",
             anchor="w",
             wraplength=700,
             justify="left"
         ).pack(anchor="w", pady=(0, 16))
 
+        has_analysis = self._root_cause or self._corrective_actions or self._affected_functionality
+        if has_analysis and collapsed:
+            self._analysis_btn = ctk.CTkButton(
+                container,
+                text="Show root cause & corrective actions ▾",
+                height=28,
+                corner_radius=8,
+                font=get_font(12, "bold"),
+                fg_color="transparent",
+                hover_color="#334155",
+                text_color="#94a3b8",
+                anchor="w",
+                command=self._toggle_analysis
+            )
+            self._analysis_btn.pack(anchor="w")
+            self._analysis_parent = container
+        elif has_analysis:
+            self._build_analysis(container)
+
+        container.pack(fill="x", padx=20, pady=16)
+
+    def _build_analysis(self, parent) -> None:
+        """Build the root cause, corrective action and affected functionality sections."""
+        self._analysis_frame = ctk.CTkFrame(parent, fg_color="transparent")
+
         # Root Cause Analysis Section
         if self._root_cause:
-            self._build_root_cause_section(container)
+            self._build_root_cause_section(self._analysis_frame)
 
         # Corrective Actions Section
         if self._corrective_actions:
-            self._build_actions_section(container)
+            self._build_actions_section(self._analysis_frame)
 
         # Affected Functionality Section
         if self._affected_functionality:
-            self._build_affected_section(container)
+            self._build_affected_section(self._analysis_frame)
+
+        self._analysis_frame.pack(fill="x")
+        self._analysis_visible = True
+
+    def _toggle_analysis(self) -> None:
+        """Show or hide the analysis sections, building them the first time."""
+        if self._analysis_frame is None:
+            self._build_analysis(self._analysis_parent)
+        elif self._analysis_visible:
+            self._analysis_frame.pack_forget()
+            self._analysis_visible = False
+        else:
+            self._analysis_frame.pack(fill="x")
+            self._analysis_visible = True
+
+        if self._analysis_visible:
+            self._analysis_btn.configure(text="Hide root cause & corrective actions ▴")
+            self._analysis_btn.pack_configure(pady=(0, 12))
+        else:
+            self._analysis_btn.configure(text="Show root cause & corrective actions ▾")
+            self._analysis_btn.pack_configure(pady=0)
 
     def _build_root_cause_section(self, parent) -> None:
         """Build the root cause analysis section."""
@@ -478,13 +697,13 @@ class EnhancedIssueCard(ctk.CTkFrame):
         ctk.CTkLabel(
             header_row,
             text="🔍",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         ).pack(side="left")
 
         ctk.CTkLabel(
             header_row,
             text="Root Cause Analysis",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color="#60a5fa"
         ).pack(side="left", padx=(8, 0))
 
@@ -493,7 +712,7 @@ class EnhancedIssueCard(ctk.CTkFrame):
             ctk.CTkLabel(
                 inner,
                 text=f"Category: {self._root_cause['category']}",
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 text_color="#94a3b8",
                 anchor="w"
             ).pack(anchor="w", pady=(10, 4))
@@ -506,7 +725,7 @@ class EnhancedIssueCard(ctk.CTkFrame):
             ctk.CTkLabel(
                 tech_frame,
                 text=self._root_cause["technical_details"],
-                font=ctk.CTkFont(family="Consolas", size=11),
+                font=get_font(11, family="Consolas"),
                 text_color="#e2e8f0",
                 anchor="w",
                 wraplength=650,
@@ -515,24 +734,17 @@ class EnhancedIssueCard(ctk.CTkFrame):
 
         # Evidence
         if self._root_cause.get("evidence"):
-            ctk.CTkLabel(
-                inner,
-                text="Evidence:",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color="#94a3b8",
-                anchor="w"
-            ).pack(anchor="w", pady=(12, 4))
+            lines = [("Evidence:", "header")]
+            lines.extend((f"  • {evidence}", "bullet") for evidence in self._root_cause["evidence"])
 
-            for evidence in self._root_cause["evidence"]:
-                ctk.CTkLabel(
-                    inner,
-                    text=f"  • {evidence}",
-                    font=ctk.CTkFont(size=11),
-                    text_color="#94a3b8",
-                    anchor="w",
-                    wraplength=640,
-                    justify="left"
-                ).pack(anchor="w", padx=(8, 0))
+            _make_text_block(
+                inner,
+                lines,
+                {
+                    "header": {"font": get_font(12, "bold"), "foreground": "#94a3b8", "spacing3": 4},
+                    "bullet": {"font": get_font(11), "foreground": "#94a3b8", "lmargin1": 8, "lmargin2": 24},
+                }
+            ).pack(fill="x", pady=(12, 0))
 
     def _build_actions_section(self, parent) -> None:
         """Build the corrective actions section."""
@@ -549,17 +761,20 @@ class EnhancedIssueCard(ctk.CTkFrame):
         ctk.CTkLabel(
             header_row,
             text="✓",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color="#22c55e"
         ).pack(side="left")
 
         ctk.CTkLabel(
             header_row,
             text="Corrective Actions",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color="#22c55e"
         ).pack(side="left", padx=(8, 0))
 
+        badge_font = get_font(10)
+        priority_font = get_font(11, "bold")
+
         # Actions list
         for action in self._corrective_actions:
             action_frame = ctk.CTkFrame(inner, fg_color="#0f172a", corner_radius=6)
@@ -574,22 +789,16 @@ class EnhancedIssueCard(ctk.CTkFrame):
 
             # Priority badge
             priority = action.get("priority", 1)
-            priority_badge = ctk.CTkFrame(meta_row, corner_radius=10, fg_color="#22c55e", width=24, height=24)
+            priority_badge, _ = _make_badge(
+                meta_row, bg="#22c55e", text=str(priority), font=priority_font, corner_radius=10, size=24
+            )
             priority_badge.pack(side="left")
-            priority_badge.pack_propagate(False)
-
-            ctk.CTkLabel(
-                priority_badge,
-                text=str(priority),
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color="white"
-            ).place(relx=0.5, rely=0.5, anchor="center")
 
             # Action title
             ctk.CTkLabel(
                 meta_row,
                 text=action.get("action", ""),
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=get_font(13, "bold"),
                 text_color="#f8fafc",
                 anchor="w"
             ).pack(side="left", padx=(10, 0))
@@ -597,62 +806,69 @@ class EnhancedIssueCard(ctk.CTkFrame):
             # Owner badge
             owner = action.get("responsible_party", "")
             if owner:
-                owner_badge = ctk.CTkFrame(meta_row, corner_radius=4, fg_color="#374151")
+                owner_badge, _ = _make_badge(
+                    meta_row, bg="#374151", text=owner, text_color="#9ca3af",
+                    font=badge_font, corner_radius=4, padx=8, pady=2
+                )
                 owner_badge.pack(side="right", padx=(0, 8))
 
-                ctk.CTkLabel(
-                    owner_badge,
-                    text=owner,
-                    font=ctk.CTkFont(size=10),
-                    text_color="#9ca3af"
-                ).pack(padx=8, pady=2)
-
             # Complexity badge
             complexity = action.get("estimated_complexity", "low")
-            complexity_colors = {"low": "#22c55e", "medium": "#f59e0b", "high": "#ef4444"}
-
-            complexity_badge = ctk.CTkFrame(meta_row, corner_radius=4, fg_color=complexity_colors.get(complexity, "#6b7280"))
+            complexity_badge, _ = _make_badge(
+                meta_row, bg=self.COMPLEXITY_COLORS.get(complexity, "#6b7280"), text=complexity,
+                font=badge_font, corner_radius=4, padx=8, pady=2
+            )
             complexity_badge.pack(side="right")
 
-            ctk.CTkLabel(
-                complexity_badge,
-                text=complexity,
-                font=ctk.CTkFont(size=10),
-                text_color="white"
-            ).pack(padx=8, pady=2)
-
             # Description
             if action.get("description"):
                 ctk.CTkLabel(
                     action_inner,
                     text=action["description"],
-                    font=ctk.CTkFont(size=12),
+                    font=get_font(12),
                     text_color="#cbd5e1",
                     anchor="w",
                     wraplength=620,
                     justify="left"
                 ).pack(anchor="w", pady=(8, 0))
 
-            # Verification steps
+            # Verification steps (built when first shown)
             if action.get("verification_steps"):
-                ctk.CTkLabel(
-                    action_inner,
-                    text="Verification:",
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    text_color="#94a3b8",
-                    anchor="w"
-                ).pack(anchor="w", pady=(8, 4))
-
-                for i, step in enumerate(action["verification_steps"], 1):
-                    ctk.CTkLabel(
-                        action_inner,
-                        text=f"  {i}. {step}",
-                        font=ctk.CTkFont(size=11),
-                        text_color="#94a3b8",
-                        anchor="w",
-                        wraplength=600,
-                        justify="left"
-                    ).pack(anchor="w")
+                self._add_steps_toggle(action_inner, action["verification_steps"])
+
+    def _add_steps_toggle(self, parent, steps: List[str]) -> None:
+        """Add a toggle that shows an action's verification steps, building them on first use."""
+        label = f"Verification steps ({len(steps)})"
+        steps_block = None
+
+        def toggle() -> None:
+            nonlocal steps_block
+            if steps_block is None:
+                steps_block = _make_text_block(
+                    parent,
+                    [(f"  {i}. {step}", "step") for i, step in enumerate(steps, 1)],
+                    {"step": {"font": get_font(11), "foreground": "#94a3b8", "lmargin2": 20}}
+                )
+            if steps_block.winfo_manager():
+                steps_block.pack_forget()
+                button.configure(text=f"▸ {label}")
+            else:
+                steps_block.pack(fill="x", pady=(4, 0))
+                button.configure(text=f"▾ {label}")
+
+        button = ctk.CTkButton(
+            parent,
+            text=f"▸ {label}",
+            height=22,
+            corner_radius=6,
+            font=get_font(11, "bold"),
+            fg_color="transparent",
+            hover_color="#1e293b",
+            text_color="#94a3b8",
+            anchor="w",
+            command=toggle
+        )
+        button.pack(anchor="w", pady=(8, 0))
 
     def _build_affected_section(self, parent) -> None:
         """Build the affected functionality section."""
@@ -666,7 +882,7 @@ class EnhancedIssueCard(ctk.CTkFrame):
         ctk.CTkLabel(
             inner,
             text="⚡ Affected Functionality",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color="#a5b4fc",
             anchor="w"
         ).pack(anchor="w")
@@ -676,7 +892,7 @@ class EnhancedIssueCard(ctk.CTkFrame):
             ctk.CTkLabel(
                 inner,
                 text=f"  • {func}",
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 text_color="#c7d2fe",
                 anchor="w"
             ).pack(anchor="w", pady=(2, 0))
@@ -0,0 +1,31 @@
+"""Shared font cache for GUI widgets."""
+
+import customtkinter as ctk
+from typing import Dict, Optional, Tuple
+
+_FONT_CACHE: Dict[Tuple[int, str, Optional[str]], ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """
+    Get a shared CTkFont for the given size, weight and family.
+
+    Fonts are created on first use (a Tk root must already exist) and reused
+    afterwards, so building a widget doesn't register a new Tk font each time.
+    """
+    # An empty family means the default one; share its entry with None
+    family = family or None
+    key = (size, weight, family)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if family:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+        else:
+            font = ctk.CTkFont(size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+def clear_font_cache() -> None:
+    """Drop all cached fonts; call when the Tk root they belong to is destroyed."""
+    _FONT_CACHE.clear()
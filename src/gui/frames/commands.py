@@ -2,17 +2,21 @@
 
 import customtkinter as ctk
 import threading
-from typing import Optional, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, List
 
 from ...network import CommandTester
 from ...utils import get_logger, Config
 from ..components import ResultCard
 from ..components.result_card import ResultStatus
+from ..fonts import get_font
+from ..progress import ProgressMixin
 
 logger = get_logger(__name__)
 
 
-class CommandsFrame(ctk.CTkFrame):
+class CommandsFrame(ProgressMixin, ctk.CTkFrame):
     """
     Frame for TCP command testing functionality.
 
@@ -20,6 +24,29 @@ class CommandsFrame(ctk.CTkFrame):
     cause command errors due to rate limiting or queueing issues.
     """
 
+    # Log line colors, configured once as textbox tags keyed by level
+    _LOG_COLORS = {
+        "TX": "#3498db",
+        "RX": "#27ae60",
+        "INFO": "gray60",
+        "ERROR": "#e74c3c",
+        "WARNING": "#f39c12"
+    }
+
+    # Rapid preset changes within this window only apply the last one
+    PRESET_DEBOUNCE_MS = 100
+
+    # Preset menu labels mapped to the port they fill in
+    PRESET_PORTS = {
+        "23 (Telnet)": "23",
+        "80 (HTTP)": "80",
+        "10000": "10000",
+        "10001": "10001",
+        "4998": "4998",
+        "4999": "4999",
+        "5000": "5000",
+    }
+
     def __init__(
         self,
         master,
@@ -33,9 +60,23 @@ class CommandsFrame(ctk.CTkFrame):
         self._get_target_ip = get_target_ip
         self._tester = CommandTester()
         self._connection = None
+        # Serializes use of the persistent connection across pool workers
+        self._connection_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-worker")
+
+        self._init_progress()
+
+        # Parsed port entry value, cleared whenever the entry text changes
+        self._cached_port: Optional[int] = None
+        self._preset_job = None
 
         self._build_ui()
 
+    def destroy(self) -> None:
+        """Stop the background workers before destroying the frame."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def _build_ui(self) -> None:
         """Build the UI."""
         self.grid_columnconfigure(0, weight=1)
@@ -58,28 +99,32 @@ class CommandsFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             conn_frame,
             text="Connection:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=10)
 
         ctk.CTkLabel(
             conn_frame,
             text="Port:",
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(10, 5))
 
+        # Default telnet port; any change to the text (typing, paste, presets)
+        # drops the cached parse
+        self._port_var = ctk.StringVar(value="23")
+        self._port_var.trace_add("write", self._invalidate_port)
         self.port_entry = ctk.CTkEntry(
             conn_frame,
+            textvariable=self._port_var,
             placeholder_text="23",
             width=80,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         self.port_entry.pack(side="left", padx=5)
-        self.port_entry.insert(0, "23")  # Default telnet port
 
         # Preset ports dropdown
         self.port_presets = ctk.CTkOptionMenu(
             conn_frame,
-            values=["23 (Telnet)", "80 (HTTP)", "10000", "10001", "4998", "4999", "5000"],
+            values=list(self.PRESET_PORTS),
             command=self._on_port_preset,
             width=120
         )
@@ -90,7 +135,7 @@ class CommandsFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             conn_frame,
             text="Terminator:",
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(20, 5))
 
         self.terminator_var = ctk.StringVar(value="crlf")
@@ -107,7 +152,7 @@ class CommandsFrame(ctk.CTkFrame):
             conn_frame,
             text="Connect",
             command=self._toggle_connection,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.connect_btn.pack(side="left", padx=20)
@@ -116,11 +161,21 @@ class CommandsFrame(ctk.CTkFrame):
         self.conn_status = ctk.CTkLabel(
             conn_frame,
             text="Disconnected",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         self.conn_status.pack(side="right", padx=10)
 
+        # Test progress (text is driven through the bound variable)
+        self._progress_var = ctk.StringVar(value="")
+        self.progress_label = ctk.CTkLabel(
+            conn_frame,
+            textvariable=self._progress_var,
+            font=get_font(12),
+            text_color="gray60"
+        )
+        self.progress_label.pack(side="right", padx=10)
+
     def _build_command_controls(self) -> None:
         """Build command entry and test controls."""
         cmd_frame = ctk.CTkFrame(self)
@@ -133,14 +188,14 @@ class CommandsFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             left_frame,
             text="Command:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=10)
 
         self.command_entry = ctk.CTkEntry(
             left_frame,
             placeholder_text="Enter command to send",
             width=300,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         self.command_entry.pack(side="left", padx=5)
         self.command_entry.bind("<Return>", lambda e: self._send_command())
@@ -149,7 +204,7 @@ class CommandsFrame(ctk.CTkFrame):
             left_frame,
             text="Send",
             command=self._send_command,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=80
         )
         self.send_btn.pack(side="left", padx=5)
@@ -161,19 +216,19 @@ class CommandsFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             right_frame,
             text="Burst Test:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=10)
 
         ctk.CTkLabel(
             right_frame,
             text="Count:",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=5)
 
         self.burst_count = ctk.CTkEntry(
             right_frame,
             width=50,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.burst_count.pack(side="left", padx=2)
         self.burst_count.insert(0, "10")
@@ -181,13 +236,13 @@ class CommandsFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             right_frame,
             text="Delay (ms):",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=5)
 
         self.burst_delay = ctk.CTkEntry(
             right_frame,
             width=60,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.burst_delay.pack(side="left", padx=2)
         self.burst_delay.insert(0, "0")
@@ -196,7 +251,7 @@ class CommandsFrame(ctk.CTkFrame):
             right_frame,
             text="Run Burst",
             command=self._run_burst_test,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.burst_btn.pack(side="left", padx=10)
@@ -205,7 +260,7 @@ class CommandsFrame(ctk.CTkFrame):
             right_frame,
             text="Find Optimal Delay",
             command=self._find_optimal_delay,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             fg_color="green",
             hover_color="darkgreen",
             width=140
@@ -218,15 +273,27 @@ class CommandsFrame(ctk.CTkFrame):
         self.results_scroll.grid(row=2, column=0, sticky="nsew", padx=10, pady=(5, 10))
         self.results_scroll.grid_columnconfigure(0, weight=1)
 
-        # Command log
+        # Command log - a single textbox with one color tag per level
         self._add_section_header("Command Log")
 
+        self.log_box = ctk.CTkTextbox(
+            self.results_scroll,
+            height=300,
+            font=get_font(12, family="Consolas"),
+            wrap="none",
+            state="disabled"
+        )
+        self.log_box.pack(fill="x", padx=10, pady=(0, 5))
+
+        for level, color in self._LOG_COLORS.items():
+            self.log_box._textbox.tag_configure(level, foreground=color)
+
     def _add_section_header(self, title: str) -> None:
         """Add a section header."""
         header = ctk.CTkLabel(
             self.results_scroll,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         header.pack(anchor="w", padx=10, pady=(10, 5))
 
@@ -240,27 +307,51 @@ class CommandsFrame(ctk.CTkFrame):
 
     def _get_port(self) -> int:
         """Get the port number."""
-        try:
-            return int(self.port_entry.get().strip())
-        except ValueError:
-            return 23
+        if self._cached_port is None:
+            try:
+                self._cached_port = int(self.port_entry.get().strip())
+            except ValueError:
+                return 23
+        return self._cached_port
+
+    def _invalidate_port(self, *args) -> None:
+        """Forget the parsed port after the entry changes."""
+        self._cached_port = None
 
     def _on_port_preset(self, value: str) -> None:
-        """Handle port preset selection."""
-        port = value.split(" ")[0]
-        self.port_entry.delete(0, "end")
-        self.port_entry.insert(0, port)
+        """Handle port preset selection, applying only the last of a rapid series."""
+        if self._preset_job is not None:
+            self.after_cancel(self._preset_job)
+        self._preset_job = self.after(self.PRESET_DEBOUNCE_MS, self._apply_port_preset, value)
+
+    def _apply_port_preset(self, value: str) -> None:
+        """Fill the port entry from a preset."""
+        self._preset_job = None
+        port = self.PRESET_PORTS.get(value, value)
+        self._port_var.set(port)
 
     def _toggle_connection(self) -> None:
         """Toggle connection state."""
         if self._connection and self._connection.is_connected:
-            self._tester.disconnect(self._connection)
+            self._close_connection(self._connection)
             self._connection = None
             self.connect_btn.configure(text="Connect")
             self.conn_status.configure(text="Disconnected", text_color="gray")
         else:
             self._connect()
 
+    def _close_connection(self, conn) -> None:
+        """Close a connection on a worker once no other worker is using it."""
+        def run():
+            try:
+                # A burst may hold the lock for a while; wait for it off the UI thread
+                with self._connection_lock:
+                    self._tester.disconnect(conn)
+            except Exception as e:
+                logger.error(f"Disconnect error: {e}")
+
+        self._pool.submit(run)
+
     def _connect(self) -> None:
         """Establish connection."""
         ip = self._check_ip()
@@ -271,20 +362,24 @@ class CommandsFrame(ctk.CTkFrame):
         self.conn_status.configure(text="Connecting...", text_color="yellow")
 
         def run():
-            # Update terminator
-            self._tester.terminator = self._tester.TERMINATORS.get(
-                self.terminator_var.get(), b'\r\n'
-            )
+            try:
+                # Update terminator
+                self._tester.terminator = self._tester.TERMINATORS.get(
+                    self.terminator_var.get(), b'\r\n'
+                )
 
-            conn = self._tester.connect(ip, port)
-            self._connection = conn
+                conn = self._tester.connect(ip, port)
+                self._connection = conn
 
-            if conn.is_connected:
-                self.after(0, lambda: self._on_connected())
-            else:
-                self.after(0, lambda: self._on_connect_failed(conn.last_error))
+                if conn.is_connected:
+                    self.after(0, self._on_connected)
+                else:
+                    self.after(0, self._on_connect_failed, conn.last_error)
+            except Exception as e:
+                logger.error(f"Connect error: {e}")
+                self.after(0, self._on_connect_failed, str(e))
 
-        threading.Thread(target=run, daemon=True).start()
+        self._pool.submit(run)
 
     def _on_connected(self) -> None:
         """Handle successful connection."""
@@ -292,6 +387,15 @@ class CommandsFrame(ctk.CTkFrame):
         self.conn_status.configure(text="Connected", text_color="green")
         self._add_log_entry("Connected", "INFO")
 
+    def _on_connection_lost(self) -> None:
+        """Handle the persistent connection being dropped by the device."""
+        if self._connection and not self._connection.is_connected:
+            self._close_connection(self._connection)
+            self._connection = None
+            self.connect_btn.configure(text="Connect")
+            self.conn_status.configure(text="Disconnected", text_color="gray")
+            self._add_log_entry("Connection lost", "ERROR")
+
     def _on_connect_failed(self, error: str) -> None:
         """Handle connection failure."""
         self.conn_status.configure(text=f"Failed: {error}", text_color="red")
@@ -310,10 +414,22 @@ class CommandsFrame(ctk.CTkFrame):
         port = self._get_port()
 
         def run():
-            result = self._tester.send_command_simple(ip, port, command)
-            self.after(0, lambda: self._display_command_result(result))
-
-        threading.Thread(target=run, daemon=True).start()
+            try:
+                conn = self._connection
+                if conn and conn.is_connected:
+                    # Reuse the open connection instead of a new handshake per command
+                    with self._connection_lock:
+                        result = self._tester.send_command(conn, command)
+                    if not conn.is_connected:
+                        self.after(0, self._on_connection_lost)
+                else:
+                    result = self._tester.send_command_simple(ip, port, command)
+                self.after(0, self._display_command_result, result)
+            except Exception as e:
+                logger.error(f"Send command error: {e}")
+                self.after(0, self._add_log_entry, f"Error: {e}", "ERROR")
+
+        self._pool.submit(run)
 
     def _display_command_result(self, result) -> None:
         """Display command result."""
@@ -328,22 +444,18 @@ class CommandsFrame(ctk.CTkFrame):
 
     def _add_log_entry(self, text: str, level: str) -> None:
         """Add entry to command log."""
-        colors = {
-            "TX": "#3498db",
-            "RX": "#27ae60",
-            "INFO": "gray60",
-            "ERROR": "#e74c3c",
-            "WARNING": "#f39c12"
-        }
-
-        entry = ctk.CTkLabel(
-            self.results_scroll,
-            text=text,
-            font=ctk.CTkFont(family="Consolas", size=12),
-            text_color=colors.get(level, "gray"),
-            anchor="w"
-        )
-        entry.pack(anchor="w", padx=15, pady=1)
+        textbox = self.log_box._textbox
+        self.log_box.configure(state="normal")
+        textbox.insert("end", f"{text}\n", level)
+
+        # Keep only the most recent lines so long bursts don't grow memory unbounded
+        line_count = int(textbox.index("end-1c").split(".")[0]) - 1
+        excess = line_count - self.config.max_log_lines
+        if excess > 0:
+            textbox.delete("1.0", f"{excess + 1}.0")
+
+        textbox.see("end")
+        self.log_box.configure(state="disabled")
 
     def _run_burst_test(self) -> None:
         """Run burst command test."""
@@ -365,23 +477,51 @@ class CommandsFrame(ctk.CTkFrame):
 
         port = self._get_port()
         self.burst_btn.configure(state="disabled")
+        self._begin_progress()
 
-        def run():
-            result = self._tester.burst_test(
-                ip, port, command,
-                count=count,
-                delay_ms=delay,
-                progress_callback=lambda c, t: self.after(
-                    0, lambda: self._add_log_entry(f"Burst progress: {c}/{t}", "INFO")
-                )
-            )
-            self.after(0, lambda: self._display_burst_result(result))
-            self.after(0, lambda: self.burst_btn.configure(state="normal"))
+        progress_text = "Burst progress: {}/{}".format
 
-        threading.Thread(target=run, daemon=True).start()
+        def on_progress(c: int, t: int, post=self._post_progress) -> None:
+            post(progress_text(c, t))
 
-    def _display_burst_result(self, result) -> None:
+        # Only the most recent errors are shown, so don't keep the rest
+        recent_errors = deque(maxlen=5)
+
+        def run():
+            try:
+                conn = self._connection
+                if conn and conn.is_connected:
+                    with self._connection_lock:
+                        result = self._tester.burst_test_on(
+                            conn, command,
+                            count=count,
+                            delay_ms=delay,
+                            progress_callback=on_progress,
+                            error_callback=recent_errors.append
+                        )
+                    if not conn.is_connected:
+                        self.after(0, self._on_connection_lost)
+                else:
+                    result = self._tester.burst_test(
+                        ip, port, command,
+                        count=count,
+                        delay_ms=delay,
+                        progress_callback=on_progress,
+                        error_callback=recent_errors.append
+                    )
+                self.after(0, self._display_burst_result, result, list(recent_errors))
+            except Exception as e:
+                logger.error(f"Burst test error: {e}")
+                self.after(0, self._add_log_entry, f"Burst test error: {e}", "ERROR")
+            finally:
+                self.after(0, self._end_progress)
+                self.after(0, lambda: self.burst_btn.configure(state="normal"))
+
+        self._pool.submit(run)
+
+    def _display_burst_result(self, result, recent_errors: List[str]) -> None:
         """Display burst test results."""
+        self._set_progress(f"Burst complete: {result.successful_commands}/{result.total_commands}")
         self._add_log_entry("=" * 50, "INFO")
         self._add_log_entry("BURST TEST RESULTS", "INFO")
         self._add_log_entry(f"Commands: {result.total_commands}", "INFO")
@@ -395,9 +535,9 @@ class CommandsFrame(ctk.CTkFrame):
             self._add_log_entry(f"Avg Response: {result.avg_response_ms:.1f}ms", "INFO")
             self._add_log_entry(f"Min/Max: {result.min_response_ms:.1f}ms / {result.max_response_ms:.1f}ms", "INFO")
 
-        if result.errors:
-            self._add_log_entry("Errors:", "ERROR")
-            for error in result.errors[:5]:
+        if recent_errors:
+            self._add_log_entry("Recent errors:", "ERROR")
+            for error in recent_errors:
                 self._add_log_entry(f"  {error}", "ERROR")
 
         self._add_log_entry("=" * 50, "INFO")
@@ -436,18 +576,23 @@ class CommandsFrame(ctk.CTkFrame):
         self.find_delay_btn.configure(state="disabled")
 
         def run():
-            result = self._tester.find_optimal_delay(
-                ip, port, command,
-                delays_to_test=self.config.command_test_delays_ms,
-                commands_per_test=10,
-                progress_callback=lambda phase, c, t: self.after(
-                    0, lambda: self._add_log_entry(phase, "INFO")
+            try:
+                result = self._tester.find_optimal_delay(
+                    ip, port, command,
+                    delays_to_test=self.config.command_test_delays_ms,
+                    commands_per_test=10,
+                    progress_callback=lambda phase, c, t: self.after(
+                        0, self._add_log_entry, phase, "INFO"
+                    )
                 )
-            )
-            self.after(0, lambda: self._display_optimal_delay_result(result))
-            self.after(0, lambda: self.find_delay_btn.configure(state="normal"))
-
-        threading.Thread(target=run, daemon=True).start()
+                self.after(0, self._display_optimal_delay_result, result)
+            except Exception as e:
+                logger.error(f"Optimal delay error: {e}")
+                self.after(0, self._add_log_entry, f"Optimal delay error: {e}", "ERROR")
+            finally:
+                self.after(0, lambda: self.find_delay_btn.configure(state="normal"))
+
+        self._pool.submit(run)
 
     def _display_optimal_delay_result(self, result) -> None:
         """Display optimal delay analysis."""
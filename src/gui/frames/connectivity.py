@@ -1,18 +1,25 @@
 """Connectivity testing tab frame."""
 
 import customtkinter as ctk
-import threading
-from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Callable, Dict, List, Tuple, Union
 
 from ...network import ConnectivityTester
 from ...utils import get_logger, Config
 from ..components import ResultCard
 from ..components.result_card import ResultStatus
+from ..fonts import get_font
+from ..progress import ProgressMixin
 
 logger = get_logger(__name__)
 
+# Section heading plus (title, status, message, details) rows for its result cards;
+# details may be a callable that ResultCard only calls when expanded
+RenderedSection = Tuple[str, List[Tuple[str, ResultStatus, str, Union[str, Callable[[], str]]]]]
 
-class ConnectivityFrame(ctk.CTkFrame):
+
+class ConnectivityFrame(ProgressMixin, ctk.CTkFrame):
     """
     Frame for connectivity testing functionality.
     """
@@ -30,9 +37,17 @@ class ConnectivityFrame(ctk.CTkFrame):
         self._get_target_ip = get_target_ip
         self._tester = ConnectivityTester()
         self._is_testing = False
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-worker")
+
+        self._init_progress()
 
         self._build_ui()
 
+    def destroy(self) -> None:
+        """Stop the background workers before destroying the frame."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def _build_ui(self) -> None:
         """Build the connectivity UI."""
         self.grid_columnconfigure(0, weight=1)
@@ -54,7 +69,7 @@ class ConnectivityFrame(ctk.CTkFrame):
             controls,
             text="Extended Ping",
             command=self._run_ping_test,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=130
         )
         self.ping_btn.pack(side="left", padx=10)
@@ -63,7 +78,7 @@ class ConnectivityFrame(ctk.CTkFrame):
             controls,
             text="Port Scan",
             command=self._run_port_scan,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.port_btn.pack(side="left", padx=5)
@@ -72,7 +87,7 @@ class ConnectivityFrame(ctk.CTkFrame):
             controls,
             text="HTTP Endpoints",
             command=self._run_http_test,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=130
         )
         self.http_btn.pack(side="left", padx=5)
@@ -81,18 +96,19 @@ class ConnectivityFrame(ctk.CTkFrame):
             controls,
             text="Run All Tests",
             command=self._run_all_tests,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color="green",
             hover_color="darkgreen",
             width=130
         )
         self.full_btn.pack(side="left", padx=20)
 
-        # Progress
+        # Progress (text is driven through the bound variable)
+        self._progress_var = ctk.StringVar(value="")
         self.progress_label = ctk.CTkLabel(
             controls,
-            text="",
-            font=ctk.CTkFont(size=12)
+            textvariable=self._progress_var,
+            font=get_font(12)
         )
         self.progress_label.pack(side="right", padx=10)
 
@@ -102,16 +118,23 @@ class ConnectivityFrame(ctk.CTkFrame):
         self.results_scroll.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         self.results_scroll.grid_columnconfigure(0, weight=1)
 
-        # Section headers and result cards will be added dynamically
-        self._ping_section = None
-        self._ports_section = None
-        self._http_section = None
+        self._results_container = ctk.CTkFrame(self.results_scroll, fg_color="transparent")
+        self._results_container.pack(fill="both", expand=True)
+
+        # Sections are built on first use, then hidden and refilled on later runs
+        # so their ResultCards are reconfigured instead of recreated
+        self._summary: Optional[ctk.CTkFrame] = None
+        self._summary_label: Optional[ctk.CTkLabel] = None
+        # Section name -> (frame, heading, cards), plus how many cards are packed
+        self._sections: Dict[str, Tuple[ctk.CTkFrame, ctk.CTkLabel, List[ResultCard]]] = {}
+        self._visible_cards: Dict[str, int] = {}
 
     def _check_ip(self) -> Optional[str]:
         """Check if target IP is set."""
         ip = self._get_target_ip()
         if not ip:
-            self.progress_label.configure(text="No target IP set!", text_color="red")
+            self.progress_label.configure(text_color="red")
+            self._progress_var.set("No target IP set!")
             return None
         return ip
 
@@ -123,38 +146,28 @@ class ConnectivityFrame(ctk.CTkFrame):
 
         self.ping_btn.configure(state="disabled")
         self._clear_section("ping")
+        self._begin_progress()
 
         def run():
             try:
                 result = self._tester.ping_extended(
                     ip, count=10,
-                    progress_callback=lambda c, t: self.after(
-                        0, lambda: self.progress_label.configure(text=f"Ping {c}/{t}")
-                    )
+                    progress_callback=lambda c, t: self._post_progress(f"Ping {c}/{t}")
                 )
-                self.after(0, lambda: self._display_ping_result(result))
+                rendered = self._render_ping(result)
+                self.after(0, lambda: self._display_ping_result(rendered))
             except Exception as e:
                 logger.error(f"Ping test error: {e}")
-                self.after(0, lambda: self.progress_label.configure(text=f"Error: {e}"))
+                self.after(0, self._set_progress, f"Error: {e}")
             finally:
+                self.after(0, self._end_progress)
                 self.after(0, lambda: self.ping_btn.configure(state="normal"))
 
-        threading.Thread(target=run, daemon=True).start()
-
-    def _display_ping_result(self, result) -> None:
-        """Display ping test results."""
-        self._clear_section("ping")
-
-        section = ctk.CTkFrame(self.results_scroll)
-        section.pack(fill="x", pady=5)
-        section._section_name = "ping"
-
-        ctk.CTkLabel(
-            section,
-            text="Ping Results",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=10, pady=5)
+        self._pool.submit(run)
 
+    @staticmethod
+    def _render_ping(result) -> RenderedSection:
+        """Format ping results as card rows (safe to call off the UI thread)."""
         if result.is_reachable:
             status = ResultStatus.PASSED
             msg = f"{result.packets_received}/{result.packets_sent} packets, " \
@@ -168,11 +181,51 @@ class ConnectivityFrame(ctk.CTkFrame):
             msg = "Host unreachable"
             details = f"Sent {result.packets_sent} packets, received {result.packets_received}"
 
-        card = ResultCard(section, "ICMP Ping", status, msg, details)
-        card.pack(fill="x", padx=5, pady=2)
+        return "Ping Results", [("ICMP Ping", status, msg, details)]
+
+    def _display_ping_result(self, rendered: RenderedSection) -> None:
+        """Display ping test results."""
+        self._display_section("ping", rendered)
+        self._set_progress("Ping complete")
+
+    def _display_section(self, name: str, rendered: RenderedSection) -> None:
+        """Show a result section from pre-formatted card rows, reusing its cards."""
+        heading, rows = rendered
+
+        entry = self._sections.get(name)
+        if entry is None:
+            section = ctk.CTkFrame(self._results_container)
+            heading_label = ctk.CTkLabel(
+                section,
+                text=heading,
+                font=get_font(16, "bold")
+            )
+            heading_label.pack(anchor="w", padx=10, pady=5)
+            cards: List[ResultCard] = []
+            self._sections[name] = (section, heading_label, cards)
+        else:
+            section, heading_label, cards = entry
+            section.pack_forget()
+            heading_label.configure(text=heading)
+
+        visible = self._visible_cards.get(name, 0)
+        for i, (title, status, msg, details) in enumerate(rows):
+            if i < len(cards):
+                card = cards[i]
+                card.reconfigure(title, status, msg, details)
+                if i >= visible:
+                    card.pack(fill="x", padx=5, pady=2)
+            else:
+                card = ResultCard(section, title, status, msg, details)
+                card.pack(fill="x", padx=5, pady=2)
+                cards.append(card)
+
+        for card in cards[len(rows):visible]:
+            card.pack_forget()
+        self._visible_cards[name] = len(rows)
 
-        self.progress_label.configure(text="Ping complete")
-        self._ping_section = section
+        # Re-pack last so the section follows whatever is already shown
+        section.pack(fill="x", pady=5)
 
     def _run_port_scan(self) -> None:
         """Run port scan."""
@@ -182,56 +235,58 @@ class ConnectivityFrame(ctk.CTkFrame):
 
         self.port_btn.configure(state="disabled")
         self._clear_section("ports")
+        self._begin_progress()
 
         def run():
             try:
                 results = self._tester.scan_ports(
                     ip, self.config.common_ports,
-                    progress_callback=lambda c, t, p: self.after(
-                        0, lambda: self.progress_label.configure(text=f"Scanning port {p}")
-                    )
+                    progress_callback=lambda c, t, p: self._post_progress(f"Scanned {c}/{t} ports"),
+                    max_workers=self.config.port_scan_concurrency,
+                    timeout=self.config.port_scan_timeout
                 )
-                self.after(0, lambda: self._display_port_results(results))
+                rendered = self._render_ports(results)
+                self.after(0, lambda: self._display_port_results(rendered))
             except Exception as e:
                 logger.error(f"Port scan error: {e}")
             finally:
+                self.after(0, self._end_progress)
                 self.after(0, lambda: self.port_btn.configure(state="normal"))
 
-        threading.Thread(target=run, daemon=True).start()
-
-    def _display_port_results(self, results) -> None:
-        """Display port scan results."""
-        self._clear_section("ports")
-
-        section = ctk.CTkFrame(self.results_scroll)
-        section.pack(fill="x", pady=5)
-        section._section_name = "ports"
-
-        open_ports = [r for r in results if r.is_open]
-
-        ctk.CTkLabel(
-            section,
-            text=f"Port Scan Results ({len(open_ports)} open)",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=10, pady=5)
-
+        self._pool.submit(run)
+
+    @staticmethod
+    def _port_details(result) -> str:
+        """Details text for an open port (built when its card is first expanded)."""
+        details = f"Response time: {result.response_time_ms:.1f}ms"
+        if result.banner:
+            details += f"\nBanner: {result.banner}"
+        return details
+
+    @staticmethod
+    def _render_ports(results) -> RenderedSection:
+        """Format port scan results as card rows (safe to call off the UI thread)."""
+        rows = []
+        open_count = 0
         for result in results:
             if result.is_open:
+                open_count += 1
                 status = ResultStatus.PASSED
                 msg = f"OPEN - {result.service_name or 'Unknown service'}"
-                details = f"Response time: {result.response_time_ms:.1f}ms"
-                if result.banner:
-                    details += f"\nBanner: {result.banner}"
+                details = partial(ConnectivityFrame._port_details, result)
             else:
                 status = ResultStatus.FAILED
                 msg = "CLOSED"
                 details = ""
 
-            card = ResultCard(section, f"Port {result.port}", status, msg, details)
-            card.pack(fill="x", padx=5, pady=2)
+            rows.append((f"Port {result.port}", status, msg, details))
 
-        self.progress_label.configure(text="Port scan complete")
-        self._ports_section = section
+        return f"Port Scan Results ({open_count} open)", rows
+
+    def _display_port_results(self, rendered: RenderedSection) -> None:
+        """Display port scan results."""
+        self._display_section("ports", rendered)
+        self._set_progress("Port scan complete")
 
     def _run_http_test(self) -> None:
         """Run HTTP endpoint tests."""
@@ -241,58 +296,58 @@ class ConnectivityFrame(ctk.CTkFrame):
 
         self.http_btn.configure(state="disabled")
         self._clear_section("http")
+        self._begin_progress()
 
         def run():
             try:
                 results = self._tester.test_http_endpoints(
                     ip, self.config.http_endpoints,
-                    progress_callback=lambda c, t, e: self.after(
-                        0, lambda: self.progress_label.configure(text=f"Testing {e}")
-                    )
+                    progress_callback=lambda c, t, e: self._post_progress(f"Testing {e}")
                 )
-                self.after(0, lambda: self._display_http_results(results))
+                rendered = self._render_http(results)
+                self.after(0, lambda: self._display_http_results(rendered))
             except Exception as e:
                 logger.error(f"HTTP test error: {e}")
             finally:
+                self.after(0, self._end_progress)
                 self.after(0, lambda: self.http_btn.configure(state="normal"))
 
-        threading.Thread(target=run, daemon=True).start()
-
-    def _display_http_results(self, results) -> None:
-        """Display HTTP test results."""
-        self._clear_section("http")
-
-        section = ctk.CTkFrame(self.results_scroll)
-        section.pack(fill="x", pady=5)
-        section._section_name = "http"
-
-        accessible = [r for r in results if r.is_accessible]
-
-        ctk.CTkLabel(
-            section,
-            text=f"HTTP Endpoints ({len(accessible)} accessible)",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=10, pady=5)
-
+        self._pool.submit(run)
+
+    @staticmethod
+    def _http_details(result) -> str:
+        """Details text for a reachable endpoint (built when its card is first expanded)."""
+        details = f"URL: {result.url}\n" \
+                 f"Content-Type: {result.content_type}\n" \
+                 f"Content-Length: {result.content_length} bytes"
+        if result.title:
+            details += f"\nTitle: {result.title}"
+        return details
+
+    @staticmethod
+    def _render_http(results) -> RenderedSection:
+        """Format HTTP endpoint results as card rows (safe to call off the UI thread)."""
+        rows = []
+        accessible = 0
         for result in results:
             if result.is_accessible:
+                accessible += 1
                 status = ResultStatus.PASSED
                 msg = f"HTTP {result.status_code} - {result.response_time_ms:.0f}ms"
-                details = f"URL: {result.url}\n" \
-                         f"Content-Type: {result.content_type}\n" \
-                         f"Content-Length: {result.content_length} bytes"
-                if result.title:
-                    details += f"\nTitle: {result.title}"
+                details = partial(ConnectivityFrame._http_details, result)
             else:
                 status = ResultStatus.FAILED
                 msg = result.error or "Not accessible"
                 details = f"URL: {result.url}"
 
-            card = ResultCard(section, result.url.split('/')[-1] or "/", status, msg, details)
-            card.pack(fill="x", padx=5, pady=2)
+            rows.append((result.url.split('/')[-1] or "/", status, msg, details))
+
+        return f"HTTP Endpoints ({accessible} accessible)", rows
 
-        self.progress_label.configure(text="HTTP test complete")
-        self._http_section = section
+    def _display_http_results(self, rendered: RenderedSection) -> None:
+        """Display HTTP test results."""
+        self._display_section("http", rendered)
+        self._set_progress("HTTP test complete")
 
     def _run_all_tests(self) -> None:
         """Run all connectivity tests."""
@@ -302,6 +357,7 @@ class ConnectivityFrame(ctk.CTkFrame):
 
         self.full_btn.configure(state="disabled")
         self._clear_all_sections()
+        self._begin_progress()
 
         def run():
             try:
@@ -309,26 +365,21 @@ class ConnectivityFrame(ctk.CTkFrame):
                     ip,
                     self.config.common_ports,
                     self.config.http_endpoints,
-                    progress_callback=lambda phase, c, t: self.after(
-                        0, lambda: self.progress_label.configure(text=f"{phase}: {c}/{t}")
-                    )
+                    progress_callback=lambda phase, c, t: self._post_progress(f"{phase}: {c}/{t}"),
+                    max_workers=self.config.port_scan_concurrency
                 )
-                self.after(0, lambda: self._display_full_report(report))
+                rendered = self._prerender_report(report)
+                self.after(0, lambda: self._display_full_report(rendered))
             except Exception as e:
                 logger.error(f"Full test error: {e}")
             finally:
+                self.after(0, self._end_progress)
                 self.after(0, lambda: self.full_btn.configure(state="normal"))
 
-        threading.Thread(target=run, daemon=True).start()
-
-    def _display_full_report(self, report) -> None:
-        """Display full connectivity report."""
-        self._clear_all_sections()
-
-        # Summary
-        summary = ctk.CTkFrame(self.results_scroll)
-        summary.pack(fill="x", pady=5)
+        self._pool.submit(run)
 
+    def _prerender_report(self, report) -> dict:
+        """Format a full report for display (worker thread, no Tk calls)."""
         status_colors = {
             "healthy": "green",
             "partial": "orange",
@@ -336,32 +387,56 @@ class ConnectivityFrame(ctk.CTkFrame):
             "unreachable": "red"
         }
 
-        ctk.CTkLabel(
-            summary,
-            text=f"Overall Status: {report.overall_status.upper()}",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=status_colors.get(report.overall_status, "gray")
-        ).pack(pady=10)
+        return {
+            "status_text": f"Overall Status: {report.overall_status.upper()}",
+            "status_color": status_colors.get(report.overall_status, "gray"),
+            "ping": self._render_ping(report.ping_result) if report.ping_result else None,
+            "ports": self._render_ports(report.open_ports) if report.open_ports else None,
+            "http": self._render_http(report.http_endpoints) if report.http_endpoints else None,
+        }
+
+    def _display_full_report(self, rendered: dict) -> None:
+        """Display full connectivity report."""
+        self._clear_all_sections()
+
+        # Summary
+        if self._summary is None:
+            self._summary = ctk.CTkFrame(self._results_container)
+            self._summary_label = ctk.CTkLabel(
+                self._summary,
+                text=rendered["status_text"],
+                font=get_font(18, "bold"),
+                text_color=rendered["status_color"]
+            )
+            self._summary_label.pack(pady=10)
+        else:
+            self._summary_label.configure(
+                text=rendered["status_text"],
+                text_color=rendered["status_color"]
+            )
+        self._summary.pack(fill="x", pady=5)
 
         # Display individual sections
-        if report.ping_result:
-            self._display_ping_result(report.ping_result)
+        if rendered["ping"]:
+            self._display_section("ping", rendered["ping"])
 
-        if report.open_ports:
-            self._display_port_results(report.open_ports)
+        if rendered["ports"]:
+            self._display_section("ports", rendered["ports"])
 
-        if report.http_endpoints:
-            self._display_http_results(report.http_endpoints)
+        if rendered["http"]:
+            self._display_section("http", rendered["http"])
 
-        self.progress_label.configure(text="All tests complete")
+        self._set_progress("All tests complete")
 
     def _clear_section(self, name: str) -> None:
-        """Clear a specific section."""
-        for widget in self.results_scroll.winfo_children():
-            if hasattr(widget, '_section_name') and widget._section_name == name:
-                widget.destroy()
+        """Hide a specific section, keeping its cards for the next run."""
+        entry = self._sections.get(name)
+        if entry is not None:
+            entry[0].pack_forget()
 
     def _clear_all_sections(self) -> None:
-        """Clear all result sections."""
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        """Hide all result sections."""
+        if self._summary is not None:
+            self._summary.pack_forget()
+        for name in ("ping", "ports", "http"):
+            self._clear_section(name)
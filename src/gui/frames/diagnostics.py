@@ -2,12 +2,20 @@
 
 import customtkinter as ctk
 import threading
-import json
-import math
-from typing import Optional, Callable, Dict, Any, List
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from html import escape
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ...network import (
     NetworkDiscovery,
     ConnectivityTester,
@@ -18,9 +26,81 @@ from ...network import (
 from ...utils import get_logger, Config
 from ..components import ResultCard
 from ..components.result_card import ResultStatus, EnhancedIssueCard
+from ..fonts import get_font
+from ..progress import ProgressMixin
 
 logger = get_logger(__name__)
 
+# The MK3 answers to the hostname "DSP"; resolved names are matched on this token
+_DSP_TOKEN = "dsp"
+
+# Operational systems list: (test key, icon, name, status text from the test data)
+_WORKING_SPECS: Tuple[Tuple[str, str, str, Callable[[Dict[str, Any]], str]], ...] = (
+    ("reachability", "📡", "Network Reachability",
+     lambda t: f"{t.get('details', {}).get('avg_latency_ms', 0):.1f}ms"),
+    ("ports", "🔌", "Port Availability", lambda t: f"{len(t.get('open_ports', []))} ports"),
+    ("http", "🌐", "Web Interface", lambda t: "Online"),
+    ("dns", "📋", "DNS Configuration", lambda t: "Working"),
+    ("hostname", "🏷️", "Hostname Resolution", lambda t: "Resolved"),
+    ("commands", "⚡", "Command Protocol", lambda t: f"Port {t.get('port', '?')}"),
+)
+
+# Testers shared by every DiagnosticsFrame, so a recreated frame keeps their
+# HTTP sessions and caches instead of starting cold
+_TESTERS: Dict[type, Any] = {}
+
+
+def _shared_tester(tester_cls: type) -> Any:
+    """Get the module-wide instance of a tester class, creating it on first use."""
+    tester = _TESTERS.get(tester_cls)
+    if tester is None:
+        tester = _TESTERS[tester_cls] = tester_cls()
+    return tester
+
+
+@dataclass(slots=True)
+class DiagSummary:
+    """Outcome counts for one diagnostic run."""
+    passed: int = 0
+    warnings: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    @property
+    def rated(self) -> int:
+        """Number of tests that count toward the health score (skipped ones don't)."""
+        return self.passed + self.warnings + self.failed
+
+    @property
+    def health_score(self) -> float:
+        """Health score in percent: passed tests count fully, warnings half, failures not at all."""
+        rated = self.rated
+        return (self.passed * 100 + self.warnings * 50) / rated if rated else 0.0
+
+
+@dataclass(slots=True)
+class DiagResults:
+    """Results of one diagnostic run, as exported to JSON and HTML."""
+    timestamp: str = ""
+    ip_address: str = ""
+    tests: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    summary: DiagSummary = field(default_factory=DiagSummary)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain dict layout used by the JSON export (test data is not copied)."""
+        summary = self.summary
+        return {
+            'timestamp': self.timestamp,
+            'ip_address': self.ip_address,
+            'tests': self.tests,
+            'summary': {
+                'passed': summary.passed,
+                'warnings': summary.warnings,
+                'failed': summary.failed,
+                'skipped': summary.skipped,
+            },
+        }
+
 
 # Professional Enterprise Color Palette
 COLORS = {
@@ -53,9 +133,167 @@ COLORS = {
 }
 
 
+# Static parts of the HTML report; _export_html only formats the per-run values
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>MK3 Diagnostic Report</title>
+    <style>
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: linear-gradient(135deg, #0a0a0f 0%, #111827 100%);
+            color: #f9fafb;
+            min-height: 100vh;
+            padding: 40px;
+        }
+        .container { max-width: 1000px; margin: 0 auto; }
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            padding: 40px;
+            background: #1f2937;
+            border-radius: 16px;
+            border: 1px solid #374151;
+        }
+        .header h1 { font-size: 32px; margin-bottom: 8px; }
+        .header .subtitle { color: #9ca3af; font-size: 14px; }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 16px;
+            margin-bottom: 32px;
+        }
+        .stat-card {
+            background: #1f2937;
+            border-radius: 12px;
+            padding: 24px;
+            text-align: center;
+            border: 1px solid #374151;
+        }
+        .stat-value { font-size: 36px; font-weight: bold; }
+        .stat-label { color: #9ca3af; font-size: 12px; margin-top: 8px; }
+        .passed { color: #10b981; }
+        .warning { color: #f59e0b; }
+        .failed { color: #ef4444; }
+        .info { color: #3b82f6; }
+        .section {
+            background: #1f2937;
+            border-radius: 12px;
+            padding: 24px;
+            margin-bottom: 24px;
+            border: 1px solid #374151;
+        }
+        .section h2 {
+            font-size: 18px;
+            margin-bottom: 20px;
+            padding-bottom: 12px;
+            border-bottom: 1px solid #374151;
+        }
+        .test-item {
+            display: flex;
+            align-items: center;
+            padding: 16px;
+            background: #111827;
+            border-radius: 8px;
+            margin-bottom: 12px;
+        }
+        .test-status {
+            width: 12px;
+            height: 12px;
+            border-radius: 50%;
+            margin-right: 16px;
+        }
+        .test-name { font-weight: 600; flex: 1; }
+        .badge {
+            padding: 4px 12px;
+            border-radius: 6px;
+            font-size: 12px;
+            font-weight: 600;
+        }
+        .badge-passed { background: #064e3b; color: #10b981; }
+        .badge-warning { background: #451a03; color: #f59e0b; }
+        .badge-failed { background: #450a0a; color: #ef4444; }
+        .footer {
+            text-align: center;
+            color: #6b7280;
+            font-size: 12px;
+            margin-top: 40px;
+        }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_SUMMARY = """    <div class="container">
+        <div class="header">
+            <h1>🔬 MK3 Diagnostic Report</h1>
+            <p class="subtitle">Generated: {timestamp} • Target: {ip_address}</p>
+        </div>
+
+        <div class="summary">
+            <div class="stat-card">
+                <div class="stat-value info">{health_score:.0f}%</div>
+                <div class="stat-label">HEALTH SCORE</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value passed">{passed}</div>
+                <div class="stat-label">PASSED</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value warning">{warnings}</div>
+                <div class="stat-label">WARNINGS</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value failed">{failed}</div>
+                <div class="stat-label">FAILED</div>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Test Results</h2>
+"""
+
+_HTML_TEST_ROW = """
+            <div class="test-item">
+                <div class="test-status" style="background: {color};"></div>
+                <span class="test-name">{name}</span>
+                <span class="badge {badge_class}">{status_text}</span>
+            </div>
+"""
+
+_HTML_FOOTER = """
+        </div>
+
+        <div class="footer">
+            <p>MK3 Amplifier Network Diagnostic Tool v1.1.0 • Sonance</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
 class CircularGauge(ctk.CTkFrame):
     """A visual circular gauge for displaying health score."""
 
+    # (minimum fraction, arc color), checked in order
+    ARC_BANDS = (
+        (0.8, COLORS["success"]),
+        (0.5, COLORS["warning"]),
+        (float("-inf"), COLORS["error"]),
+    )
+
+    # (minimum percentage, status text, color), checked in order
+    SCORE_LEVELS = (
+        (80, "EXCELLENT", COLORS["success"]),
+        (60, "GOOD", COLORS["success_light"]),
+        (40, "FAIR", COLORS["warning"]),
+        (float("-inf"), "NEEDS ATTENTION", COLORS["error"]),
+    )
+
     def __init__(self, master, size: int = 180, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
 
@@ -63,14 +301,20 @@ class CircularGauge(ctk.CTkFrame):
         self._value = 0
         self._max_value = 100
         self._canvas = None
-        self._label = None
-        self._status_label = None
+        # Canvas item ids; updates reconfigure these items instead of redrawing
+        self._value_arc = None
+        self._value_text = None
+        self._status_text = None
+        # (extent, color) last applied to the value arc; None while it is hidden
+        self._drawn_arc = None
+        # Last (text, color) of the center value and last status label shown
+        self._shown_value = None
+        self._shown_status = None
 
         self._build_ui()
 
     def _build_ui(self):
-        """Build the gauge UI."""
-        # Create canvas for the arc
+        """Build the gauge UI: track and value arcs plus the value and status text."""
         self._canvas = ctk.CTkCanvas(
             self,
             width=self._size,
@@ -80,37 +324,12 @@ class CircularGauge(ctk.CTkFrame):
         )
         self._canvas.pack()
 
-        # Center value label
-        self._label = ctk.CTkLabel(
-            self,
-            text="--",
-            font=ctk.CTkFont(size=42, weight="bold"),
-            text_color=COLORS["text_primary"]
-        )
-        self._label.place(relx=0.5, rely=0.42, anchor="center")
-
-        # Status label below value
-        self._status_label = ctk.CTkLabel(
-            self,
-            text="HEALTH SCORE",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            text_color=COLORS["text_muted"]
-        )
-        self._status_label.place(relx=0.5, rely=0.62, anchor="center")
-
-        self._draw_gauge()
-
-    def _draw_gauge(self):
-        """Draw the gauge arc."""
-        self._canvas.delete("all")
-
         padding = 15
-        x0, y0 = padding, padding
-        x1, y1 = self._size - padding, self._size - padding
+        bbox = (padding, padding, self._size - padding, self._size - padding)
 
         # Background arc (full circle track)
         self._canvas.create_arc(
-            x0, y0, x1, y1,
+            *bbox,
             start=135,
             extent=-270,
             style="arc",
@@ -118,28 +337,65 @@ class CircularGauge(ctk.CTkFrame):
             width=12
         )
 
+        # Value arc, hidden until there is a value to show
+        self._value_arc = self._canvas.create_arc(
+            *bbox,
+            start=135,
+            extent=-1,
+            style="arc",
+            outline=COLORS["error"],
+            width=12,
+            state="hidden"
+        )
+
+        # Center value text
+        self._value_text = self._canvas.create_text(
+            self._size / 2,
+            self._size * 0.42,
+            text="--",
+            font=get_font(42, "bold"),
+            fill=COLORS["text_primary"]
+        )
+
+        # Status text below value
+        self._status_text = self._canvas.create_text(
+            self._size / 2,
+            self._size * 0.62,
+            text="HEALTH SCORE",
+            font=get_font(10, "bold"),
+            fill=COLORS["text_muted"]
+        )
+
+    def _draw_gauge(self):
+        """Update the value arc's extent and color."""
         # Calculate arc extent based on value
-        percentage = min(self._value / self._max_value, 1.0)
+        percentage = min(self._value / self._max_value, 1.0) if self._max_value > 0 else 0.0
         extent = -270 * percentage
 
+        if extent == 0:
+            if self._drawn_arc is not None:
+                self._canvas.itemconfigure(self._value_arc, state="hidden")
+                self._drawn_arc = None
+            return
+
         # Determine color based on percentage
-        if percentage >= 0.8:
-            color = COLORS["success"]
-        elif percentage >= 0.5:
-            color = COLORS["warning"]
-        else:
-            color = COLORS["error"]
-
-        # Value arc
-        if extent != 0:
-            self._canvas.create_arc(
-                x0, y0, x1, y1,
-                start=135,
-                extent=extent,
-                style="arc",
-                outline=color,
-                width=12
-            )
+        color = next(color for floor, color in self.ARC_BANDS if percentage >= floor)
+
+        # Skip the canvas update (and its repaint) when nothing changed
+        if self._drawn_arc == (extent, color):
+            return
+        self._canvas.itemconfigure(self._value_arc, extent=extent, outline=color, state="normal")
+        self._drawn_arc = (extent, color)
+
+    def reset(self):
+        """Return the gauge to its empty state."""
+        self._value = 0
+        self._max_value = 100
+        self._shown_value = None
+        self._shown_status = None
+        self._canvas.itemconfigure(self._value_text, text="--", fill=COLORS["text_primary"])
+        self._canvas.itemconfigure(self._status_text, text="HEALTH SCORE", fill=COLORS["text_muted"])
+        self._draw_gauge()
 
     def set_value(self, value: float, max_value: float = 100):
         """Set the gauge value."""
@@ -149,25 +405,20 @@ class CircularGauge(ctk.CTkFrame):
         # Calculate percentage
         percentage = (value / max_value) * 100 if max_value > 0 else 0
 
-        # Update label
-        self._label.configure(text=f"{percentage:.0f}%")
-
         # Update status text and color
-        if percentage >= 80:
-            status = "EXCELLENT"
-            color = COLORS["success"]
-        elif percentage >= 60:
-            status = "GOOD"
-            color = COLORS["success_light"]
-        elif percentage >= 40:
-            status = "FAIR"
-            color = COLORS["warning"]
-        else:
-            status = "NEEDS ATTENTION"
-            color = COLORS["error"]
+        status, color = next(
+            (status, color) for floor, status, color in self.SCORE_LEVELS if percentage >= floor
+        )
 
-        self._status_label.configure(text=status, text_color=color)
-        self._label.configure(text_color=color)
+        # The two texts change independently: the value with every whole
+        # percent, the status only when the score crosses a level
+        shown = (f"{percentage:.0f}%", color)
+        if shown != self._shown_value:
+            self._canvas.itemconfigure(self._value_text, text=shown[0], fill=color)
+            self._shown_value = shown
+        if status != self._shown_status:
+            self._canvas.itemconfigure(self._status_text, text=status, fill=color)
+            self._shown_status = status
 
         self._draw_gauge()
 
@@ -197,17 +448,18 @@ class MetricCard(ctk.CTkFrame):
 
         self._title = title
         self._color = color
+        self._value = value
+        self._subtitle = subtitle
 
         self._build_ui(title, value, subtitle, icon, color, trend)
 
     def _build_ui(self, title: str, value: str, subtitle: str, icon: str, color: str, trend: Optional[str]):
         """Build the metric card UI."""
-        container = ctk.CTkFrame(self, fg_color="transparent")
-        container.pack(fill="both", expand=True, padx=16, pady=14)
+        # Rows are packed straight into the card, each carrying its own padding
 
         # Top row with icon and trend
-        top_row = ctk.CTkFrame(container, fg_color="transparent")
-        top_row.pack(fill="x")
+        top_row = ctk.CTkFrame(self, fg_color="transparent")
+        top_row.pack(fill="x", padx=16, pady=(14, 0))
 
         # Icon with colored background
         icon_bg = ctk.CTkFrame(
@@ -223,14 +475,14 @@ class MetricCard(ctk.CTkFrame):
         ctk.CTkLabel(
             icon_bg,
             text=icon,
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # Title
         ctk.CTkLabel(
             top_row,
             text=title,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         ).pack(side="left", padx=(12, 0))
 
@@ -250,33 +502,36 @@ class MetricCard(ctk.CTkFrame):
             ctk.CTkLabel(
                 trend_badge,
                 text=trend_icons.get(trend, "→"),
-                font=ctk.CTkFont(size=10, weight="bold"),
+                font=get_font(10, "bold"),
                 text_color="white"
             ).pack(padx=6, pady=2)
 
         # Value
         self._value_label = ctk.CTkLabel(
-            container,
+            self,
             text=value,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=get_font(28, "bold"),
             text_color=COLORS["text_primary"]
         )
-        self._value_label.pack(anchor="w", pady=(10, 2))
+        self._value_label.pack(anchor="w", padx=16, pady=(10, 2))
 
         # Subtitle
         self._subtitle_label = ctk.CTkLabel(
-            container,
+            self,
             text=subtitle,
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=COLORS["text_secondary"]
         )
-        self._subtitle_label.pack(anchor="w")
+        self._subtitle_label.pack(anchor="w", padx=16, pady=(0, 14))
 
     def update_value(self, value: str, subtitle: str = None):
-        """Update the metric value."""
-        self._value_label.configure(text=value)
-        if subtitle is not None:
+        """Update the metric value; labels are only reconfigured when their text changes."""
+        if value != self._value:
+            self._value_label.configure(text=value)
+            self._value = value
+        if subtitle is not None and subtitle != self._subtitle:
             self._subtitle_label.configure(text=subtitle)
+            self._subtitle = subtitle
 
 
 class TestStatusIndicator(ctk.CTkFrame):
@@ -309,38 +564,37 @@ class TestStatusIndicator(ctk.CTkFrame):
 
     def _build_ui(self, name: str, config: dict):
         """Build the indicator UI."""
-        container = ctk.CTkFrame(self, fg_color="transparent")
-        container.pack(fill="x", padx=12, pady=8)
-
         # Status icon
         self._icon_label = ctk.CTkLabel(
-            container,
+            self,
             text=config["icon"],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=config["color"]
         )
-        self._icon_label.pack(side="left")
+        self._icon_label.pack(side="left", padx=(12, 0), pady=8)
 
         # Test name
         self._name_label = ctk.CTkLabel(
-            container,
+            self,
             text=name,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLORS["text_primary"]
         )
-        self._name_label.pack(side="left", padx=(8, 0))
+        self._name_label.pack(side="left", padx=(8, 0), pady=8)
 
         # Status text
         self._status_label = ctk.CTkLabel(
-            container,
-            text=status.upper(),
-            font=ctk.CTkFont(size=10, weight="bold"),
+            self,
+            text=self._status.upper(),
+            font=get_font(10, "bold"),
             text_color=config["color"]
         )
-        self._status_label.pack(side="right")
+        self._status_label.pack(side="right", padx=(0, 12), pady=8)
 
     def set_status(self, status: str):
         """Update the indicator status."""
+        if status == self._status:
+            return
         self._status = status
         config = self.STATUS_CONFIG.get(status, self.STATUS_CONFIG["pending"])
 
@@ -352,6 +606,22 @@ class TestStatusIndicator(ctk.CTkFrame):
 class ProgressStep(ctk.CTkFrame):
     """A single step in a progress timeline."""
 
+    STATUS_COLORS = {
+        "pending": COLORS["text_muted"],
+        "running": COLORS["info"],
+        "passed": COLORS["success"],
+        "failed": COLORS["error"],
+        "warning": COLORS["warning"],
+    }
+
+    # Circle icon per status; pending (and unknown) steps show their number
+    STATUS_ICONS = {
+        "running": "◉",
+        "passed": "✓",
+        "failed": "✗",
+        "warning": "!",
+    }
+
     def __init__(self, master, step_num: int, name: str, status: str = "pending", is_last: bool = False, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
 
@@ -359,6 +629,7 @@ class ProgressStep(ctk.CTkFrame):
         self._name = name
         self._status = status
         self._is_last = is_last
+        self._line = None
 
         self._build_ui()
 
@@ -373,14 +644,7 @@ class ProgressStep(ctk.CTkFrame):
         indicator_frame.grid_propagate(False)
 
         # Circle indicator
-        status_colors = {
-            "pending": COLORS["text_muted"],
-            "running": COLORS["info"],
-            "passed": COLORS["success"],
-            "failed": COLORS["error"],
-            "warning": COLORS["warning"],
-        }
-        color = status_colors.get(self._status, COLORS["text_muted"])
+        color = self.STATUS_COLORS.get(self._status, COLORS["text_muted"])
 
         self._circle = ctk.CTkFrame(
             indicator_frame,
@@ -395,18 +659,10 @@ class ProgressStep(ctk.CTkFrame):
         self._circle.pack_propagate(False)
 
         # Step number or icon
-        icon_text = {
-            "pending": str(self._step_num),
-            "running": "◉",
-            "passed": "✓",
-            "failed": "✗",
-            "warning": "!",
-        }
-
         self._icon_label = ctk.CTkLabel(
             self._circle,
-            text=icon_text.get(self._status, str(self._step_num)),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text=self.STATUS_ICONS.get(self._status, str(self._step_num)),
+            font=get_font(12, "bold"),
             text_color="white" if self._status != "pending" else color
         )
         self._icon_label.place(relx=0.5, rely=0.5, anchor="center")
@@ -422,29 +678,21 @@ class ProgressStep(ctk.CTkFrame):
             self._line.place(relx=0.5, rely=1.0, anchor="n", y=-8)
 
         # Content
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.grid(row=0, column=1, sticky="ew", padx=(8, 0), pady=(2, 12))
-
         self._name_label = ctk.CTkLabel(
-            content,
+            self,
             text=self._name,
-            font=ctk.CTkFont(size=13, weight="bold" if self._status == "running" else "normal"),
+            font=get_font(13, "bold" if self._status == "running" else "normal"),
             text_color=color if self._status == "running" else COLORS["text_primary"]
         )
-        self._name_label.pack(anchor="w")
+        self._name_label.grid(row=0, column=1, sticky="w", padx=(8, 0), pady=(2, 12))
 
     def set_status(self, status: str):
         """Update the step status."""
+        if status == self._status:
+            return
+        was_running = self._status == "running"
         self._status = status
-
-        status_colors = {
-            "pending": COLORS["text_muted"],
-            "running": COLORS["info"],
-            "passed": COLORS["success"],
-            "failed": COLORS["error"],
-            "warning": COLORS["warning"],
-        }
-        color = status_colors.get(status, COLORS["text_muted"])
+        color = self.STATUS_COLORS.get(status, COLORS["text_muted"])
 
         # Update circle
         self._circle.configure(
@@ -453,26 +701,22 @@ class ProgressStep(ctk.CTkFrame):
         )
 
         # Update icon
-        icon_text = {
-            "pending": str(self._step_num),
-            "running": "◉",
-            "passed": "✓",
-            "failed": "✗",
-            "warning": "!",
-        }
         self._icon_label.configure(
-            text=icon_text.get(status, str(self._step_num)),
+            text=self.STATUS_ICONS.get(status, str(self._step_num)),
             text_color="white" if status != "pending" else color
         )
 
-        # Update name styling
-        self._name_label.configure(
-            font=ctk.CTkFont(size=13, weight="bold" if status == "running" else "normal"),
-            text_color=color if status == "running" else COLORS["text_primary"]
-        )
+        # Update name styling; it only differs while running, so transitions
+        # between the other statuses leave the label (and its font) alone
+        is_running = status == "running"
+        if is_running != was_running:
+            self._name_label.configure(
+                font=get_font(13, "bold" if is_running else "normal"),
+                text_color=color if is_running else COLORS["text_primary"]
+            )
 
         # Update line
-        if hasattr(self, '_line'):
+        if self._line is not None:
             self._line.configure(
                 fg_color=color if status in ["passed", "running"] else COLORS["border_subtle"]
             )
@@ -481,6 +725,8 @@ class ProgressStep(ctk.CTkFrame):
 class StatBar(ctk.CTkFrame):
     """A horizontal bar showing a statistic visually."""
 
+    BAR_HEIGHT = 8
+
     def __init__(self, master, label: str, value: int, max_value: int, color: str = "#3b82f6", **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
 
@@ -488,6 +734,10 @@ class StatBar(ctk.CTkFrame):
         self._value = value
         self._max_value = max_value
         self._color = color
+        # Canvas and item ids for the bar track and fill
+        self._bar_canvas = None
+        self._bar_track = None
+        self._bar_fill = None
 
         self._build_ui()
 
@@ -500,45 +750,122 @@ class StatBar(ctk.CTkFrame):
         ctk.CTkLabel(
             label_row,
             text=self._label,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLORS["text_secondary"]
         ).pack(side="left")
 
         ctk.CTkLabel(
             label_row,
             text=str(self._value),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=self._color
         ).pack(side="right")
 
-        # Bar background
-        bar_bg = ctk.CTkFrame(
+        # Bar: one canvas with a track and a fill line; round caps give the
+        # rounded ends without nesting two CTkFrames
+        self._bar_canvas = ctk.CTkCanvas(
             self,
-            height=8,
-            corner_radius=4,
-            fg_color=COLORS["bg_elevated"]
+            height=self.BAR_HEIGHT,
+            bg=COLORS["bg_card"],
+            highlightthickness=0
+        )
+        self._bar_canvas.pack(fill="x", pady=(6, 0))
+
+        y = self.BAR_HEIGHT / 2
+        self._bar_track = self._bar_canvas.create_line(
+            0, y, 0, y,
+            width=self.BAR_HEIGHT,
+            capstyle="round",
+            fill=COLORS["bg_elevated"]
         )
-        bar_bg.pack(fill="x", pady=(6, 0))
+        self._bar_fill = self._bar_canvas.create_line(
+            0, y, 0, y,
+            width=self.BAR_HEIGHT,
+            capstyle="round",
+            fill=self._color,
+            state="hidden"
+        )
+        self._bar_canvas.bind("<Configure>", self._layout_bar)
 
-        # Calculate percentage
-        percentage = (self._value / self._max_value) if self._max_value > 0 else 0
+    def _layout_bar(self, event) -> None:
+        """Stretch the track to the canvas width and the fill to the value's share of it."""
+        percentage = min(self._value / self._max_value, 1.0) if self._max_value > 0 else 0
+        half = self.BAR_HEIGHT / 2
+        y = half
+        right = max(event.width - half, half)
 
-        # Bar fill
+        self._bar_canvas.coords(self._bar_track, half, y, right, y)
         if percentage > 0:
-            bar_fill = ctk.CTkFrame(
-                bar_bg,
-                height=8,
-                corner_radius=4,
-                fg_color=self._color
-            )
-            bar_fill.place(relx=0, rely=0.5, anchor="w", relwidth=percentage)
+            self._bar_canvas.coords(self._bar_fill, half, y, half + (right - half) * percentage, y)
+            self._bar_canvas.itemconfigure(self._bar_fill, state="normal")
+        else:
+            self._bar_canvas.itemconfigure(self._bar_fill, state="hidden")
 
 
-class DiagnosticsFrame(ctk.CTkFrame):
+class DiagnosticsFrame(ProgressMixin, ctk.CTkFrame):
     """
     Professional Enterprise Dashboard for running comprehensive diagnostics.
     """
 
+    # Worker UI updates are batched and applied at most once per this interval
+    UI_FLUSH_MS = 33
+
+    # Successful hostname and DNS answers are reused across runs for this many seconds
+    RESOLVE_CACHE_TTL = 60.0
+
+    # Initial (value, subtitle) of each dashboard metric card
+    METRIC_DEFAULTS = {
+        "latency": ("--", "Average response time"),
+        "ports": ("--", "Services detected"),
+        "packet_loss": ("--", "Network reliability"),
+        "web": ("--", "HTTP accessibility"),
+    }
+
+    # Progress segment color for each step status
+    SEGMENT_COLORS = {
+        "running": COLORS["info"],
+        "passed": COLORS["success"],
+        "failed": COLORS["error"],
+        "warning": COLORS["warning"],
+        "skipped": COLORS["text_muted"],
+    }
+    SEGMENT_IDLE_COLOR = COLORS["bg_elevated"]
+    SEGMENT_HEIGHT = 6
+    SEGMENT_GAP = 4
+
+    # Result card title of each step, in step (progress segment) order; the
+    # steps finish in any order but their cards are always listed in this one
+    RESULT_CARDS = (
+        "Network Reachability",
+        "Port Scan",
+        "HTTP Web Interface",
+        "Hostname Resolution",
+        "DNS Configuration",
+        "Command Protocol",
+    )
+
+    # Shared look of the dashboard's cards, resolved from COLORS once
+    CARD_STYLE = {
+        "fg_color": COLORS["bg_card"],
+        "corner_radius": 12,
+        "border_width": 1,
+        "border_color": COLORS["border_subtle"],
+    }
+
+    # Summary banner (text, icon, color, background) for: failures, warnings only, all passed
+    OVERALL_STATUS = (
+        ("ISSUES REQUIRE ATTENTION", "✗", COLORS["error"], COLORS["error_bg"]),
+        ("MINOR ISSUES DETECTED", "!", COLORS["warning"], COLORS["warning_bg"]),
+        ("ALL SYSTEMS OPERATIONAL", "✓", COLORS["success"], COLORS["success_bg"]),
+    )
+
+    # Tests that can produce an issue card in the summary
+    ISSUE_TESTS = ("hostname", "commands", "reachability", "http", "dns")
+
+    # Web endpoints probed by the HTTP step; the landing page marks a healthy UI
+    LANDING_ENDPOINT = "/Landing.htm"
+    HTTP_ENDPOINTS = ("/", LANDING_ENDPOINT, "/index.html")
+
     def __init__(
         self,
         master,
@@ -552,19 +879,74 @@ class DiagnosticsFrame(ctk.CTkFrame):
         self._get_target_ip = get_target_ip
 
         # Testers
-        self._discovery = NetworkDiscovery()
-        self._connectivity = ConnectivityTester()
-        self._dns = DNSTester()
-        self._hostname = HostnameTester()
-        self._commands = CommandTester()
+        self._discovery = _shared_tester(NetworkDiscovery)
+        self._connectivity = _shared_tester(ConnectivityTester)
+        self._dns = _shared_tester(DNSTester)
+        self._hostname = _shared_tester(HostnameTester)
+        self._commands = _shared_tester(CommandTester)
+
+        # Long-lived workers for the scan driver and report exports, plus one
+        # thread per diagnostic step that runs after reachability
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-worker")
+        self._step_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="diag-step")
 
         self._is_running = False
-        self._results = {}
+        self._results = DiagResults()
+        # Diagnostic steps run concurrently and all update self._results
+        self._results_lock = threading.Lock()
+
+        # UI updates posted by worker threads, applied together by _flush_ui
+        self._pending_ui = deque()
+        self._flush_scheduled = False
+        # Worker progress is coalesced by ProgressMixin; only the newest is rendered
+        self._init_progress()
+        # Same for the step segments: index -> latest status, drawn in one pass
+        self._pending_segments: Dict[int, str] = {}
+        self._segments_scheduled = False
+        self._segments_lock = threading.Lock()
         self._test_steps = {}
         self._metric_cards = {}
+        # Filled in by the first run's first result (see _ensure_metrics_built
+        # and _ensure_results_section) rather than with the dashboard header
+        self._dashboard_top_row = None
+        self._results_section = None
+        self._results_container = None
+
+        # Built on first show, then packed and unpacked instead of rebuilt on Clear
+        self.placeholder_frame = None
+
+        # The live dashboard is built on the first run and reset on later ones;
+        # its result cards are kept in a pool and reconfigured rather than recreated
+        self._dashboard = None
+        self._card_pool: List[ResultCard] = []
+        self._cards_in_use = 0
+        # Position in RESULT_CARDS of each card in use, parallel to the pool
+        self._card_ranks: List[int] = []
+        # Summary banner, built on the first completed run and updated after that
+        self._summary_banner = None
+        # Issues section and its cards persist too; a card is keyed by its title
+        # and only rebuilt when its content changed since the last run
+        self._issues_section = None
+        self._issues_inner = None
+        self._issue_cards: Dict[str, Tuple[EnhancedIssueCard, Dict[str, Any]]] = {}
+        # Operational systems section; its rows are pooled and relabelled per run
+        self._working_section = None
+        self._working_inner = None
+        self._working_empty_label = None
+        self._working_rows: List[Tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel]] = []
+        self._working_visible = 0
+
+        # (ip, kind) -> (time fetched, result) for slow, stable lookups
+        self._resolve_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
 
         self._build_ui()
 
+    def destroy(self) -> None:
+        """Stop the background workers before destroying the frame."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._step_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def _build_ui(self) -> None:
         """Build the UI."""
         self.grid_columnconfigure(0, weight=1)
@@ -596,7 +978,7 @@ class DiagnosticsFrame(ctk.CTkFrame):
             left,
             text="▶  Start Diagnostic Scan",
             command=self._run_full_diagnostic,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=get_font(15, "bold"),
             fg_color=COLORS["success"],
             hover_color="#059669",
             text_color="white",
@@ -605,40 +987,47 @@ class DiagnosticsFrame(ctk.CTkFrame):
             corner_radius=10
         )
         self.run_btn.pack(side="left")
+        # Shift-click runs without reusing cached hostname/DNS answers
+        self.run_btn.bind("<Shift-Button-1>", lambda e: self._run_full_diagnostic(force_refresh=True))
 
         # Center: Progress info
         center = ctk.CTkFrame(controls, fg_color="transparent")
         center.pack(side="left", fill="x", expand=True, padx=32)
 
+        self._progress_var = ctk.StringVar(value="Ready to diagnose • Enter target IP above")
         self.progress_label = ctk.CTkLabel(
             center,
-            text="Ready to diagnose • Enter target IP above",
-            font=ctk.CTkFont(size=13),
+            textvariable=self._progress_var,
+            font=get_font(13),
             text_color=COLORS["text_secondary"],
             anchor="w"
         )
         self.progress_label.pack(anchor="w")
 
-        # Modern segmented progress bar
-        progress_container = ctk.CTkFrame(center, fg_color="transparent")
-        progress_container.pack(fill="x", pady=(8, 0))
-
-        self._progress_segments = []
-        test_names = ["Network", "Ports", "HTTP", "Hostname", "DNS", "Commands"]
-
-        for i, name in enumerate(test_names):
-            seg_frame = ctk.CTkFrame(progress_container, fg_color="transparent")
-            seg_frame.pack(side="left", fill="x", expand=True, padx=(0, 4) if i < len(test_names)-1 else 0)
-
-            seg = ctk.CTkFrame(
-                seg_frame,
-                height=6,
-                corner_radius=3,
-                fg_color=COLORS["bg_elevated"]
+        # Modern segmented progress bar: one canvas with a round-capped line
+        # per step (Network, Ports, HTTP, Hostname, DNS, Commands), recolored
+        # with itemconfigure instead of six separately drawn CTkFrames
+        self._segment_canvas = ctk.CTkCanvas(
+            center,
+            height=self.SEGMENT_HEIGHT,
+            bg=COLORS["bg_secondary"],
+            highlightthickness=0
+        )
+        self._segment_canvas.pack(fill="x", pady=(8, 0))
+
+        self._progress_segments = [
+            self._segment_canvas.create_line(
+                0, 0, 0, 0,
+                width=self.SEGMENT_HEIGHT,
+                capstyle="round",
+                fill=self.SEGMENT_IDLE_COLOR
             )
-            seg.pack(fill="x")
+            for _ in range(6)
+        ]
+        self._segment_canvas.bind("<Configure>", self._layout_progress_segments)
 
-            self._progress_segments.append(seg)
+        # Color currently drawn on each segment, so unchanged ones are not reconfigured
+        self._segment_colors = [self.SEGMENT_IDLE_COLOR] * len(self._progress_segments)
 
         # Right: Export buttons
         right = ctk.CTkFrame(controls, fg_color="transparent")
@@ -648,7 +1037,7 @@ class DiagnosticsFrame(ctk.CTkFrame):
             right,
             text="📊 Export Report",
             command=self._export_report,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             fg_color=COLORS["bg_elevated"],
             hover_color="#4b5563",
             text_color=COLORS["text_primary"],
@@ -663,7 +1052,7 @@ class DiagnosticsFrame(ctk.CTkFrame):
             right,
             text="Clear",
             command=self._clear_results,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             fg_color="transparent",
             hover_color=COLORS["bg_elevated"],
             text_color=COLORS["text_secondary"],
@@ -688,7 +1077,13 @@ class DiagnosticsFrame(ctk.CTkFrame):
         self._show_placeholder()
 
     def _show_placeholder(self) -> None:
-        """Show the modern placeholder."""
+        """Show the modern placeholder, building it on first use."""
+        if self.placeholder_frame is None:
+            self._build_placeholder()
+        self.placeholder_frame.pack(pady=40, padx=24)
+
+    def _build_placeholder(self) -> None:
+        """Build the placeholder once; it is shown and hidden rather than rebuilt."""
         self.placeholder_frame = ctk.CTkFrame(
             self.results_scroll,
             fg_color=COLORS["bg_card"],
@@ -696,48 +1091,43 @@ class DiagnosticsFrame(ctk.CTkFrame):
             border_width=1,
             border_color=COLORS["border_subtle"]
         )
-        self.placeholder_frame.pack(pady=40, padx=24)
 
-        inner = ctk.CTkFrame(self.placeholder_frame, fg_color="transparent")
-        inner.pack(padx=56, pady=48)
+        # Children are packed straight into the card, each carrying its own padding
 
         # Large icon
         ctk.CTkLabel(
-            inner,
+            self.placeholder_frame,
             text="🔬",
-            font=ctk.CTkFont(size=64)
-        ).pack()
+            font=get_font(64)
+        ).pack(padx=56, pady=(48, 0))
 
         # Title
         ctk.CTkLabel(
-            inner,
+            self.placeholder_frame,
             text="Network Diagnostic Suite",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=get_font(28, "bold"),
             text_color=COLORS["text_primary"]
-        ).pack(pady=(20, 8))
+        ).pack(padx=56, pady=(20, 8))
 
         # Subtitle
         ctk.CTkLabel(
-            inner,
+            self.placeholder_frame,
             text="Comprehensive analysis of your MK3 amplifier's network configuration,\ncontrol protocols, and connectivity status.",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLORS["text_secondary"],
             justify="center"
-        ).pack(pady=(0, 32))
+        ).pack(padx=56, pady=(0, 32))
 
         # Test grid
-        tests_frame = ctk.CTkFrame(inner, fg_color=COLORS["bg_secondary"], corner_radius=12)
-        tests_frame.pack(fill="x")
-
-        tests_inner = ctk.CTkFrame(tests_frame, fg_color="transparent")
-        tests_inner.pack(padx=28, pady=24)
+        tests_frame = ctk.CTkFrame(self.placeholder_frame, fg_color=COLORS["bg_secondary"], corner_radius=12)
+        tests_frame.pack(fill="x", padx=56, pady=(0, 48))
 
         ctk.CTkLabel(
-            tests_inner,
+            tests_frame,
             text="DIAGNOSTIC TESTS",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color=COLORS["text_muted"]
-        ).pack(anchor="w", pady=(0, 16))
+        ).pack(anchor="w", padx=28, pady=(24, 16))
 
         tests = [
             ("📡", "Network Reachability", "Latency, packet loss, connection quality"),
@@ -748,78 +1138,108 @@ class DiagnosticsFrame(ctk.CTkFrame):
             ("⚡", "Command Protocol", "Control interface testing"),
         ]
 
-        # Two-column grid
-        grid = ctk.CTkFrame(tests_inner, fg_color="transparent")
-        grid.pack(fill="x")
-
-        for i, (icon, name, desc) in enumerate(tests):
-            col = i % 2
-            row_frame = grid.winfo_children()[i // 2] if i // 2 < len(grid.winfo_children()) else None
-
-            if col == 0:
-                row_frame = ctk.CTkFrame(grid, fg_color="transparent")
-                row_frame.pack(fill="x", pady=6)
-
-            item = ctk.CTkFrame(row_frame, fg_color=COLORS["bg_card"], corner_radius=8, width=280)
-            item.pack(side="left", padx=(0, 12) if col == 0 else 0, fill="x", expand=True)
-
-            item_inner = ctk.CTkFrame(item, fg_color="transparent")
-            item_inner.pack(fill="x", padx=14, pady=12)
-
-            top = ctk.CTkFrame(item_inner, fg_color="transparent")
-            top.pack(fill="x")
+        # One tagged textbox instead of a frame and three labels per test
+        tests_text = ctk.CTkTextbox(
+            tests_frame,
+            width=560,
+            height=170,
+            fg_color="transparent",
+            wrap="none",
+            activate_scrollbars=False
+        )
+        tests_text.pack(fill="x", padx=28, pady=(0, 24))
 
-            ctk.CTkLabel(top, text=icon, font=ctk.CTkFont(size=18)).pack(side="left")
-            ctk.CTkLabel(
-                top,
-                text=name,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=COLORS["text_primary"]
-            ).pack(side="left", padx=(10, 0))
+        textbox = tests_text._textbox
+        textbox.tag_configure("icon", font=get_font(16))
+        textbox.tag_configure("name", font=get_font(13, "bold"), foreground=COLORS["text_primary"])
+        textbox.tag_configure("desc", font=get_font(11), foreground=COLORS["text_muted"], spacing3=8)
 
-            ctk.CTkLabel(
-                item_inner,
-                text=desc,
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"]
-            ).pack(anchor="w", pady=(4, 0))
+        for icon, name, desc in tests:
+            tests_text.insert("end", f"{icon}  ", "icon")
+            tests_text.insert("end", name, "name")
+            tests_text.insert("end", f"  —  {desc}\n", "desc")
+        tests_text.configure(state="disabled")
 
     def _clear_results(self) -> None:
         """Clear results and show placeholder."""
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        self._release_dashboard()
         self._show_placeholder()
         self.export_btn.configure(state="disabled")
         self._reset_progress_segments()
-        self.progress_label.configure(text="Ready to diagnose")
+        self._set_progress("Ready to diagnose")
+
+    def _post_ui(self, callback: Callable[..., None], *args: Any) -> None:
+        """Queue callback(*args) from a worker thread; queued updates are applied in one batch.
+
+        Like Tk's after(), arguments are passed through rather than captured
+        in a closure, and are evaluated on the worker thread.
+        """
+        self._pending_ui.append((callback, args))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(self.UI_FLUSH_MS, self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Apply all queued UI updates in order (UI thread)."""
+        self._flush_scheduled = False
+        while self._pending_ui:
+            callback, args = self._pending_ui.popleft()
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"UI update error: {e}")
+
+    def _layout_progress_segments(self, event) -> None:
+        """Spread the segments evenly across the canvas width."""
+        count = len(self._progress_segments)
+        width = (event.width - self.SEGMENT_GAP * (count - 1)) / count
+        half = self.SEGMENT_HEIGHT / 2
+        for i, item in enumerate(self._progress_segments):
+            left = i * (width + self.SEGMENT_GAP)
+            self._segment_canvas.coords(item, left + half, half, max(left + width - half, left + half), half)
 
     def _reset_progress_segments(self) -> None:
         """Reset all progress segments."""
-        for seg in self._progress_segments:
-            seg.configure(fg_color=COLORS["bg_elevated"])
+        self._recolor_segments(dict.fromkeys(range(len(self._progress_segments)), self.SEGMENT_IDLE_COLOR))
 
     def _update_progress_segment(self, index: int, status: str) -> None:
-        """Update a progress segment color."""
-        colors = {
-            "running": COLORS["info"],
-            "passed": COLORS["success"],
-            "failed": COLORS["error"],
-            "warning": COLORS["warning"],
-        }
-        if 0 <= index < len(self._progress_segments):
-            self.after(0, lambda: self._progress_segments[index].configure(
-                fg_color=colors.get(status, COLORS["bg_elevated"])
-            ))
+        """Update a progress segment color; only a segment's latest status is drawn."""
+        if not 0 <= index < len(self._progress_segments):
+            return
+        with self._segments_lock:
+            self._pending_segments[index] = status
+            if self._segments_scheduled:
+                return
+            self._segments_scheduled = True
+        self._post_ui(self._apply_progress_segments)
+
+    def _apply_progress_segments(self) -> None:
+        """Recolor the segments whose status changed since the last flush (UI thread)."""
+        with self._segments_lock:
+            pending, self._pending_segments = self._pending_segments, {}
+            self._segments_scheduled = False
+        colors, idle = self.SEGMENT_COLORS, self.SEGMENT_IDLE_COLOR
+        self._recolor_segments({index: colors.get(status, idle) for index, status in pending.items()})
+
+    def _recolor_segments(self, colors: Dict[int, str]) -> None:
+        """Apply index -> color to the progress segments, skipping ones already that color."""
+        drawn = self._segment_colors
+        items = self._progress_segments
+        itemconfigure = self._segment_canvas.itemconfigure
+        for index, color in colors.items():
+            if drawn[index] != color:
+                itemconfigure(items[index], fill=color)
+                drawn[index] = color
 
     def _check_ip(self) -> Optional[str]:
         """Check if target IP is set."""
         ip = self._get_target_ip()
         if not ip:
-            self.progress_label.configure(text="⚠ No target IP configured", text_color=COLORS["warning"])
+            self._set_progress("⚠ No target IP configured", COLORS["warning"])
             return None
         return ip
 
-    def _run_full_diagnostic(self) -> None:
+    def _run_full_diagnostic(self, force_refresh: bool = False) -> None:
         """Run full diagnostic suite."""
         ip = self._check_ip()
         if not ip:
@@ -828,188 +1248,179 @@ class DiagnosticsFrame(ctk.CTkFrame):
         if self._is_running:
             return
 
+        if force_refresh:
+            self._resolve_cache.clear()
+
         self._is_running = True
         self.run_btn.configure(state="disabled", text="⏳ Scanning...")
         self.export_btn.configure(state="disabled")
         self._reset_progress_segments()
 
-        # Clear previous results
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        # Clear previous results (the dashboard itself is reused)
+        self._release_dashboard()
+        if self.placeholder_frame is not None:
+            self.placeholder_frame.pack_forget()
 
-        # Initialize results
-        self._results = {
-            'timestamp': datetime.now().isoformat(),
-            'ip_address': ip,
-            'tests': {},
-            'summary': {
-                'passed': 0,
-                'failed': 0,
-                'warnings': 0
-            }
-        }
+        # Initialize results; the dashboard shows the same start time
+        started = datetime.now()
+        self._results = DiagResults(timestamp=started.isoformat(), ip_address=ip)
 
         # Build live dashboard
-        self.after(0, lambda: self._build_live_dashboard(ip))
+        self.after(0, self._build_live_dashboard, ip, started)
+
+        # (progress segment, label, test, needs the device to answer) - the
+        # tests are independent and network-bound, so they run side by side
+        steps = [
+            (0, "Network reachability", self._run_reachability_test, True),
+            (1, "Port scan", self._run_port_scan, True),
+            (2, "HTTP endpoints", self._run_http_test, True),
+            (3, "Hostname resolution", self._run_hostname_test, True),
+            (4, "DNS configuration", self._run_dns_test, False),
+            (5, "Command interface", self._run_command_test, True),
+        ]
 
         def run():
             try:
-                total_steps = 6
-                current_step = 0
-
-                # Step 1: Quick network check
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Testing network reachability...")
-                self._update_progress_segment(0, "running")
-                result = self._run_reachability_test(ip)
-                self._update_progress_segment(0, "passed" if result else "failed")
-
-                # Step 2: Port scan
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Scanning ports...")
-                self._update_progress_segment(1, "running")
-                result = self._run_port_scan(ip)
-                self._update_progress_segment(1, "passed" if result else "failed")
-
-                # Step 3: HTTP endpoints
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Testing HTTP endpoints...")
-                self._update_progress_segment(2, "running")
-                result = self._run_http_test(ip)
-                self._update_progress_segment(2, "passed" if result else "failed")
-
-                # Step 4: Hostname resolution
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Testing hostname resolution...")
-                self._update_progress_segment(3, "running")
-                result = self._run_hostname_test(ip)
-                status = "passed" if result == "passed" else ("warning" if result == "warning" else "failed")
-                self._update_progress_segment(3, status)
-
-                # Step 5: DNS tests
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Testing DNS configuration...")
-                self._update_progress_segment(4, "running")
-                result = self._run_dns_test(ip)
-                self._update_progress_segment(4, "passed" if result else "failed")
-
-                # Step 6: Command testing
-                current_step += 1
-                self._update_progress(current_step, total_steps, "Testing command interface...")
-                self._update_progress_segment(5, "running")
-                result = self._run_command_test(ip)
-                status = "passed" if result == "passed" else ("warning" if result == "warning" else "failed")
-                self._update_progress_segment(5, status)
+                total_steps = len(steps)
+                completed = 0
+
+                def step_done(index: int, label: str, status: str) -> None:
+                    nonlocal completed
+                    self._update_progress_segment(index, status)
+                    completed += 1
+                    self._update_progress(completed, total_steps, f"{label} {status}")
+
+                # Reachability goes first: if the device doesn't answer at all,
+                # the steps that talk to it would only sit out their timeouts
+                index, label, test, _ = steps[0]
+                self._update_progress(0, total_steps, "Testing network reachability...")
+                self._update_progress_segment(index, "running")
+                step_done(index, label, self._step_status(label, test, ip))
+
+                reach = self._results.tests.get('reachability', {})
+                unreachable = reach.get('details', {}).get('packet_loss', 0) >= 100
+
+                to_run = []
+                for index, label, test, needs_device in steps[1:]:
+                    if unreachable and needs_device:
+                        self._skip_step(index)
+                        step_done(index, label, "skipped")
+                    else:
+                        to_run.append((index, label, test))
+
+                futures = {}
+                for index, label, test in to_run:
+                    self._update_progress_segment(index, "running")
+                    futures[self._step_pool.submit(self._step_status, label, test, ip)] = (index, label)
+
+                for future in as_completed(futures):
+                    index, label = futures[future]
+                    step_done(index, label, future.result())
 
                 # Final summary
-                self.after(0, self._display_summary)
+                self._post_ui(self._display_summary)
 
             except Exception as e:
                 logger.error(f"Diagnostic error: {e}")
-                self.after(0, lambda: self.progress_label.configure(
-                    text=f"Error: {e}", text_color=COLORS["error"]
-                ))
+                self._post_ui(self._set_progress, f"Error: {e}", COLORS["error"])
             finally:
                 self._is_running = False
-                self.after(0, lambda: self.run_btn.configure(
-                    state="normal", text="▶  Start Diagnostic Scan"
-                ))
-                self.after(0, lambda: self.export_btn.configure(state="normal"))
-
-        threading.Thread(target=run, daemon=True).start()
+                self._post_ui(self._end_progress)
+                self._post_ui(self._enable_run_controls)
+
+        self._begin_progress()
+        self._pool.submit(run)
+
+    def _enable_run_controls(self) -> None:
+        """Re-enable the scan and export buttons once a run has finished."""
+        self.run_btn.configure(state="normal", text="▶  Start Diagnostic Scan")
+        self.export_btn.configure(state="normal")
+
+    def _build_live_dashboard(self, ip: str, started: datetime) -> None:
+        """Show the live diagnostic dashboard, building its header (device card and gauge) on first use."""
+        scan_time = started.strftime("%Y-%m-%d %H:%M:%S")
+
+        if self._dashboard is not None:
+            self._device_ip_label.configure(text=ip)
+            self._scan_time_label.configure(text=scan_time)
+            self._health_gauge.reset()
+            for key, card in self._metric_cards.items():
+                card.update_value(*self.METRIC_DEFAULTS[key])
+            self._dashboard.pack(fill="x", padx=16, pady=16)
+            return
 
-    def _build_live_dashboard(self, ip: str) -> None:
-        """Build the live diagnostic dashboard."""
         # Main container
         self._dashboard = ctk.CTkFrame(self.results_scroll, fg_color="transparent")
         self._dashboard.pack(fill="x", padx=16, pady=16)
 
         # Top row: Device info + Health gauge + Metrics
-        top_row = ctk.CTkFrame(self._dashboard, fg_color="transparent")
+        top_row = self._dashboard_top_row = ctk.CTkFrame(self._dashboard, fg_color="transparent")
         top_row.pack(fill="x", pady=(0, 16))
 
         # Device info card
-        device_card = ctk.CTkFrame(
-            top_row,
-            fg_color=COLORS["bg_card"],
-            corner_radius=12,
-            border_width=1,
-            border_color=COLORS["border_subtle"]
-        )
+        device_card = ctk.CTkFrame(top_row, **self.CARD_STYLE)
         device_card.pack(side="left", fill="y", padx=(0, 16))
 
-        device_inner = ctk.CTkFrame(device_card, fg_color="transparent")
-        device_inner.pack(padx=24, pady=20)
-
+        # Labels sit directly in the card; the first and last carry its 20px
+        # top/bottom padding
         ctk.CTkLabel(
-            device_inner,
+            device_card,
             text="TARGET DEVICE",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=get_font(10, "bold"),
             text_color=COLORS["text_muted"]
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=24, pady=(20, 0))
 
-        ctk.CTkLabel(
-            device_inner,
+        self._device_ip_label = ctk.CTkLabel(
+            device_card,
             text=ip,
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=get_font(24, "bold"),
             text_color=COLORS["text_primary"]
-        ).pack(anchor="w", pady=(4, 12))
+        )
+        self._device_ip_label.pack(anchor="w", padx=24, pady=(4, 12))
 
         # Timestamp
         ctk.CTkLabel(
-            device_inner,
+            device_card,
             text="SCAN STARTED",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=get_font(10, "bold"),
             text_color=COLORS["text_muted"]
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=24)
 
-        ctk.CTkLabel(
-            device_inner,
-            text=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            font=ctk.CTkFont(size=13),
+        self._scan_time_label = ctk.CTkLabel(
+            device_card,
+            text=scan_time,
+            font=get_font(13),
             text_color=COLORS["text_secondary"]
-        ).pack(anchor="w")
+        )
+        self._scan_time_label.pack(anchor="w", padx=24, pady=(0, 20))
 
         # Health gauge
-        gauge_card = ctk.CTkFrame(
-            top_row,
-            fg_color=COLORS["bg_card"],
-            corner_radius=12,
-            border_width=1,
-            border_color=COLORS["border_subtle"]
-        )
+        gauge_card = ctk.CTkFrame(top_row, **self.CARD_STYLE)
         gauge_card.pack(side="left", fill="y", padx=(0, 16))
 
-        gauge_inner = ctk.CTkFrame(gauge_card, fg_color="transparent")
-        gauge_inner.pack(padx=20, pady=16)
+        self._health_gauge = CircularGauge(gauge_card, size=160)
+        self._health_gauge.pack(padx=20, pady=16)
 
-        self._health_gauge = CircularGauge(gauge_inner, size=160)
-        self._health_gauge.pack()
+    def _ensure_metrics_built(self) -> None:
+        """Build the metric cards the first time a test reports a metric."""
+        if self._metric_cards:
+            return
 
         # Metrics grid
-        metrics_card = ctk.CTkFrame(
-            top_row,
-            fg_color=COLORS["bg_card"],
-            corner_radius=12,
-            border_width=1,
-            border_color=COLORS["border_subtle"]
-        )
+        metrics_card = ctk.CTkFrame(self._dashboard_top_row, **self.CARD_STYLE)
         metrics_card.pack(side="left", fill="both", expand=True)
 
-        metrics_inner = ctk.CTkFrame(metrics_card, fg_color="transparent")
-        metrics_inner.pack(fill="both", expand=True, padx=16, pady=16)
-
         # Metrics in 2x2 grid
-        metrics_grid = ctk.CTkFrame(metrics_inner, fg_color="transparent")
-        metrics_grid.pack(fill="both", expand=True)
+        metrics_grid = ctk.CTkFrame(metrics_card, fg_color="transparent")
+        metrics_grid.pack(fill="both", expand=True, padx=16, pady=16)
         metrics_grid.grid_columnconfigure((0, 1), weight=1)
         metrics_grid.grid_rowconfigure((0, 1), weight=1)
 
         self._metric_cards["latency"] = MetricCard(
             metrics_grid,
             title="Latency",
-            value="--",
-            subtitle="Average response time",
+            value=self.METRIC_DEFAULTS["latency"][0],
+            subtitle=self.METRIC_DEFAULTS["latency"][1],
             icon="⚡",
             color=COLORS["info"]
         )
@@ -1018,8 +1429,8 @@ class DiagnosticsFrame(ctk.CTkFrame):
         self._metric_cards["ports"] = MetricCard(
             metrics_grid,
             title="Open Ports",
-            value="--",
-            subtitle="Services detected",
+            value=self.METRIC_DEFAULTS["ports"][0],
+            subtitle=self.METRIC_DEFAULTS["ports"][1],
             icon="🔌",
             color=COLORS["purple"]
         )
@@ -1028,8 +1439,8 @@ class DiagnosticsFrame(ctk.CTkFrame):
         self._metric_cards["packet_loss"] = MetricCard(
             metrics_grid,
             title="Packet Loss",
-            value="--",
-            subtitle="Network reliability",
+            value=self.METRIC_DEFAULTS["packet_loss"][0],
+            subtitle=self.METRIC_DEFAULTS["packet_loss"][1],
             icon="📊",
             color=COLORS["success"]
         )
@@ -1038,39 +1449,91 @@ class DiagnosticsFrame(ctk.CTkFrame):
         self._metric_cards["web"] = MetricCard(
             metrics_grid,
             title="Web Interface",
-            value="--",
-            subtitle="HTTP accessibility",
+            value=self.METRIC_DEFAULTS["web"][0],
+            subtitle=self.METRIC_DEFAULTS["web"][1],
             icon="🌐",
             color=COLORS["cyan"]
         )
         self._metric_cards["web"].grid(row=1, column=1, sticky="nsew", padx=(8, 0), pady=(8, 0))
 
+    def _ensure_results_section(self) -> None:
+        """Build the test results section the first time a result card is added."""
+        if self._results_section is not None:
+            return
+
         # Test results section
-        self._results_section = ctk.CTkFrame(
-            self._dashboard,
-            fg_color=COLORS["bg_card"],
-            corner_radius=12,
-            border_width=1,
-            border_color=COLORS["border_subtle"]
-        )
+        self._results_section = ctk.CTkFrame(self._dashboard, **self.CARD_STYLE)
         self._results_section.pack(fill="x", pady=(0, 16))
 
-        results_header = ctk.CTkFrame(self._results_section, fg_color="transparent")
-        results_header.pack(fill="x", padx=20, pady=(16, 12))
-
         ctk.CTkLabel(
-            results_header,
+            self._results_section,
             text="📋 TEST RESULTS",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=COLORS["text_muted"]
-        ).pack(side="left")
+        ).pack(anchor="w", padx=20, pady=(16, 12))
 
         self._results_container = ctk.CTkFrame(self._results_section, fg_color="transparent")
         self._results_container.pack(fill="x", padx=16, pady=(0, 16))
 
     def _update_progress(self, current: int, total: int, message: str) -> None:
-        """Update progress display."""
-        self.after(0, lambda: self.progress_label.configure(text=f"[{current}/{total}] {message}"))
+        """Update progress display (worker thread)."""
+        self._post_progress(f"[{current}/{total}] {message}")
+
+    def _step_status(self, label: str, test: Callable[[str], Any], ip: str) -> str:
+        """Run one diagnostic step and map its result to a progress status."""
+        try:
+            result = test(ip)
+        except Exception as e:
+            logger.error(f"{label} test error: {e}")
+            return "failed"
+
+        if result is True or result == "passed":
+            return "passed"
+        if result == "warning":
+            return "warning"
+        return "failed"
+
+    def _skip_step(self, index: int) -> None:
+        """Record a step that wasn't run because the device is unreachable."""
+        self._count_outcome("skipped")
+        self._post_ui(
+            self._add_result_card, self.RESULT_CARDS[index],
+            ResultStatus.SKIPPED, "Skipped • device unreachable"
+        )
+
+    def _cached_lookup(
+        self,
+        ip: str,
+        kind: str,
+        fetch: Callable[[], Any],
+        cacheable: Callable[[Any], bool]
+    ) -> Any:
+        """
+        Return a recent result for (ip, kind), or call fetch for a fresh one.
+
+        Only results accepted by cacheable are stored, so a failed lookup is
+        retried on the next run instead of being replayed for the whole TTL.
+        """
+        now = time.monotonic()
+        entry = self._resolve_cache.get((ip, kind))
+        if entry is not None and now - entry[0] < self.RESOLVE_CACHE_TTL:
+            return entry[1]
+
+        value = fetch()
+        if cacheable(value):
+            self._resolve_cache[(ip, kind)] = (now, value)
+        return value
+
+    def _store_test(self, key: str, test_data: Dict[str, Any]) -> None:
+        """Record a test's data (called from the diagnostic step threads)."""
+        with self._results_lock:
+            self._results.tests[key] = test_data
+
+    def _count_outcome(self, outcome: str) -> None:
+        """Count a test outcome ('passed', 'warnings', 'failed' or 'skipped') in the summary."""
+        with self._results_lock:
+            summary = self._results.summary
+            setattr(summary, outcome, getattr(summary, outcome) + 1)
 
     def _run_reachability_test(self, ip: str) -> bool:
         """Run reachability test."""
@@ -1086,84 +1549,83 @@ class DiagnosticsFrame(ctk.CTkFrame):
                 'avg_latency_ms': result.avg_ms
             }
         }
-        self._results['tests']['reachability'] = test_data
+        self._store_test("reachability", test_data)
 
         if result.is_reachable:
             status = ResultStatus.PASSED
             msg = f"Device reachable • {result.avg_ms:.1f}ms latency"
-            self._results['summary']['passed'] += 1
+            self._count_outcome("passed")
 
-            # Update metrics
-            self.after(0, lambda: self._metric_cards["latency"].update_value(
-                f"{result.avg_ms:.1f}ms",
-                f"{result.packets_received}/{result.packets_sent} packets received"
-            ))
-            self.after(0, lambda: self._metric_cards["packet_loss"].update_value(
-                f"{result.packet_loss_percent:.1f}%",
-                "Packet loss rate"
-            ))
+            metrics = [
+                ("latency", f"{result.avg_ms:.1f}ms",
+                 f"{result.packets_received}/{result.packets_sent} packets received"),
+                ("packet_loss", f"{result.packet_loss_percent:.1f}%", "Packet loss rate"),
+            ]
         else:
             status = ResultStatus.FAILED
             msg = "Device NOT reachable"
-            self._results['summary']['failed'] += 1
+            self._count_outcome("failed")
 
-            self.after(0, lambda: self._metric_cards["latency"].update_value("N/A", "Host unreachable"))
-            self.after(0, lambda: self._metric_cards["packet_loss"].update_value("100%", "All packets lost"))
+            metrics = [
+                ("latency", "N/A", "Host unreachable"),
+                ("packet_loss", "100%", "All packets lost"),
+            ]
 
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._show_test_result, metrics,
             "Network Reachability", status, msg,
             f"Packets: {result.packets_received}/{result.packets_sent} • Loss: {result.packet_loss_percent:.1f}%"
-        ))
+        )
 
         return result.is_reachable
 
     def _run_port_scan(self, ip: str) -> bool:
         """Run port scan."""
         key_ports = [80, 23, 443, 8080, 10000, 10001, 52000]
-        results = self._connectivity.scan_ports(ip, key_ports)
+        results = self._connectivity.scan_ports(
+            ip, key_ports,
+            max_workers=self.config.port_scan_concurrency,
+            timeout=self.config.port_scan_timeout
+        )
 
         open_ports = [r for r in results if r.is_open]
+        # Formatted once for both the metric card and the result card
+        port_list = ", ".join(str(r.port) for r in open_ports)
 
         test_data = {
             'name': 'Port Scan',
             'passed': len(open_ports) > 0,
             'open_ports': [r.port for r in open_ports]
         }
-        self._results['tests']['ports'] = test_data
-
-        # Update metric
-        self.after(0, lambda: self._metric_cards["ports"].update_value(
-            str(len(open_ports)),
-            ", ".join(str(r.port) for r in open_ports) if open_ports else "No open ports"
-        ))
+        self._store_test("ports", test_data)
 
         if open_ports:
             has_web = any(r.port == 80 for r in open_ports)
             if has_web:
                 status = ResultStatus.PASSED
                 msg = f"{len(open_ports)} ports open including web (80)"
-                self._results['summary']['passed'] += 1
+                self._count_outcome("passed")
             else:
                 status = ResultStatus.WARNING
                 msg = f"{len(open_ports)} ports open but web port (80) closed"
-                self._results['summary']['warnings'] += 1
+                self._count_outcome("warnings")
         else:
             status = ResultStatus.FAILED
             msg = "No ports responding"
-            self._results['summary']['failed'] += 1
+            self._count_outcome("failed")
 
-        port_list = ", ".join(str(r.port) for r in open_ports)
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._show_test_result,
+            [("ports", str(len(open_ports)), port_list or "No open ports")],
             "Port Scan", status, msg,
-            f"Open: {port_list if port_list else 'None'} • Scanned: {len(key_ports)} ports"
-        ))
+            f"Open: {port_list or 'None'} • Scanned: {len(key_ports)} ports"
+        )
 
         return len(open_ports) > 0
 
     def _run_http_test(self, ip: str) -> bool:
         """Run HTTP endpoint test."""
-        endpoints = ["/", "/Landing.htm", "/index.html"]
-        results = self._connectivity.test_http_endpoints(ip, endpoints)
+        results = self._connectivity.test_http_endpoints(ip, list(self.HTTP_ENDPOINTS))
 
         accessible = [r for r in results if r.is_accessible]
 
@@ -1172,48 +1634,41 @@ class DiagnosticsFrame(ctk.CTkFrame):
             'passed': len(accessible) > 0,
             'accessible_endpoints': [r.url for r in accessible]
         }
-        self._results['tests']['http'] = test_data
+        self._store_test("http", test_data)
 
         if accessible:
-            landing = next((r for r in accessible if 'Landing' in r.url), None)
+            landing = next((r for r in accessible if r.url.endswith(self.LANDING_ENDPOINT)), None)
             if landing:
                 status = ResultStatus.PASSED
                 msg = f"Web interface accessible ({landing.response_time_ms:.0f}ms)"
-                self._results['summary']['passed'] += 1
-
-                self.after(0, lambda: self._metric_cards["web"].update_value(
-                    "Online",
-                    f"Response: {landing.response_time_ms:.0f}ms"
-                ))
+                self._count_outcome("passed")
+                web = ("web", "Online", f"Response: {landing.response_time_ms:.0f}ms")
             else:
                 status = ResultStatus.WARNING
                 msg = f"{len(accessible)} endpoints accessible, but not Landing.htm"
-                self._results['summary']['warnings'] += 1
-
-                self.after(0, lambda: self._metric_cards["web"].update_value(
-                    "Partial",
-                    "Landing.htm not found"
-                ))
+                self._count_outcome("warnings")
+                web = ("web", "Partial", "Landing.htm not found")
         else:
             status = ResultStatus.FAILED
             msg = "Web interface NOT accessible"
-            self._results['summary']['failed'] += 1
+            self._count_outcome("failed")
+            web = ("web", "Offline", "No HTTP response")
 
-            self.after(0, lambda: self._metric_cards["web"].update_value(
-                "Offline",
-                "No HTTP response"
-            ))
-
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._show_test_result, [web],
             "HTTP Web Interface", status, msg,
             " • ".join(f"{r.url}: {r.status_code or r.error}" for r in results)
-        ))
+        )
 
         return len(accessible) > 0
 
     def _run_hostname_test(self, ip: str) -> str:
         """Run hostname resolution test."""
-        results = self._hostname.resolve_all_methods(ip, "DSP")
+        results = self._cached_lookup(
+            ip, "hostname",
+            lambda: self._hostname.resolve_all_methods(ip, "DSP"),
+            lambda results: any(r.success for r in results.values())
+        )
 
         successful = {m: r for m, r in results.items() if r.success}
         hostnames = [r.hostname for r in successful.values() if r.hostname]
@@ -1224,39 +1679,43 @@ class DiagnosticsFrame(ctk.CTkFrame):
             'methods_successful': list(successful.keys()),
             'hostnames_found': hostnames
         }
-        self._results['tests']['hostname'] = test_data
+        self._store_test("hostname", test_data)
 
         if successful:
-            has_dsp = any('dsp' in h.lower() for h in hostnames if h)
+            has_dsp = any(_DSP_TOKEN in h.lower() for h in hostnames)
             if has_dsp:
                 status = ResultStatus.PASSED
                 msg = f"Hostname 'DSP' resolved via {', '.join(successful.keys())}"
-                self._results['summary']['passed'] += 1
+                self._count_outcome("passed")
                 return "passed"
             else:
                 status = ResultStatus.WARNING
                 msg = f"Hostname found but not 'DSP': {', '.join(hostnames)}"
-                self._results['summary']['warnings'] += 1
+                self._count_outcome("warnings")
                 return "warning"
         else:
             status = ResultStatus.FAILED
             msg = "No hostname resolution method succeeded"
-            self._results['summary']['failed'] += 1
+            self._count_outcome("failed")
 
         details = " • ".join(
             f"{m}: {r.hostname if r.success else r.error}"
             for m, r in results.items()
         )
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._add_result_card,
             "Hostname Resolution", status, msg, details
-        ))
+        )
 
         return "failed"
 
     def _run_dns_test(self, ip: str) -> bool:
         """Run DNS test."""
-        system_dns = self._dns.get_system_dns_servers()
-        dns_results = self._dns.test_multiple_dns_servers(system_dns[:2])
+        dns_results = self._cached_lookup(
+            ip, "dns",
+            lambda: self._dns.test_multiple_dns_servers(self._dns.get_system_dns_servers()[:2]),
+            lambda results: any(r.can_resolve for r in results)
+        )
 
         working_dns = [r for r in dns_results if r.can_resolve]
 
@@ -1265,24 +1724,25 @@ class DiagnosticsFrame(ctk.CTkFrame):
             'passed': len(working_dns) > 0,
             'working_servers': [r.server_ip for r in working_dns]
         }
-        self._results['tests']['dns'] = test_data
+        self._store_test("dns", test_data)
 
         if working_dns:
             status = ResultStatus.PASSED
             msg = f"{len(working_dns)}/{len(dns_results)} DNS servers working"
-            self._results['summary']['passed'] += 1
+            self._count_outcome("passed")
         else:
             status = ResultStatus.FAILED
             msg = "No DNS servers responding"
-            self._results['summary']['failed'] += 1
+            self._count_outcome("failed")
 
         details = " • ".join(
             f"{r.server_ip}: {'OK' if r.can_resolve else 'Failed'}"
             for r in dns_results
         )
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._add_result_card,
             "DNS Configuration", status, msg, details
-        ))
+        )
 
         return len(working_dns) > 0
 
@@ -1310,22 +1770,22 @@ class DiagnosticsFrame(ctk.CTkFrame):
                 'port': connected_port,
                 'error_rate': burst_result.error_rate_percent
             }
-            self._results['tests']['commands'] = test_data
+            self._store_test("commands", test_data)
 
             if burst_result.error_rate_percent == 0:
                 status = ResultStatus.PASSED
                 msg = f"Command port {connected_port} • No errors"
-                self._results['summary']['passed'] += 1
+                self._count_outcome("passed")
                 result = "passed"
             elif burst_result.error_rate_percent < 50:
                 status = ResultStatus.WARNING
                 msg = f"Command port {connected_port} • {burst_result.error_rate_percent:.0f}% error rate (rate limiting)"
-                self._results['summary']['warnings'] += 1
+                self._count_outcome("warnings")
                 result = "warning"
             else:
                 status = ResultStatus.FAILED
                 msg = f"Command port {connected_port} • {burst_result.error_rate_percent:.0f}% error rate"
-                self._results['summary']['failed'] += 1
+                self._count_outcome("failed")
                 result = "failed"
 
             details = f"Port: {connected_port} • Sent: {burst_result.total_commands} • Success: {burst_result.successful_commands}"
@@ -1335,296 +1795,345 @@ class DiagnosticsFrame(ctk.CTkFrame):
                 'passed': False,
                 'error': 'No command port found'
             }
-            self._results['tests']['commands'] = test_data
-            self._results['summary']['failed'] += 1
+            self._store_test("commands", test_data)
+            self._count_outcome("failed")
 
             status = ResultStatus.FAILED
             msg = "No control port found"
             details = f"Tested ports: {', '.join(map(str, test_ports))}"
             result = "failed"
 
-        self.after(0, lambda: self._add_result_card(
+        self._post_ui(
+            self._add_result_card,
             "Command Protocol", status, msg, details
-        ))
+        )
 
         return result
 
+    def _show_test_result(self, metrics: List[Tuple[str, str, str]], name: str,
+                          status: ResultStatus, message: str, details: str = "") -> None:
+        """Apply a test's metric updates and its result card as one UI update (UI thread).
+
+        metrics holds (metric card key, value, subtitle) tuples; everything is
+        plain strings, so the queued update doesn't keep the test's result alive.
+        """
+        self._ensure_metrics_built()
+        for key, value, subtitle in metrics:
+            self._metric_cards[key].update_value(value, subtitle)
+        self._add_result_card(name, status, message, details)
+
     def _add_result_card(self, name: str, status: ResultStatus,
                          message: str, details: str = "") -> None:
-        """Add a result card to the display."""
-        card = ResultCard(self._results_container, name, status, message, details)
-        card.pack(fill="x", pady=4)
-
-    def _display_summary(self) -> None:
-        """Display the final summary with visualizations."""
-        summary = self._results['summary']
-        tests = self._results.get('tests', {})
-
-        # Calculate health score
-        total_tests = summary['passed'] + summary['failed'] + summary['warnings']
-        if total_tests > 0:
-            # Weight: passed=100%, warnings=50%, failed=0%
-            health_score = ((summary['passed'] * 100) + (summary['warnings'] * 50)) / total_tests
+        """Add a result card to the display.
+
+        Cards are slotted by their position in RESULT_CARDS, so the list reads
+        in step order however the concurrent steps finish.
+        """
+        card = self._acquire_result_card(name, status, message, details)
+        rank = self.RESULT_CARDS.index(name) if name in self.RESULT_CARDS else len(self.RESULT_CARDS)
+        later = [
+            (other_rank, other)
+            for other_rank, other in zip(self._card_ranks, self._card_pool)
+            if other_rank > rank
+        ]
+        if later:
+            card.pack(fill="x", pady=4, before=min(later, key=lambda item: item[0])[1])
         else:
-            health_score = 0
-
-        # Update health gauge
-        self._health_gauge.set_value(health_score, 100)
-
-        # Determine overall status
-        if summary['failed'] == 0 and summary['warnings'] == 0:
-            overall = "ALL SYSTEMS OPERATIONAL"
-            overall_icon = "✓"
-            overall_color = COLORS["success"]
-            overall_bg = COLORS["success_bg"]
-        elif summary['failed'] == 0:
-            overall = "MINOR ISSUES DETECTED"
-            overall_icon = "!"
-            overall_color = COLORS["warning"]
-            overall_bg = COLORS["warning_bg"]
+            card.pack(fill="x", pady=4)
+        self._card_ranks.append(rank)
+        self._cards_in_use += 1
+
+    def _acquire_result_card(self, name: str, status: ResultStatus,
+                             message: str, details: str) -> ResultCard:
+        """Return the next idle pooled card reconfigured for this result, or a new one.
+
+        Cards go back to the pool (unpacked, not destroyed) in _release_dashboard,
+        so repeated scans keep the widget tree the same size.
+        """
+        self._ensure_results_section()
+        if self._cards_in_use < len(self._card_pool):
+            card = self._card_pool[self._cards_in_use]
+            card.reconfigure(name, status, message, details)
         else:
-            overall = "ISSUES REQUIRE ATTENTION"
-            overall_icon = "✗"
-            overall_color = COLORS["error"]
-            overall_bg = COLORS["error_bg"]
+            card = ResultCard(self._results_container, name, status, message, details)
+            self._card_pool.append(card)
+        return card
 
-        # Summary banner
-        banner = ctk.CTkFrame(
+    def _release_dashboard(self) -> None:
+        """Hide the dashboard and its summary, returning result cards to the pool."""
+        if self._dashboard is None:
+            return
+        for card in self._card_pool[:self._cards_in_use]:
+            card.pack_forget()
+        self._cards_in_use = 0
+        self._card_ranks.clear()
+        if self._working_section is not None:
+            self._working_section.pack_forget()
+        if self._summary_banner is not None:
+            self._summary_banner.pack_forget()
+        if self._issues_section is not None:
+            self._issues_section.pack_forget()
+            for card, _ in self._issue_cards.values():
+                card.pack_forget()
+        self._dashboard.pack_forget()
+
+    def _build_summary_template(self) -> None:
+        """Build the summary banner skeleton; _display_summary fills it in on each run."""
+        self._summary_banner = ctk.CTkFrame(
             self._dashboard,
-            fg_color=overall_bg,
             corner_radius=12,
-            border_width=2,
-            border_color=overall_color
+            border_width=2
         )
-        banner.pack(fill="x", pady=(0, 16))
-
-        banner_inner = ctk.CTkFrame(banner, fg_color="transparent")
-        banner_inner.pack(fill="x", padx=24, pady=20)
 
         # Status row
-        status_row = ctk.CTkFrame(banner_inner, fg_color="transparent")
-        status_row.pack(fill="x")
+        status_row = ctk.CTkFrame(self._summary_banner, fg_color="transparent")
+        status_row.pack(fill="x", padx=24, pady=20)
 
         # Status icon
-        icon_circle = ctk.CTkFrame(
+        self._summary_icon_circle = ctk.CTkFrame(
             status_row,
             width=52,
             height=52,
-            corner_radius=26,
-            fg_color=overall_color
+            corner_radius=26
         )
-        icon_circle.pack(side="left")
-        icon_circle.pack_propagate(False)
+        self._summary_icon_circle.pack(side="left")
+        self._summary_icon_circle.pack_propagate(False)
 
-        ctk.CTkLabel(
-            icon_circle,
-            text=overall_icon,
-            font=ctk.CTkFont(size=26, weight="bold"),
+        self._summary_icon_label = ctk.CTkLabel(
+            self._summary_icon_circle,
+            text="",
+            font=get_font(26, "bold"),
             text_color="white"
-        ).place(relx=0.5, rely=0.5, anchor="center")
+        )
+        self._summary_icon_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # Status text
         status_text = ctk.CTkFrame(status_row, fg_color="transparent")
         status_text.pack(side="left", padx=(16, 0))
 
-        ctk.CTkLabel(
+        self._summary_overall_label = ctk.CTkLabel(
             status_text,
-            text=overall,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=overall_color
-        ).pack(anchor="w")
+            text="",
+            font=get_font(18, "bold")
+        )
+        self._summary_overall_label.pack(anchor="w")
 
-        ctk.CTkLabel(
+        self._summary_completed_label = ctk.CTkLabel(
             status_text,
-            text=f"Completed {total_tests} diagnostic tests",
-            font=ctk.CTkFont(size=12),
+            text="",
+            font=get_font(12),
             text_color=COLORS["text_secondary"]
-        ).pack(anchor="w")
+        )
+        self._summary_completed_label.pack(anchor="w")
 
         # Stats pills
         stats_row = ctk.CTkFrame(status_row, fg_color="transparent")
         stats_row.pack(side="right")
 
-        for count, label, color in [
-            (summary['passed'], "Passed", COLORS["success"]),
-            (summary['warnings'], "Warnings", COLORS["warning"]),
-            (summary['failed'], "Failed", COLORS["error"]),
+        self._summary_pills = {}
+        for key, label, color in [
+            ('passed', "Passed", COLORS["success"]),
+            ('warnings', "Warnings", COLORS["warning"]),
+            ('failed', "Failed", COLORS["error"]),
         ]:
             pill = ctk.CTkFrame(stats_row, fg_color=COLORS["bg_card"], corner_radius=8)
             pill.pack(side="left", padx=(12, 0))
 
-            pill_inner = ctk.CTkFrame(pill, fg_color="transparent")
-            pill_inner.pack(padx=14, pady=8)
-
-            ctk.CTkLabel(
-                pill_inner,
-                text=str(count),
-                font=ctk.CTkFont(size=22, weight="bold"),
+            self._summary_pills[key] = ctk.CTkLabel(
+                pill,
+                text="0",
+                font=get_font(22, "bold"),
                 text_color=color
-            ).pack(side="left")
+            )
+            self._summary_pills[key].pack(side="left", padx=(14, 0), pady=8)
 
             ctk.CTkLabel(
-                pill_inner,
+                pill,
                 text=label,
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 text_color=COLORS["text_secondary"]
-            ).pack(side="left", padx=(8, 0))
+            ).pack(side="left", padx=(8, 14), pady=8)
+
+    def _display_summary(self) -> None:
+        """Display the final summary with visualizations."""
+        summary = self._results.summary
+        tests = self._results.tests
+
+        failed, warnings = summary.failed, summary.warnings
+        total_tests = summary.rated
+        health_score = summary.health_score
+
+        # Update health gauge
+        self._health_gauge.set_value(health_score, 100)
+
+        # Determine overall status: any failure, else any warning, else all clear
+        level = 0 if failed else 1 if warnings else 2
+        overall, overall_icon, overall_color, overall_bg = self.OVERALL_STATUS[level]
+
+        # Summary banner (built once, then only its text and colors change)
+        if self._summary_banner is None:
+            self._build_summary_template()
+
+        completed_text = f"Completed {total_tests} diagnostic tests"
+        if summary.skipped:
+            completed_text += f" • {summary.skipped} skipped (device unreachable)"
+
+        self._summary_banner.configure(fg_color=overall_bg, border_color=overall_color)
+        self._summary_icon_circle.configure(fg_color=overall_color)
+        self._summary_icon_label.configure(text=overall_icon)
+        self._summary_overall_label.configure(text=overall, text_color=overall_color)
+        self._summary_completed_label.configure(text=completed_text)
+        for key, pill_label in self._summary_pills.items():
+            pill_label.configure(text=str(getattr(summary, key)))
+        self._summary_banner.pack(fill="x", pady=(0, 16))
+
+        # Sections below the banner are filled in first and packed together at the end
+        sections = []
 
         # Issues section if any
-        if summary['failed'] > 0 or summary['warnings'] > 0:
-            issues_section = ctk.CTkFrame(
+        if failed or warnings:
+            if self._issues_section is None:
+                self._issues_section = ctk.CTkFrame(
+                    self._dashboard,
+                    fg_color=COLORS["bg_card"],
+                    corner_radius=12,
+                    border_width=1,
+                    border_color=COLORS["error"]
+                )
+
+                self._issues_inner = ctk.CTkFrame(self._issues_section, fg_color="transparent")
+                self._issues_inner.pack(fill="x", padx=24, pady=20)
+
+                ctk.CTkLabel(
+                    self._issues_inner,
+                    text="⚠️ Issues Requiring Attention",
+                    font=get_font(16, "bold"),
+                    text_color=COLORS["text_primary"]
+                ).pack(anchor="w", pady=(0, 16))
+
+            # Warnings don't always map to an issue card; skip an empty section
+            if self._display_enhanced_issues(self._issues_inner, tests):
+                sections.append(self._issues_section)
+
+        # Working systems section
+        if self._working_section is None:
+            self._working_section = ctk.CTkFrame(
                 self._dashboard,
                 fg_color=COLORS["bg_card"],
                 corner_radius=12,
                 border_width=1,
-                border_color=COLORS["error"]
+                border_color=COLORS["success"]
             )
-            issues_section.pack(fill="x", pady=(0, 16))
 
-            issues_inner = ctk.CTkFrame(issues_section, fg_color="transparent")
-            issues_inner.pack(fill="x", padx=24, pady=20)
-
-            header_row = ctk.CTkFrame(issues_inner, fg_color="transparent")
-            header_row.pack(fill="x", pady=(0, 16))
+            self._working_inner = ctk.CTkFrame(self._working_section, fg_color="transparent")
+            self._working_inner.pack(fill="x", padx=24, pady=20)
 
             ctk.CTkLabel(
-                header_row,
-                text="⚠️ Issues Requiring Attention",
-                font=ctk.CTkFont(size=16, weight="bold"),
+                self._working_inner,
+                text="✓ Operational Systems",
+                font=get_font(16, "bold"),
                 text_color=COLORS["text_primary"]
-            ).pack(side="left")
+            ).pack(anchor="w", pady=(0, 16))
 
-            self._display_enhanced_issues(issues_inner, tests)
+            self._working_empty_label = ctk.CTkLabel(
+                self._working_inner,
+                text="No tests passed - device may be offline",
+                font=get_font(13),
+                text_color=COLORS["text_muted"]
+            )
 
-        # Working systems section
-        working_section = ctk.CTkFrame(
-            self._dashboard,
-            fg_color=COLORS["bg_card"],
-            corner_radius=12,
-            border_width=1,
-            border_color=COLORS["success"]
-        )
-        working_section.pack(fill="x", pady=(0, 16))
+        self._display_working_systems(tests)
+        sections.append(self._working_section)
 
-        working_inner = ctk.CTkFrame(working_section, fg_color="transparent")
-        working_inner.pack(fill="x", padx=24, pady=20)
+        # The sections are filled in before they are mapped, so the dashboard
+        # and scroll region are laid out once here rather than once per child
+        for section in sections:
+            section.pack(fill="x", pady=(0, 16))
 
-        ctk.CTkLabel(
-            working_inner,
-            text="✓ Operational Systems",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=COLORS["text_primary"]
-        ).pack(anchor="w", pady=(0, 16))
-
-        # Working items grid
-        working_items = []
-
-        if tests.get('reachability', {}).get('passed'):
-            details = tests['reachability'].get('details', {})
-            working_items.append({
-                "name": "Network Reachability",
-                "status": f"{details.get('avg_latency_ms', 0):.1f}ms",
-                "icon": "📡"
-            })
-
-        if tests.get('ports', {}).get('passed'):
-            ports = tests['ports'].get('open_ports', [])
-            working_items.append({
-                "name": "Port Availability",
-                "status": f"{len(ports)} ports",
-                "icon": "🔌"
-            })
-
-        if tests.get('http', {}).get('passed'):
-            working_items.append({
-                "name": "Web Interface",
-                "status": "Online",
-                "icon": "🌐"
-            })
-
-        if tests.get('dns', {}).get('passed'):
-            working_items.append({
-                "name": "DNS Configuration",
-                "status": "Working",
-                "icon": "📋"
-            })
-
-        if tests.get('hostname', {}).get('passed'):
-            working_items.append({
-                "name": "Hostname Resolution",
-                "status": "Resolved",
-                "icon": "🏷️"
-            })
-
-        if tests.get('commands', {}).get('passed'):
-            port = tests['commands'].get('port', '?')
-            working_items.append({
-                "name": "Command Protocol",
-                "status": f"Port {port}",
-                "icon": "⚡"
-            })
+        # Complete
+        self._set_progress(
+            f"✓ Diagnostic complete • Health Score: {health_score:.0f}%",
+            COLORS["success"]
+        )
 
-        if working_items:
-            items_grid = ctk.CTkFrame(working_inner, fg_color="transparent")
-            items_grid.pack(fill="x")
-
-            for i, item in enumerate(working_items):
-                item_card = ctk.CTkFrame(
-                    items_grid,
-                    fg_color=COLORS["success_bg"],
-                    corner_radius=8
-                )
-                item_card.pack(fill="x", pady=3)
+    def _display_working_systems(self, tests: Dict[str, Any]) -> None:
+        """Fill the operational systems list, reusing rows from earlier runs."""
+        working_items = [
+            (icon, name, status(tests[key]))
+            for key, icon, name, status in _WORKING_SPECS
+            if tests.get(key, {}).get('passed')
+        ]
 
-                item_inner = ctk.CTkFrame(item_card, fg_color="transparent")
-                item_inner.pack(fill="x", padx=14, pady=10)
+        rows = self._working_rows
+        while len(rows) < len(working_items):
+            rows.append(self._create_working_row())
 
-                ctk.CTkLabel(
-                    item_inner,
-                    text=item["icon"],
-                    font=ctk.CTkFont(size=16)
-                ).pack(side="left")
+        for (_, name_label, status_label), (icon, name, status) in zip(rows, working_items):
+            name_label.configure(text=f"{icon}  {name}")
+            status_label.configure(text=status)
 
-                ctk.CTkLabel(
-                    item_inner,
-                    text=item["name"],
-                    font=ctk.CTkFont(size=13, weight="bold"),
-                    text_color=COLORS["success"]
-                ).pack(side="left", padx=(10, 0))
-
-                status_badge = ctk.CTkFrame(
-                    item_inner,
-                    fg_color=COLORS["success"],
-                    corner_radius=6
-                )
-                status_badge.pack(side="right")
+        # Rows are only packed/forgotten at the tail so their order never changes
+        visible = len(working_items)
+        for row, _, _ in rows[self._working_visible:visible]:
+            row.pack(fill="x", pady=3)
+        for row, _, _ in rows[visible:self._working_visible]:
+            row.pack_forget()
+        self._working_visible = visible
 
-                ctk.CTkLabel(
-                    status_badge,
-                    text=item["status"],
-                    font=ctk.CTkFont(size=10, weight="bold"),
-                    text_color="white"
-                ).pack(padx=10, pady=4)
+        if working_items:
+            self._working_empty_label.pack_forget()
         else:
-            ctk.CTkLabel(
-                working_inner,
-                text="No tests passed - device may be offline",
-                font=ctk.CTkFont(size=13),
-                text_color=COLORS["text_muted"]
-            ).pack(anchor="w")
+            self._working_empty_label.pack(anchor="w")
+
+    def _create_working_row(self) -> Tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel]:
+        """
+        Create one operational systems row: a frame with a name label and a
+        status label that draws its own badge background.
+        """
+        row = ctk.CTkFrame(
+            self._working_inner,
+            fg_color=COLORS["success_bg"],
+            corner_radius=8
+        )
+        row.grid_columnconfigure(0, weight=1)
 
-        # Complete
-        self.progress_label.configure(
-            text=f"✓ Diagnostic complete • Health Score: {health_score:.0f}%",
-            text_color=COLORS["success"]
+        name_label = ctk.CTkLabel(
+            row,
+            text="",
+            font=get_font(13, "bold"),
+            text_color=COLORS["success"],
+            anchor="w"
+        )
+        name_label.grid(row=0, column=0, sticky="w", padx=14, pady=10)
+
+        status_label = ctk.CTkLabel(
+            row,
+            text="",
+            font=get_font(10, "bold"),
+            text_color="white",
+            fg_color=COLORS["success"],
+            corner_radius=6,
+            height=24
         )
+        status_label.grid(row=0, column=1, sticky="e", padx=14, pady=10, ipadx=10)
+
+        return row, name_label, status_label
+
+    def _display_enhanced_issues(self, parent, tests: Dict[str, Any]) -> bool:
+        """
+        Display issues using enhanced issue cards; returns whether any were shown.
+
+        Critical issues show their full analysis; the others start collapsed and
+        only build their root cause and action sections when expanded. Cards
+        whose contents match the previous run are reused as they are.
+        """
+        if all(tests.get(key, {}).get('passed', True) for key in self.ISSUE_TESTS):
+            return False
 
-    def _display_enhanced_issues(self, parent, tests: Dict[str, Any]) -> None:
-        """Display issues using enhanced issue cards."""
         # Hostname Resolution Issue
         hostname_test = tests.get('hostname', {})
         if not hostname_test.get('passed', True):
-            EnhancedIssueCard(
+            self._show_issue_card(
                 parent,
                 title="Hostname Not Broadcasting",
                 severity="medium",
@@ -1657,14 +2166,15 @@ class DiagnosticsFrame(ctk.CTkFrame):
                     }
                 ],
                 affected_functionality=["Network discovery tools", "Hostname-based addressing"],
-                firmware_relevant=True
-            ).pack(fill="x", pady=(0, 12))
+                firmware_relevant=True,
+                collapsed=True
+            )
 
         # Command Protocol Issue
         cmd_test = tests.get('commands', {})
         if not cmd_test.get('passed', True):
             if cmd_test.get('error') == 'No command port found':
-                EnhancedIssueCard(
+                self._show_issue_card(
                     parent,
                     title="No Control Port Found",
                     severity="critical",
@@ -1711,10 +2221,10 @@ class DiagnosticsFrame(ctk.CTkFrame):
                         "Multi-room audio synchronization"
                     ],
                     firmware_relevant=True
-                ).pack(fill="x", pady=(0, 12))
+                )
 
             elif cmd_test.get('error_rate', 0) > 0:
-                EnhancedIssueCard(
+                self._show_issue_card(
                     parent,
                     title="Command Rate Limiting Detected",
                     severity="medium",
@@ -1738,13 +2248,14 @@ class DiagnosticsFrame(ctk.CTkFrame):
                         }
                     ],
                     affected_functionality=["Rapid command sequences", "Macro execution"],
-                    firmware_relevant=True
-                ).pack(fill="x", pady=(0, 12))
+                    firmware_relevant=True,
+                    collapsed=True
+                )
 
         # Network Reachability Issue
         reach_test = tests.get('reachability', {})
         if not reach_test.get('passed', True):
-            EnhancedIssueCard(
+            self._show_issue_card(
                 parent,
                 title="Device Not Reachable",
                 severity="critical",
@@ -1777,12 +2288,12 @@ class DiagnosticsFrame(ctk.CTkFrame):
                 ],
                 affected_functionality=["All network communication", "Web interface access"],
                 firmware_relevant=False
-            ).pack(fill="x", pady=(0, 12))
+            )
 
         # HTTP/Web Interface Issue
         http_test = tests.get('http', {})
         if not http_test.get('passed', True) and reach_test.get('passed', False):
-            EnhancedIssueCard(
+            self._show_issue_card(
                 parent,
                 title="Web Interface Not Accessible",
                 severity="high",
@@ -1806,13 +2317,14 @@ class DiagnosticsFrame(ctk.CTkFrame):
                     }
                 ],
                 affected_functionality=["Device configuration", "Firmware updates"],
-                firmware_relevant=True
-            ).pack(fill="x", pady=(0, 12))
+                firmware_relevant=True,
+                collapsed=True
+            )
 
         # DNS Issue
         dns_test = tests.get('dns', {})
         if not dns_test.get('passed', True):
-            EnhancedIssueCard(
+            self._show_issue_card(
                 parent,
                 title="DNS Configuration Issue",
                 severity="low",
@@ -1833,8 +2345,23 @@ class DiagnosticsFrame(ctk.CTkFrame):
                     }
                 ],
                 affected_functionality=["Hostname resolution"],
-                firmware_relevant=False
-            ).pack(fill="x", pady=(0, 12))
+                firmware_relevant=False,
+                collapsed=True
+            )
+
+        # Cards were all unpacked when the dashboard was released
+        return any(card.winfo_manager() for card, _ in self._issue_cards.values())
+
+    def _show_issue_card(self, parent, **card_kwargs) -> None:
+        """Pack the issue card with these contents, reusing last run's card if it is unchanged."""
+        key = card_kwargs["title"]
+        entry = self._issue_cards.get(key)
+        if entry is not None and entry[1] != card_kwargs:
+            entry[0].destroy()
+            entry = None
+        if entry is None:
+            entry = self._issue_cards[key] = (EnhancedIssueCard(parent, **card_kwargs), card_kwargs)
+        entry[0].pack(fill="x", pady=(0, 12))
 
     def _export_report(self) -> None:
         """Export diagnostic report."""
@@ -1847,178 +2374,82 @@ class DiagnosticsFrame(ctk.CTkFrame):
                 ("HTML files", "*.html"),
                 ("All files", "*.*")
             ],
-            initialfile=f"mk3_diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            initialfile=self._suggested_filename()
         )
 
         if not filename:
             return
 
-        try:
-            if filename.endswith('.html'):
-                self._export_html(filename)
-            else:
-                self._export_json(filename)
-
-            self.progress_label.configure(text=f"✓ Report exported: {Path(filename).name}")
-        except Exception as e:
-            logger.error(f"Export error: {e}")
-            self.progress_label.configure(text=f"Export error: {e}", text_color=COLORS["error"])
-
-    def _export_json(self, filename: str) -> None:
-        """Export as JSON."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self._results, f, indent=2, default=str)
+        # Serializing and writing happen on a worker thread; a new scan replaces
+        # self._results rather than mutating it, so this snapshot stays intact
+        results = self._results
+        export = self._export_html if filename.lower().endswith('.html') else self._export_json
+        self._set_progress(f"Exporting {Path(filename).name}...")
 
-    def _export_html(self, filename: str) -> None:
-        """Export as professional HTML report."""
-        summary = self._results.get('summary', {})
-        total_tests = summary.get('passed', 0) + summary.get('failed', 0) + summary.get('warnings', 0)
-        health_score = ((summary.get('passed', 0) * 100) + (summary.get('warnings', 0) * 50)) / total_tests if total_tests > 0 else 0
+        def run():
+            try:
+                export(filename, results)
+                self._post_ui(self._set_progress, f"✓ Report exported: {Path(filename).name}")
+            except Exception as e:
+                logger.error(f"Export error: {e}")
+                self._post_ui(self._set_progress, f"Export error: {e}", COLORS["error"])
+
+        self._pool.submit(run)
+
+    @staticmethod
+    def _suggested_filename() -> str:
+        """Default report name offered by the save dialog."""
+        return f"mk3_diagnostic_{datetime.now():%Y%m%d_%H%M%S}"
+
+    def _export_json(self, filename: str, results: DiagResults) -> None:
+        """Export as JSON (via orjson when it is installed)."""
+        if orjson is not None:
+            Path(filename).write_bytes(orjson.dumps(
+                results.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+            return
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MK3 Diagnostic Report</title>
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #0a0a0f 0%, #111827 100%);
-            color: #f9fafb;
-            min-height: 100vh;
-            padding: 40px;
-        }}
-        .container {{ max-width: 1000px; margin: 0 auto; }}
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding: 40px;
-            background: #1f2937;
-            border-radius: 16px;
-            border: 1px solid #374151;
-        }}
-        .header h1 {{ font-size: 32px; margin-bottom: 8px; }}
-        .header .subtitle {{ color: #9ca3af; font-size: 14px; }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 16px;
-            margin-bottom: 32px;
-        }}
-        .stat-card {{
-            background: #1f2937;
-            border-radius: 12px;
-            padding: 24px;
-            text-align: center;
-            border: 1px solid #374151;
-        }}
-        .stat-value {{ font-size: 36px; font-weight: bold; }}
-        .stat-label {{ color: #9ca3af; font-size: 12px; margin-top: 8px; }}
-        .passed {{ color: #10b981; }}
-        .warning {{ color: #f59e0b; }}
-        .failed {{ color: #ef4444; }}
-        .info {{ color: #3b82f6; }}
-        .section {{
-            background: #1f2937;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 24px;
-            border: 1px solid #374151;
-        }}
-        .section h2 {{
-            font-size: 18px;
-            margin-bottom: 20px;
-            padding-bottom: 12px;
-            border-bottom: 1px solid #374151;
-        }}
-        .test-item {{
-            display: flex;
-            align-items: center;
-            padding: 16px;
-            background: #111827;
-            border-radius: 8px;
-            margin-bottom: 12px;
-        }}
-        .test-status {{
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 16px;
-        }}
-        .test-name {{ font-weight: 600; flex: 1; }}
-        .badge {{
-            padding: 4px 12px;
-            border-radius: 6px;
-            font-size: 12px;
-            font-weight: 600;
-        }}
-        .badge-passed {{ background: #064e3b; color: #10b981; }}
-        .badge-warning {{ background: #451a03; color: #f59e0b; }}
-        .badge-failed {{ background: #450a0a; color: #ef4444; }}
-        .footer {{
-            text-align: center;
-            color: #6b7280;
-            font-size: 12px;
-            margin-top: 40px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔬 MK3 Diagnostic Report</h1>
-            <p class="subtitle">Generated: {self._results.get('timestamp', '')} • Target: {self._results.get('ip_address', '')}</p>
-        </div>
+        # Only needed when orjson is missing, so it is imported here.
+        # Without indent and ASCII escaping, json uses its C encoder
+        import json
 
-        <div class="summary">
-            <div class="stat-card">
-                <div class="stat-value info">{health_score:.0f}%</div>
-                <div class="stat-label">HEALTH SCORE</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value passed">{summary.get('passed', 0)}</div>
-                <div class="stat-label">PASSED</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value warning">{summary.get('warnings', 0)}</div>
-                <div class="stat-label">WARNINGS</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value failed">{summary.get('failed', 0)}</div>
-                <div class="stat-label">FAILED</div>
-            </div>
-        </div>
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(
+                results.to_dict(), f,
+                ensure_ascii=False, separators=(',', ':'), default=str
+            )
 
-        <div class="section">
-            <h2>Test Results</h2>
-"""
+    def _export_html(self, filename: str, results: DiagResults) -> None:
+        """Export as professional HTML report."""
+        summary = results.summary
+        health_score = summary.health_score
+
+        # Collected in a list and written in one go; += on a growing string
+        # copies everything built so far for each test
+        parts = [
+            _HTML_HEAD,
+            _HTML_SUMMARY.format(
+                timestamp=escape(results.timestamp),
+                ip_address=escape(str(results.ip_address)),
+                health_score=health_score,
+                passed=summary.passed,
+                warnings=summary.warnings,
+                failed=summary.failed
+            ),
+        ]
 
-        for test_name, test_data in self._results.get('tests', {}).items():
+        for test_name, test_data in results.tests.items():
             passed = test_data.get('passed', False)
-            status_class = 'passed' if passed else 'failed'
-            badge_class = 'badge-passed' if passed else 'badge-failed'
-            status_text = 'PASSED' if passed else 'FAILED'
-
-            html += f"""
-            <div class="test-item">
-                <div class="test-status" style="background: {'#10b981' if passed else '#ef4444'};"></div>
-                <span class="test-name">{test_data.get('name', test_name)}</span>
-                <span class="badge {badge_class}">{status_text}</span>
-            </div>
-"""
-
-        html += f"""
-        </div>
+            parts.append(_HTML_TEST_ROW.format(
+                color='#10b981' if passed else '#ef4444',
+                name=escape(str(test_data.get('name', test_name))),
+                badge_class='badge-passed' if passed else 'badge-failed',
+                status_text='PASSED' if passed else 'FAILED'
+            ))
 
-        <div class="footer">
-            <p>MK3 Amplifier Network Diagnostic Tool v1.1.0 • Sonance</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        parts.append(_HTML_FOOTER)
 
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+            f.writelines(parts)
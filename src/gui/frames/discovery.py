@@ -6,6 +6,7 @@ from typing import Optional, Callable, List
 
 from ...network import NetworkDiscovery
 from ...utils import get_logger, Config
+from ..fonts import get_font
 
 logger = get_logger(__name__)
 
@@ -28,6 +29,9 @@ class DiscoveryFrame(ctk.CTkFrame):
         self._on_ip_selected = on_ip_selected
         self._discovery = NetworkDiscovery()
         self._is_scanning = False
+        # Device rows below the header row, tracked so clearing them needs no
+        # winfo_children() round-trip
+        self._device_rows: List[ctk.CTkFrame] = []
 
         self._build_ui()
 
@@ -52,14 +56,14 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             controls,
             text="Subnet:",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         ).pack(side="left", padx=(10, 5))
 
         self.subnet_entry = ctk.CTkEntry(
             controls,
             placeholder_text="e.g., 192.168.1.0/24 (leave empty for auto)",
             width=250,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         self.subnet_entry.pack(side="left", padx=5)
 
@@ -68,7 +72,7 @@ class DiscoveryFrame(ctk.CTkFrame):
             controls,
             text="Scan Network",
             command=self._start_scan,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             width=140
         )
         self.scan_btn.pack(side="left", padx=10)
@@ -77,14 +81,14 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             controls,
             text="Quick Scan:",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         ).pack(side="left", padx=(20, 5))
 
         self.quick_ip_entry = ctk.CTkEntry(
             controls,
             placeholder_text="Single IP",
             width=150,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         self.quick_ip_entry.pack(side="left", padx=5)
 
@@ -92,7 +96,7 @@ class DiscoveryFrame(ctk.CTkFrame):
             controls,
             text="Quick Scan",
             command=self._quick_scan,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.quick_scan_btn.pack(side="left", padx=5)
@@ -101,7 +105,7 @@ class DiscoveryFrame(ctk.CTkFrame):
         self.progress_label = ctk.CTkLabel(
             controls,
             text="",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.progress_label.pack(side="right", padx=10)
 
@@ -119,13 +123,13 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Discovered Devices",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(side="left")
 
         self.device_count_label = ctk.CTkLabel(
             header,
             text="0 devices found",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color="gray60"
         )
         self.device_count_label.pack(side="right")
@@ -149,7 +153,7 @@ class DiscoveryFrame(ctk.CTkFrame):
             ctk.CTkLabel(
                 header,
                 text=text,
-                font=ctk.CTkFont(size=12, weight="bold")
+                font=get_font(12, "bold")
             ).grid(row=0, column=i, padx=10, pady=8, sticky="w")
 
     def _start_scan(self) -> None:
@@ -165,8 +169,7 @@ class DiscoveryFrame(ctk.CTkFrame):
         self.scan_btn.configure(text="Cancel Scan")
 
         # Clear previous results
-        for widget in self.results_scroll.winfo_children()[1:]:
-            widget.destroy()
+        self._clear_device_rows()
 
         # Start scan in thread
         thread = threading.Thread(target=self._run_scan, args=(subnet,))
@@ -206,8 +209,7 @@ class DiscoveryFrame(ctk.CTkFrame):
     def _display_results(self, devices: List) -> None:
         """Display scan results."""
         # Clear existing results
-        for widget in self.results_scroll.winfo_children()[1:]:
-            widget.destroy()
+        self._clear_device_rows()
 
         self.device_count_label.configure(text=f"{len(devices)} devices found")
         self.progress_label.configure(text="Scan complete")
@@ -215,6 +217,12 @@ class DiscoveryFrame(ctk.CTkFrame):
         for i, device in enumerate(devices):
             self._add_device_row(i + 1, device)
 
+    def _clear_device_rows(self) -> None:
+        """Remove all device rows, keeping the header row."""
+        for row_frame in self._device_rows:
+            row_frame.destroy()
+        self._device_rows.clear()
+
     def _add_device_row(self, row: int, device) -> None:
         """Add a device row to results."""
         # Determine row color based on MK3 candidate
@@ -222,13 +230,14 @@ class DiscoveryFrame(ctk.CTkFrame):
 
         row_frame = ctk.CTkFrame(self.results_scroll, fg_color=fg_color)
         row_frame.grid(row=row, column=0, sticky="ew", pady=2)
+        self._device_rows.append(row_frame)
         row_frame.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
 
         # IP Address
         ip_label = ctk.CTkLabel(
             row_frame,
             text=device.ip_address,
-            font=ctk.CTkFont(size=13, weight="bold" if device.is_mk3_candidate else "normal")
+            font=get_font(13, "bold" if device.is_mk3_candidate else "normal")
         )
         ip_label.grid(row=0, column=0, padx=10, pady=8, sticky="w")
 
@@ -237,7 +246,7 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             row_frame,
             text=hostname,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         ).grid(row=0, column=1, padx=10, pady=8, sticky="w")
 
         # MAC Address
@@ -245,7 +254,7 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             row_frame,
             text=mac,
-            font=ctk.CTkFont(size=12, family="Consolas")
+            font=get_font(12, family="Consolas")
         ).grid(row=0, column=2, padx=10, pady=8, sticky="w")
 
         # Response Time
@@ -253,7 +262,7 @@ class DiscoveryFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             row_frame,
             text=resp_time,
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         ).grid(row=0, column=3, padx=10, pady=8, sticky="w")
 
         # Actions
@@ -266,7 +275,7 @@ class DiscoveryFrame(ctk.CTkFrame):
             width=70,
             height=28,
             command=lambda ip=device.ip_address: self._select_device(ip),
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         select_btn.pack(side="left", padx=2)
 
@@ -277,7 +286,7 @@ class DiscoveryFrame(ctk.CTkFrame):
             ctk.CTkLabel(
                 actions_frame,
                 text=f"Ports: {ports_text}",
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 text_color="gray60"
             ).pack(side="left", padx=10)
 
@@ -313,8 +322,7 @@ class DiscoveryFrame(ctk.CTkFrame):
     def _display_quick_result(self, device) -> None:
         """Display quick scan result."""
         # Clear and add single result
-        for widget in self.results_scroll.winfo_children()[1:]:
-            widget.destroy()
+        self._clear_device_rows()
 
         if device.response_time_ms is not None:
             self.device_count_label.configure(text="1 device found")
@@ -8,6 +8,7 @@ from ...network import DNSTester, HostnameTester
 from ...utils import get_logger, Config
 from ..components import ResultCard
 from ..components.result_card import ResultStatus
+from ..fonts import get_font
 
 logger = get_logger(__name__)
 
@@ -30,6 +31,8 @@ class DNSHostnameFrame(ctk.CTkFrame):
         self._get_target_ip = get_target_ip
         self._dns_tester = DNSTester()
         self._hostname_tester = HostnameTester()
+        # Holds everything shown in results_scroll, so clearing is one destroy()
+        self._results_root = None
 
         self._build_ui()
 
@@ -53,14 +56,14 @@ class DNSHostnameFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             controls,
             text="Hostname Tests:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=10)
 
         self.socket_btn = ctk.CTkButton(
             controls,
             text="DNS Reverse",
             command=lambda: self._run_hostname_test("socket"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.socket_btn.pack(side="left", padx=5)
@@ -69,7 +72,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             controls,
             text="NetBIOS",
             command=lambda: self._run_hostname_test("netbios"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=90
         )
         self.netbios_btn.pack(side="left", padx=5)
@@ -78,7 +81,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             controls,
             text="mDNS",
             command=lambda: self._run_hostname_test("mdns"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=80
         )
         self.mdns_btn.pack(side="left", padx=5)
@@ -87,7 +90,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             controls,
             text="All Methods",
             command=self._run_all_hostname_tests,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=100
         )
         self.all_hostname_btn.pack(side="left", padx=5)
@@ -96,14 +99,14 @@ class DNSHostnameFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             controls,
             text="DNS Servers:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=(20, 10))
 
         self.dns_servers_btn = ctk.CTkButton(
             controls,
             text="Test Servers",
             command=self._run_dns_server_test,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             width=110
         )
         self.dns_servers_btn.pack(side="left", padx=5)
@@ -113,7 +116,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             controls,
             text="Full Diagnosis",
             command=self._run_full_diagnosis,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color="green",
             hover_color="darkgreen",
             width=130
@@ -124,7 +127,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
         self.progress_label = ctk.CTkLabel(
             controls,
             text="",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.progress_label.pack(side="right", padx=10)
 
@@ -143,9 +146,11 @@ class DNSHostnameFrame(ctk.CTkFrame):
         return ip
 
     def _clear_results(self) -> None:
-        """Clear all results."""
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        """Clear all results by replacing the frame that holds them."""
+        if self._results_root is not None:
+            self._results_root.destroy()
+        self._results_root = ctk.CTkFrame(self.results_scroll, fg_color="transparent")
+        self._results_root.pack(fill="x")
 
     def _run_hostname_test(self, method: str) -> None:
         """Run a single hostname test."""
@@ -166,10 +171,10 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 else:
                     return
 
-                self.after(0, lambda: self._display_hostname_result(result))
+                self.after(0, self._display_hostname_result, result)
             except Exception as e:
                 logger.error(f"Hostname test error: {e}")
-                self.after(0, lambda: self.progress_label.configure(text=f"Error: {e}"))
+                self.after(0, lambda text=f"Error: {e}": self.progress_label.configure(text=text))
 
         threading.Thread(target=run, daemon=True).start()
 
@@ -177,13 +182,13 @@ class DNSHostnameFrame(ctk.CTkFrame):
         """Display a single hostname result."""
         self._clear_results()
 
-        section = ctk.CTkFrame(self.results_scroll)
+        section = ctk.CTkFrame(self._results_root)
         section.pack(fill="x", pady=5)
 
         ctk.CTkLabel(
             section,
             text=f"Hostname Resolution ({result.method})",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=5)
 
         if result.success:
@@ -213,7 +218,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
         def run():
             try:
                 results = self._hostname_tester.resolve_all_methods(ip, "DSP")
-                self.after(0, lambda: self._display_all_hostname_results(results))
+                self.after(0, self._display_all_hostname_results, results)
             except Exception as e:
                 logger.error(f"Hostname test error: {e}")
             finally:
@@ -225,14 +230,14 @@ class DNSHostnameFrame(ctk.CTkFrame):
         """Display all hostname resolution results."""
         self._clear_results()
 
-        section = ctk.CTkFrame(self.results_scroll)
+        section = ctk.CTkFrame(self._results_root)
         section.pack(fill="x", pady=5)
 
         successful = sum(1 for r in results.values() if r.success)
         ctk.CTkLabel(
             section,
             text=f"Hostname Resolution ({successful}/{len(results)} methods succeeded)",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=5)
 
         for method, result in results.items():
@@ -262,7 +267,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 all_servers = list(set(system_servers + self.config.common_dns_servers[:3]))
 
                 results = self._dns_tester.test_multiple_dns_servers(all_servers)
-                self.after(0, lambda: self._display_dns_server_results(results, system_servers))
+                self.after(0, self._display_dns_server_results, results, system_servers)
             except Exception as e:
                 logger.error(f"DNS server test error: {e}")
             finally:
@@ -274,14 +279,14 @@ class DNSHostnameFrame(ctk.CTkFrame):
         """Display DNS server test results."""
         self._clear_results()
 
-        section = ctk.CTkFrame(self.results_scroll)
+        section = ctk.CTkFrame(self._results_root)
         section.pack(fill="x", pady=5)
 
         working = sum(1 for r in results if r.can_resolve)
         ctk.CTkLabel(
             section,
             text=f"DNS Server Tests ({working}/{len(results)} working)",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=5)
 
         for result in results:
@@ -323,7 +328,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 # DNS diagnosis
                 dns_diag = self._dns_tester.full_dns_diagnostic(ip)
 
-                self.after(0, lambda: self._display_full_diagnosis(hostname_diag, dns_diag))
+                self.after(0, self._display_full_diagnosis, hostname_diag, dns_diag)
             except Exception as e:
                 logger.error(f"Diagnosis error: {e}")
             finally:
@@ -336,13 +341,13 @@ class DNSHostnameFrame(ctk.CTkFrame):
         self._clear_results()
 
         # Hostname section
-        section1 = ctk.CTkFrame(self.results_scroll)
+        section1 = ctk.CTkFrame(self._results_root)
         section1.pack(fill="x", pady=5)
 
         ctk.CTkLabel(
             section1,
             text="Hostname Diagnosis",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=5)
 
         for method, data in hostname_diag.get('resolution_results', {}).items():
@@ -364,7 +369,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             ctk.CTkLabel(
                 issues_frame,
                 text="Issues Found:",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=get_font(14, "bold"),
                 text_color="orange"
             ).pack(anchor="w", padx=10, pady=5)
 
@@ -372,7 +377,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 ctk.CTkLabel(
                     issues_frame,
                     text=f"  • {issue}",
-                    font=ctk.CTkFont(size=12),
+                    font=get_font(12),
                     wraplength=600,
                     justify="left"
                 ).pack(anchor="w", padx=15, pady=2)
@@ -384,7 +389,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             ctk.CTkLabel(
                 rec_frame,
                 text="Recommendations:",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=get_font(14, "bold"),
                 text_color="cyan"
             ).pack(anchor="w", padx=10, pady=5)
 
@@ -392,19 +397,19 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 ctk.CTkLabel(
                     rec_frame,
                     text=f"  → {rec}",
-                    font=ctk.CTkFont(size=12),
+                    font=get_font(12),
                     wraplength=600,
                     justify="left"
                 ).pack(anchor="w", padx=15, pady=2)
 
         # DNS section
-        section2 = ctk.CTkFrame(self.results_scroll)
+        section2 = ctk.CTkFrame(self._results_root)
         section2.pack(fill="x", pady=5)
 
         ctk.CTkLabel(
             section2,
             text="DNS Diagnosis",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(anchor="w", padx=10, pady=5)
 
         # Reverse lookup
@@ -441,7 +446,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
             ctk.CTkLabel(
                 issues_frame,
                 text="DNS Issues:",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=get_font(14, "bold"),
                 text_color="orange"
             ).pack(anchor="w", padx=10, pady=5)
 
@@ -449,7 +454,7 @@ class DNSHostnameFrame(ctk.CTkFrame):
                 ctk.CTkLabel(
                     issues_frame,
                     text=f"  • {issue}",
-                    font=ctk.CTkFont(size=12),
+                    font=get_font(12),
                     wraplength=600,
                     justify="left"
                 ).pack(anchor="w", padx=15, pady=2)
@@ -0,0 +1,62 @@
+"""Shared progress-text debouncing for frames that run tests on worker threads."""
+
+from typing import Optional, Tuple
+
+
+class ProgressMixin:
+    """
+    Coalesce worker progress updates into a periodic UI refresh.
+
+    Workers post text with _post_progress (no Tk calls); while any test is
+    running, the latest text is copied into the frame's _progress_var at most
+    once per PROGRESS_INTERVAL_MS. Mix into a Tk widget that defines
+    _progress_var and progress_label, and call _init_progress from __init__.
+    A text_color of None keeps the label's current color.
+    """
+
+    # Worker progress is coalesced and shown at most once per this interval
+    PROGRESS_INTERVAL_MS = 50
+
+    def _init_progress(self) -> None:
+        """Set up the pending text and the timer that shows it."""
+        self._pending_progress: Optional[Tuple[str, Optional[str]]] = None
+        self._progress_job = None
+        self._progress_users = 0
+
+    def _begin_progress(self) -> None:
+        """Start the progress timer for a test (UI thread)."""
+        self._progress_users += 1
+        if self._progress_job is None:
+            self._progress_job = self.after(self.PROGRESS_INTERVAL_MS, self._flush_progress)
+
+    def _end_progress(self) -> None:
+        """Stop the progress timer once no test is running (UI thread)."""
+        self._progress_users = max(0, self._progress_users - 1)
+        if self._progress_users == 0 and self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+
+    def _post_progress(self, text: str, text_color: Optional[str] = None) -> None:
+        """Record the latest progress text (worker thread, no Tk calls)."""
+        self._pending_progress = (text, text_color)
+
+    def _flush_progress(self) -> None:
+        """Show the most recent progress text, then re-arm while tests run."""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            self._show_progress(*pending)
+        if self._progress_users:
+            self._progress_job = self.after(self.PROGRESS_INTERVAL_MS, self._flush_progress)
+        else:
+            self._progress_job = None
+
+    def _set_progress(self, text: str, text_color: Optional[str] = None) -> None:
+        """Show progress text immediately, discarding any stale worker update."""
+        self._pending_progress = None
+        self._show_progress(text, text_color)
+
+    def _show_progress(self, text: str, text_color: Optional[str]) -> None:
+        """Write text (and color, if given) to the progress label (UI thread)."""
+        self._progress_var.set(text)
+        if text_color is not None:
+            self.progress_label.configure(text_color=text_color)
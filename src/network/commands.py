@@ -269,7 +269,8 @@ class CommandTester:
         command: str,
         count: int = 10,
         delay_ms: float = 0,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None
     ) -> BurstTestResult:
         """
         Send multiple commands rapidly to test rate limiting/queueing.
@@ -281,14 +282,12 @@ class CommandTester:
             count: Number of commands to send
             delay_ms: Delay between commands in milliseconds
             progress_callback: Callback(current, total) for progress
+            error_callback: Callback(error) for each error; when given, errors
+                are streamed to it instead of collected in result.errors
 
         Returns:
             BurstTestResult with statistics
         """
-        self.reset_cancel()
-
-        logger.info(f"Burst test: {count} commands, {delay_ms}ms delay")
-
         result = BurstTestResult(
             total_commands=count,
             successful_commands=0,
@@ -301,10 +300,60 @@ class CommandTester:
         if not conn.is_connected:
             result.failed_commands = count
             result.error_rate_percent = 100.0
-            result.errors.append(f"Failed to connect: {conn.last_error}")
+            (error_callback or result.errors.append)(f"Failed to connect: {conn.last_error}")
             return result
 
+        try:
+            return self.burst_test_on(
+                conn, command,
+                count=count,
+                delay_ms=delay_ms,
+                progress_callback=progress_callback,
+                error_callback=error_callback
+            )
+        finally:
+            self.disconnect(conn)
+
+    def burst_test_on(
+        self,
+        conn: CommandConnection,
+        command: str,
+        count: int = 10,
+        delay_ms: float = 0,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None
+    ) -> BurstTestResult:
+        """
+        Run a burst test over an already established connection.
+
+        The connection is left open afterwards. If the device drops it
+        mid-burst, it is re-established in place on the same object.
+
+        Args:
+            conn: Connected CommandConnection
+            command: Command to send repeatedly
+            count: Number of commands to send
+            delay_ms: Delay between commands in milliseconds
+            progress_callback: Callback(current, total) for progress
+            error_callback: Callback(error) for each error; when given, errors
+                are streamed to it instead of collected in result.errors
+
+        Returns:
+            BurstTestResult with statistics
+        """
+        self.reset_cancel()
+
+        logger.info(f"Burst test: {count} commands, {delay_ms}ms delay")
+
+        result = BurstTestResult(
+            total_commands=count,
+            successful_commands=0,
+            failed_commands=0,
+            delay_between_ms=delay_ms
+        )
+
         response_times = []
+        report_error = error_callback or result.errors.append
 
         for i in range(count):
             if self._cancel_flag.is_set():
@@ -320,7 +369,7 @@ class CommandTester:
             else:
                 result.failed_commands += 1
                 if cmd_result.error:
-                    result.errors.append(f"Command {i+1}: {cmd_result.error}")
+                    report_error(f"Command {i+1}: {cmd_result.error}")
 
             if progress_callback:
                 progress_callback(i + 1, count)
@@ -333,13 +382,14 @@ class CommandTester:
             if not conn.is_connected:
                 logger.warning("Connection lost, reconnecting...")
                 self.disconnect(conn)
-                conn = self.connect(ip_address, port)
+                new_conn = self.connect(conn.ip_address, conn.port)
+                conn.sock = new_conn.sock
+                conn.is_connected = new_conn.is_connected
+                conn.last_error = new_conn.last_error
                 if not conn.is_connected:
-                    result.errors.append("Reconnection failed")
+                    report_error("Reconnection failed")
                     break
 
-        self.disconnect(conn)
-
         # Calculate statistics
         if response_times:
             result.min_response_ms = min(response_times)
@@ -365,7 +415,8 @@ class CommandTester:
         delays_to_test: List[float] = None,
         commands_per_test: int = 10,
         max_acceptable_error_rate: float = 5.0,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        early_stop: bool = True
     ) -> Dict:
         """
         Find the minimum delay needed for reliable command execution.
@@ -378,12 +429,16 @@ class CommandTester:
             commands_per_test: Commands to send per delay test
             max_acceptable_error_rate: Maximum acceptable error rate %
             progress_callback: Callback(phase, current, total)
+            early_stop: Test delays in ascending order and stop at the first
+                acceptable one, since any longer delay can't be a better pick
 
         Returns:
             Dict with test results and recommendation
         """
         if delays_to_test is None:
             delays_to_test = [0, 10, 25, 50, 100, 250, 500]
+        if early_stop:
+            delays_to_test = sorted(delays_to_test)
 
         logger.info(f"Finding optimal delay: testing {delays_to_test}")
 
@@ -418,6 +473,8 @@ class CommandTester:
             if test_result.error_rate_percent <= max_acceptable_error_rate:
                 if results['recommended_delay_ms'] is None:
                     results['recommended_delay_ms'] = delay
+                if early_stop:
+                    break
 
         # Check if all tests passed at zero delay
         if results['tests'] and results['tests'][0]['error_rate_percent'] <= max_acceptable_error_rate:
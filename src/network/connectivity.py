@@ -7,6 +7,7 @@ from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from ..utils import get_logger
@@ -85,6 +86,9 @@ class ConnectivityTester:
         41795: "Crestron-CTP",
     }
 
+    # Connections kept per host by the shared HTTP session
+    HTTP_POOL_SIZE = 8
+
     def __init__(
         self,
         timeout: float = 5.0,
@@ -94,6 +98,13 @@ class ConnectivityTester:
         self.http_timeout = http_timeout
         self._cancel_flag = threading.Event()
 
+        # One session for all HTTP checks, so requests to the same device
+        # reuse keep-alive connections instead of reconnecting each time
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.HTTP_POOL_SIZE)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
     def cancel(self) -> None:
         """Cancel ongoing tests."""
         self._cancel_flag.set()
@@ -208,7 +219,8 @@ class ConnectivityTester:
         ip: str,
         ports: List[int],
         progress_callback: Optional[Callable[[int, int, int], None]] = None,
-        max_workers: int = 20
+        max_workers: int = 16,
+        timeout: Optional[float] = None
     ) -> List[PortScanResult]:
         """
         Scan multiple ports on an IP address.
@@ -217,7 +229,10 @@ class ConnectivityTester:
             ip: IP address to scan
             ports: List of ports to scan
             progress_callback: Callback(current, total, port) for progress
-            max_workers: Maximum concurrent scans
+            max_workers: Maximum concurrent scans. Kept bounded so embedded
+                devices aren't hit with a burst of SYNs they may drop.
+            timeout: Connect timeout per port (defaults to the tester timeout).
+                Since ports are probed concurrently, this bounds the whole scan.
 
         Returns:
             List of PortScanResult for each port
@@ -227,6 +242,7 @@ class ConnectivityTester:
 
         results: List[PortScanResult] = []
         completed = 0
+        connect_timeout = timeout or self.timeout
 
         def scan_port(port: int) -> PortScanResult:
             if self._cancel_flag.is_set():
@@ -238,7 +254,7 @@ class ConnectivityTester:
 
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(self.timeout)
+                sock.settimeout(connect_timeout)
                 result = sock.connect_ex((ip, port))
 
                 if result == 0:
@@ -266,7 +282,7 @@ class ConnectivityTester:
                 response_time_ms=elapsed if is_open else None
             )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
             futures = {executor.submit(scan_port, port): port for port in ports}
 
             for future in as_completed(futures):
@@ -325,7 +341,7 @@ class ConnectivityTester:
 
         try:
             start = time.perf_counter()
-            response = requests.get(
+            response = self._http.get(
                 url,
                 timeout=self.http_timeout,
                 verify=False,  # Allow self-signed certs
@@ -365,33 +381,51 @@ class ConnectivityTester:
         ip: str,
         endpoints: List[str],
         port: int = 80,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 8
     ) -> List[HTTPEndpointResult]:
         """
         Test multiple HTTP endpoints.
 
+        Endpoints are fetched concurrently over the tester's session, so the
+        run takes about as long as the slowest endpoint and connections to
+        the device are reused between requests.
+
         Args:
             ip: IP address
             endpoints: List of endpoint paths
             port: Port number
             progress_callback: Callback(current, total, endpoint) for progress
+            max_workers: Maximum concurrent requests
 
         Returns:
-            List of HTTPEndpointResult
+            List of HTTPEndpointResult, in the order of endpoints
         """
-        results = []
+        results: Dict[str, HTTPEndpointResult] = {}
+        completed = 0
+        workers = max(1, min(max_workers, len(endpoints)))
 
-        for i, endpoint in enumerate(endpoints):
+        def fetch(endpoint: str) -> Optional[HTTPEndpointResult]:
             if self._cancel_flag.is_set():
-                break
+                return None
+            return self.test_http_endpoint(ip, endpoint, port)
 
-            result = self.test_http_endpoint(ip, endpoint, port)
-            results.append(result)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, e): e for e in endpoints}
 
-            if progress_callback:
-                progress_callback(i + 1, len(endpoints), endpoint)
+            for future in as_completed(futures):
+                endpoint = futures[future]
+                result = future.result()
+                if result is None:
+                    continue
 
-        return results
+                results[endpoint] = result
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, len(endpoints), endpoint)
+
+        return [results[e] for e in endpoints if e in results]
 
     def test_tcp_connection(
         self,
@@ -430,7 +464,8 @@ class ConnectivityTester:
         ip: str,
         ports: List[int],
         http_endpoints: List[str],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        max_workers: int = 16
     ) -> ConnectivityReport:
         """
         Run a full connectivity test suite.
@@ -440,6 +475,7 @@ class ConnectivityTester:
             ports: Ports to scan
             http_endpoints: HTTP endpoints to test
             progress_callback: Callback(phase, current, total)
+            max_workers: Maximum concurrent port scans (see scan_ports)
 
         Returns:
             ConnectivityReport with all results
@@ -468,7 +504,8 @@ class ConnectivityTester:
 
         report.open_ports = self.scan_ports(
             ip, ports,
-            progress_callback=lambda c, t, p: progress_callback("ports", c, t) if progress_callback else None
+            progress_callback=lambda c, t, p: progress_callback("ports", c, t) if progress_callback else None,
+            max_workers=max_workers
         )
 
         # Phase 3: HTTP endpoints
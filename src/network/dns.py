@@ -4,6 +4,7 @@ import socket
 import time
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import dns.resolver
 import dns.reversename
 import dns.exception
@@ -228,20 +229,19 @@ class DNSTester:
         test_domain: str = "google.com"
     ) -> List[DNSServerTest]:
         """
-        Test multiple DNS servers.
+        Test multiple DNS servers concurrently.
 
         Args:
             servers: List of DNS server IPs
             test_domain: Domain to use for testing
 
         Returns:
-            List of DNSServerTest results
+            List of DNSServerTest results, in the order of servers
         """
-        results = []
-        for server in servers:
-            result = self.test_dns_server(server, test_domain)
-            results.append(result)
-        return results
+        if not servers:
+            return []
+        with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+            return list(executor.map(lambda server: self.test_dns_server(server, test_domain), servers))
 
     def get_system_dns_servers(self) -> List[str]:
         """Get the system's configured DNS servers."""
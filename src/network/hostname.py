@@ -6,6 +6,7 @@ import time
 import threading
 from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils import get_logger
 
@@ -352,16 +353,16 @@ class HostnameTester:
         """
         logger.info(f"Resolving hostname for {ip_address} using all methods")
 
-        results = {}
-
-        # Socket/DNS resolution
-        results['socket'] = self.resolve_via_socket(ip_address)
-
-        # NetBIOS resolution
-        results['netbios'] = self.resolve_via_netbios(ip_address)
-
-        # mDNS resolution
-        results['mdns'] = self.resolve_via_mdns(ip_address)
+        # Each method spends its time blocked in the resolver or on a socket
+        # (which releases the GIL), so run them side by side
+        methods = {
+            'socket': self.resolve_via_socket,    # Socket/DNS resolution
+            'netbios': self.resolve_via_netbios,  # NetBIOS resolution
+            'mdns': self.resolve_via_mdns,        # mDNS resolution
+        }
+        with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+            futures = {name: executor.submit(method, ip_address) for name, method in methods.items()}
+            results = {name: future.result() for name, future in futures.items()}
 
         # Log summary
         successful = [m for m, r in results.items() if r.success]
@@ -16,6 +16,7 @@ class Config:
     ping_timeout: float = 2.0
     port_scan_timeout: float = 1.0
     http_timeout: float = 5.0
+    port_scan_concurrency: int = 16  # max simultaneous connects during a port scan
 
     # Common ports to scan on MK3 amplifiers
     common_ports: List[int] = field(default_factory=lambda: [
@@ -95,6 +96,7 @@ class Config:
     # Logging
     log_level: str = "DEBUG"
     max_log_entries: int = 10000
+    max_log_lines: int = 5000  # Lines kept in on-screen command logs
 
     # Last used values (persisted)
     last_ip_address: str = ""